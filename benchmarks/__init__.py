@@ -0,0 +1 @@
+"""Benchmarks for the VoorVoet website content pipeline."""
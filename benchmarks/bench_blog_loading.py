@@ -0,0 +1,56 @@
+"""
+Benchmark serial versus process-pool blog loading on a synthetic corpus.
+
+Usage::
+
+    uv run python -m benchmarks.bench_blog_loading --stories 1000
+"""
+
+import argparse
+from pathlib import Path
+import tempfile
+import time
+
+from voorvoet_website.models import BlogPostDict
+from voorvoet_website.services import blog_service
+
+from .corpus import generate_corpus
+
+
+def _timed_load(
+    file_paths: list[Path], parallel: bool
+) -> tuple[float, list[BlogPostDict]]:
+    """Load all files without the disk cache and return (seconds, posts)."""
+    start = time.perf_counter()
+    posts = blog_service.load_blog_posts(file_paths, parallel=parallel, use_cache=False)
+    return time.perf_counter() - start, posts
+
+
+def main() -> None:
+    """Run the benchmark and print the timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--stories",
+        type=int,
+        default=1000,
+        help="number of stories; each is written in nl, en and de",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_paths = generate_corpus(Path(tmp_dir), args.stories)
+
+        serial_seconds, serial_posts = _timed_load(file_paths, parallel=False)
+        parallel_seconds, parallel_posts = _timed_load(file_paths, parallel=True)
+
+    if serial_posts != parallel_posts:
+        raise SystemExit("Parallel loading returned different posts than serial")
+
+    print(f"Posts:    {len(file_paths)}")
+    print(f"Serial:   {serial_seconds:.2f}s")
+    print(f"Parallel: {parallel_seconds:.2f}s")
+    print(f"Speedup:  {serial_seconds / parallel_seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
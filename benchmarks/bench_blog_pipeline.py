@@ -0,0 +1,262 @@
+"""
+Time and memory-profile each stage of the blog pipeline on synthetic corpora.
+
+Every corpus is generated in a temporary directory (posts in nl, en and de,
+with image stubs and buttons). Each stage runs twice: once for wall-clock
+time and once under tracemalloc for memory, as tracing slows Python code
+down considerably. Results are written as JSON so runs on different commits
+can be compared.
+
+Usage::
+
+    uv run python -m benchmarks.bench_blog_pipeline --posts 100 1000 10000 \\
+        --output bench.json
+"""
+
+import argparse
+from datetime import datetime, timezone
+import gc
+import json
+from pathlib import Path
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, TypeVar
+
+from voorvoet_website.models.blog_post import parse_datetime
+from voorvoet_website.services import asset_index, blog_service
+from voorvoet_website.services.content_parser import parse_blog_content
+from voorvoet_website.services.frontmatter_parser import parse_frontmatter
+from voorvoet_website.translations import (
+    ROUTE_MAPPINGS,
+    _blog_hreflang_cache,
+    get_blog_post_meta_tags,
+)
+
+from .corpus import LANGUAGES, generate_corpus
+
+T = TypeVar("T")
+
+DEFAULT_POST_COUNTS = [100, 1000, 10000]
+
+
+def _git_commit() -> str | None:
+    """Get the short hash of the checked out commit, if available."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+class StageRecorder:
+    """Run pipeline stages and record their duration or memory use."""
+
+    def __init__(self, trace_memory: bool) -> None:
+        self.trace_memory = trace_memory
+        self.results: dict[str, dict[str, float]] = {}
+
+    def run(self, name: str, stage: Callable[[], T]) -> T:
+        """Run one stage and store its measurements under ``name``."""
+        gc.collect()
+        if self.trace_memory:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        value = stage()
+        seconds = time.perf_counter() - start
+
+        if self.trace_memory:
+            retained, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.results[name] = {"retained_bytes": retained, "peak_bytes": peak}
+        else:
+            self.results[name] = {"seconds": seconds}
+
+        return value
+
+
+def run_pipeline(file_paths: list[Path], trace_memory: bool) -> dict[str, Any]:
+    """
+    Run the blog pipeline stage by stage over a corpus.
+
+    Parameters
+    ----------
+    file_paths : list[Path]
+        Markdown files of the corpus
+    trace_memory : bool
+        Record tracemalloc memory instead of wall-clock time
+
+    Returns
+    -------
+    dict[str, Any]
+        Measurements per stage name
+    """
+    recorder = StageRecorder(trace_memory)
+    names = [file_path.stem.rsplit(".", 1) for file_path in file_paths]
+
+    sources = recorder.run(
+        "read_files",
+        lambda: [file_path.read_text(encoding="utf-8") for file_path in file_paths],
+    )
+    parsed = recorder.run(
+        "frontmatter_parse", lambda: [parse_frontmatter(source) for source in sources]
+    )
+    metadata = [meta for meta, _ in parsed]
+
+    recorder.run("asset_index", lambda: asset_index.load_asset_index(force_reload=True))
+    recorder.run(
+        "parse_blog_content",
+        lambda: [
+            parse_blog_content(content, filename)
+            for (_, content), (filename, _) in zip(parsed, names)
+        ],
+    )
+    recorder.run(
+        "thumbnail_resolution",
+        lambda: [
+            blog_service._build_thumbnail_paths(
+                blog_service._resolve_thumbnail_path(
+                    filename, meta.get("thumbnail", "thumbnail.jpg")
+                )
+            )
+            for meta, (filename, _) in zip(metadata, names)
+        ],
+    )
+
+    posts = [
+        {
+            "slug": meta["slug"],
+            "title": meta["title"],
+            "summary": meta["summary"],
+            "story_number": filename.split("_")[0],
+            "language": language,
+            "datetime_iso": parse_datetime(meta["date"]).isoformat(),
+        }
+        for meta, (filename, language) in zip(metadata, names)
+    ]
+
+    def sort_posts() -> dict[str, list[dict[str, str]]]:
+        posts_by_language: dict[str, list[dict[str, str]]] = {
+            language: [] for language in LANGUAGES
+        }
+        for post in posts:
+            posts_by_language[post["language"]].append(post)
+        for language_posts in posts_by_language.values():
+            language_posts.sort(key=lambda p: p["datetime_iso"], reverse=True)
+        return posts_by_language
+
+    posts_by_language = recorder.run("sort", sort_posts)
+    story_index = recorder.run(
+        "story_index",
+        lambda: blog_service.build_story_index(posts_by_language),  # type: ignore[arg-type]
+    )
+
+    _blog_hreflang_cache.clear()
+    recorder.run(
+        "meta_tags",
+        lambda: [
+            get_blog_post_meta_tags(
+                post_title=post["title"],
+                post_summary=post["summary"],
+                language=post["language"],
+                route=f"{ROUTE_MAPPINGS[post['language']]['blog']}/{post['slug']}",
+                story_number=post["story_number"],
+                story_index=story_index,
+            )
+            for post in posts
+        ],
+    )
+
+    return recorder.results
+
+
+def benchmark_corpus(post_count: int, trace_memory: bool) -> dict[str, Any]:
+    """
+    Generate a corpus of about ``post_count`` posts and measure every stage.
+
+    Parameters
+    ----------
+    post_count : int
+        Number of posts, spread evenly over nl, en and de
+    trace_memory : bool
+        Also run a tracemalloc pass
+
+    Returns
+    -------
+    dict[str, Any]
+        Post count and per-stage timings (and memory, if traced)
+    """
+    stories = max(1, round(post_count / len(LANGUAGES)))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        file_paths = generate_corpus(
+            root / "blog_content", stories, assets_dir=root / "assets"
+        )
+        asset_index.set_assets_dir(root / "assets")
+        try:
+            stages = run_pipeline(file_paths, trace_memory=False)
+            if trace_memory:
+                memory = run_pipeline(file_paths, trace_memory=True)
+                for name, measurements in memory.items():
+                    stages[name].update(measurements)
+        finally:
+            asset_index.set_assets_dir(None)
+
+    for measurements in stages.values():
+        measurements["us_per_post"] = measurements["seconds"] * 1e6 / len(file_paths)
+
+    return {"posts": len(file_paths), "stages": stages}
+
+
+def main() -> None:
+    """Run the benchmark suite and write the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--posts",
+        type=int,
+        nargs="+",
+        default=DEFAULT_POST_COUNTS,
+        help="corpus sizes in posts (default: 100 1000 10000)",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip the (slow) tracemalloc pass",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="write the JSON report to this file instead of stdout",
+    )
+    args = parser.parse_args()
+
+    report = {
+        "commit": _git_commit(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "corpora": [
+            benchmark_corpus(post_count, trace_memory=not args.no_memory)
+            for post_count in args.posts
+        ],
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
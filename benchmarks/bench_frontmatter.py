@@ -0,0 +1,74 @@
+"""
+Benchmark the fast-path frontmatter reader against python-frontmatter.
+
+Usage::
+
+    uv run python -m benchmarks.bench_frontmatter --stories 3334
+"""
+
+import argparse
+from pathlib import Path
+import tempfile
+import time
+from typing import Callable
+
+import frontmatter
+
+from voorvoet_website.services.frontmatter_parser import parse_frontmatter
+
+from .corpus import generate_corpus
+
+Parsed = tuple[dict[str, str], str]
+
+
+def _parse_with_yaml(source: str) -> Parsed:
+    """Parse the way blog_service did before the fast path."""
+    metadata, content = frontmatter.parse(source)
+    return {str(key): str(value) for key, value in metadata.items()}, content
+
+
+def _best_time(
+    parse: Callable[[str], Parsed], sources: list[str], repeat: int
+) -> tuple[float, list[Parsed]]:
+    """Parse all sources ``repeat`` times and return the fastest run."""
+    best = float("inf")
+    results: list[Parsed] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [parse(source) for source in sources]
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+
+def main() -> None:
+    """Run the benchmark and print the timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--stories",
+        type=int,
+        default=3334,
+        help="number of stories; each is written in nl, en and de",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs per parser; the best counts"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_paths = generate_corpus(Path(tmp_dir), args.stories)
+        sources = [file_path.read_text(encoding="utf-8") for file_path in file_paths]
+
+    yaml_seconds, yaml_results = _best_time(_parse_with_yaml, sources, args.repeat)
+    fast_seconds, fast_results = _best_time(parse_frontmatter, sources, args.repeat)
+
+    if fast_results != yaml_results:
+        raise SystemExit("Fast path returned different metadata than YAML parsing")
+
+    print(f"Posts:      {len(sources)}")
+    print(f"YAML:       {yaml_seconds:.3f}s")
+    print(f"Fast path:  {fast_seconds:.3f}s")
+    print(f"Speedup:    {yaml_seconds / fast_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""Synthetic multilingual blog corpus generator for benchmarks."""
+
+from pathlib import Path
+import random
+import struct
+
+
+LANGUAGES = ["nl", "en", "de"]
+
+WORDS = {
+    "nl": (
+        "voet voeten podotherapeut steunzolen hielspoor klachten pijn lopen "
+        "schoenen houding balans behandeling onderzoek advies zolen enkel knie "
+        "rug sport belasting druk eelt likdoorn diabetes wond preventie"
+    ).split(),
+    "en": (
+        "foot feet podiatrist insoles heel spur complaints pain walking shoes "
+        "posture balance treatment examination advice soles ankle knee back "
+        "sport load pressure callus corn diabetes wound prevention"
+    ).split(),
+    "de": (
+        "Fuß Füße Podologe Einlagen Fersensporn Beschwerden Schmerzen Gehen "
+        "Schuhe Haltung Gleichgewicht Behandlung Untersuchung Beratung Sohlen "
+        "Knöchel Knie Rücken Sport Belastung Druck Hornhaut Diabetes Prävention"
+    ).split(),
+}
+
+CATEGORIES = {
+    "nl": ["Behandelingen", "Klachten", "Tips"],
+    "en": ["Treatments", "Complaints", "Tips"],
+    "de": ["Behandlungen", "Beschwerden", "Tipps"],
+}
+
+
+# Header-only image stubs: enough for the asset index and for reading
+# intrinsic dimensions, without shipping real pixel data.
+IMAGE_STUBS = {
+    ".jpg": (
+        b"\xff\xd8\xff\xc0"
+        + struct.pack(">HBHH", 11, 8, 683, 1024)
+        + b"\0" * 6
+        + b"\xff\xd9"
+    ),
+    ".webp": (
+        b"RIFF\0\0\0\0WEBPVP8X"
+        + b"\0" * 8
+        + (1024 - 1).to_bytes(3, "little")
+        + (683 - 1).to_bytes(3, "little")
+    ),
+    ".avif": (
+        struct.pack(">I4s", 16, b"ftyp")
+        + b"avif\0\0\0\0"
+        + struct.pack(">I4sI", 48, b"meta", 0)
+        + struct.pack(">I4s", 36, b"iprp")
+        + struct.pack(">I4s", 28, b"ipco")
+        + struct.pack(">I4sIII", 20, b"ispe", 0, 1024, 683)
+    ),
+}
+
+POST_IMAGES = ["thumbnail", "image_1"]
+
+
+def _sentence(rng: random.Random, words: list[str], length: int) -> str:
+    """Build a capitalised sentence of random words."""
+    text = " ".join(rng.choice(words) for _ in range(length))
+    return text[0].upper() + text[1:] + "."
+
+
+def _paragraph(rng: random.Random, words: list[str]) -> str:
+    """Build a paragraph with inline bold text and a link."""
+    sentences = [_sentence(rng, words, rng.randint(8, 20)) for _ in range(4)]
+    sentences[1] = f"**{sentences[1]}**"
+    sentences[2] = f"[{sentences[2][:-1]}](https://voorvoet.nl)."
+    return " ".join(sentences)
+
+
+def render_post(story_number: int, language: str, seed: int = 0) -> str:
+    """
+    Render a synthetic blog post with frontmatter, images and buttons.
+
+    Parameters
+    ----------
+    story_number : int
+        Story number shared by all language variants of the post
+    language : str
+        Language code ("nl", "en" or "de")
+    seed : int
+        Seed for the random content generator
+
+    Returns
+    -------
+    str
+        Complete markdown source of the post
+    """
+    rng = random.Random(f"{seed}-{story_number}-{language}")
+    words = WORDS[language]
+    title = _sentence(rng, words, 5)[:-1]
+    year = 2020 + story_number % 6
+    month = 1 + story_number % 12
+    day = 1 + story_number % 28
+
+    lines = [
+        "---",
+        f'title: "{title}"',
+        f'slug: "post-{story_number:05d}-{language}"',
+        f'summary: "{_sentence(rng, words, 30)}"',
+        'author: "Kim Bakhuis"',
+        f'date: "{year}-{month:02d}-{day:02d}"',
+        'thumbnail: "thumbnail.jpg"',
+        f'thumbnail_alt: "{_sentence(rng, words, 8)}"',
+        f"tags: [{', '.join(f'"{tag}"' for tag in rng.sample(words, 3))}]",
+        f'category: "{rng.choice(CATEGORIES[language])}"',
+        "---",
+    ]
+
+    for section in range(5):
+        lines.append(f"# {_sentence(rng, words, 6)[:-1]}")
+        lines.append(_paragraph(rng, words))
+        lines.append("")
+        if section == 1:
+            lines.append(f"![{_sentence(rng, words, 10)}](image_{section}.jpg)")
+            lines.append("")
+        if section == 2:
+            for item in range(5):
+                lines.append(f"{item + 1}. {_sentence(rng, words, 12)}")
+            lines.append("")
+        if section == 3:
+            for _ in range(4):
+                lines.append(f"- {_sentence(rng, words, 10)}")
+            lines.append("")
+
+    lines.append("!button[Maak direct een afspraak](https://voorvoet.nl)")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def write_post_images(assets_dir: Path, filename: str) -> None:
+    """
+    Write the thumbnail and article image of a post in JPG, WebP and AVIF.
+
+    Parameters
+    ----------
+    assets_dir : Path
+        Assets root; files go to ``images/page_blog/<filename>/``
+    filename : str
+        Post filename without language and extension
+    """
+    image_dir = assets_dir / "images" / "page_blog" / filename
+    image_dir.mkdir(parents=True, exist_ok=True)
+    for name in POST_IMAGES:
+        for extension, data in IMAGE_STUBS.items():
+            (image_dir / f"{name}{extension}").write_bytes(data)
+
+
+def generate_corpus(
+    target_dir: Path,
+    stories: int,
+    languages: list[str] | None = None,
+    assets_dir: Path | None = None,
+) -> list[Path]:
+    """
+    Write a synthetic corpus of ``stories`` posts per language to disk.
+
+    Parameters
+    ----------
+    target_dir : Path
+        Directory to write the ``*.{lang}.md`` files to
+    stories : int
+        Number of stories; each story is written once per language
+    languages : list[str] | None
+        Languages to generate (default: nl, en and de)
+    assets_dir : Path | None
+        If given, also write image stubs for every story below this assets
+        root (see write_post_images)
+
+    Returns
+    -------
+    list[Path]
+        Paths of all generated files
+    """
+    target_dir.mkdir(parents=True, exist_ok=True)
+    paths: list[Path] = []
+
+    for story_number in range(1, stories + 1):
+        filename = f"{story_number:05d}_synthetic_post"
+        if assets_dir is not None:
+            write_post_images(assets_dir, filename)
+        for language in languages or LANGUAGES:
+            path = target_dir / f"{filename}.{language}.md"
+            path.write_text(render_post(story_number, language), encoding="utf-8")
+            paths.append(path)
+
+    return paths
@@ -1,11 +1,18 @@
 import reflex as rx
 
+from voorvoet_website.config import config as site_config
+from voorvoet_website.sitemap import DynamicRouteSitemapPlugin
+
 
 config = rx.Config(
     app_name="voorvoet_website",
+    # BLOG_PREVIEW_FILE serves a single blog post instead of the full site.
+    app_module_import=(
+        "voorvoet_website.preview" if site_config.blog_preview_file else None
+    ),
     deploy_url="https://voorvoet.nl",
     plugins=[
-        rx.plugins.SitemapPlugin(),
+        DynamicRouteSitemapPlugin(),
     ],
     show_built_with_reflex=False,
 )
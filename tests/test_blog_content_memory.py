@@ -0,0 +1,70 @@
+"""Memory footprint of the parsed blog content representation."""
+
+import gc
+import json
+from pathlib import Path
+import tracemalloc
+from typing import Callable
+
+import frontmatter
+
+from benchmarks.corpus import generate_corpus
+from voorvoet_website.models.blog_content import content_block_from_dict
+from voorvoet_website.services.content_parser import parse_blog_content
+
+
+CORPUS_POSTS = 1000
+
+
+def _retained_bytes(build: Callable[[], list[object]]) -> tuple[list[object], int]:
+    """Call ``build`` and return its result with the bytes it keeps alive."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, retained
+
+
+def test_content_blocks_use_less_memory_than_dicts(tmp_path: Path) -> None:
+    """
+    Test that typed content blocks keep less memory resident than the
+    equivalent content dicts, measured per 1,000 posts.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    """
+    file_paths = generate_corpus(tmp_path, CORPUS_POSTS, languages=["nl"])
+    posts_as_dicts = []
+    for file_path in file_paths:
+        _, content = frontmatter.parse(file_path.read_text(encoding="utf-8"))
+        blocks = parse_blog_content(content, file_path.stem.rsplit(".", 1)[0])
+        posts_as_dicts.append([block.to_dict() for block in blocks])
+
+    # Rebuild both representations from JSON while tracing, so each one owns
+    # freshly allocated strings and nothing is shared between them.
+    payload = json.dumps(posts_as_dicts)
+
+    def load_dicts() -> list[object]:
+        return json.loads(payload)
+
+    def load_blocks() -> list[object]:
+        return [
+            tuple(content_block_from_dict(data) for data in post)
+            for post in json.loads(payload)
+        ]
+
+    dicts, dicts_bytes = _retained_bytes(load_dicts)
+    blocks, blocks_bytes = _retained_bytes(load_blocks)
+
+    assert dicts == posts_as_dicts
+    assert len(blocks) == CORPUS_POSTS
+    assert blocks_bytes < dicts_bytes * 0.8, (
+        f"Content of {CORPUS_POSTS} posts: dicts {dicts_bytes / 1e6:.2f} MB, "
+        f"blocks {blocks_bytes / 1e6:.2f} MB"
+    )
@@ -0,0 +1,86 @@
+"""Tests for the server rendered head of dynamic blog post routes."""
+
+from pathlib import Path
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from voorvoet_website.api import blog
+
+
+PAGE_SHELL = (
+    "<!DOCTYPE html><html><head><title>VoorVoet</title></head>"
+    '<body><div id="root"></div></body></html>'
+)
+
+
+@pytest.fixture
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    """
+    Serve the blog post route with a stand-in for the compiled page shell.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture.
+
+    Returns
+    -------
+    TestClient
+        Client of an app serving only the blog post route.
+    """
+    shell_path = tmp_path / "__spa-fallback.html"
+    shell_path.write_text(PAGE_SHELL, encoding="utf-8")
+    monkeypatch.setattr(blog, "_get_page_shell_path", lambda: shell_path)
+    monkeypatch.setattr(blog, "_page_shell", None)
+
+    app = Starlette(routes=[Route("/{language}/blog/{slug}", blog.blog_post_page)])
+    return TestClient(app)
+
+
+def test_post_head_rendered_into_page_shell(client: TestClient) -> None:
+    """
+    Test that a known post is served with its title, meta tags, links and
+    structured data in the head, and the shell's own title replaced.
+
+    Parameters
+    ----------
+    client : TestClient
+        Client of the blog post route.
+    """
+    response = client.get("/nl/blog/podotherapeut-of-podoloog")
+
+    assert response.status_code == 200
+    head, body = response.text.split("</head>")
+    assert head.count("<title>") == 1
+    assert "<title>Podotherapeut of podoloog? - VoorVoet Blog</title>" in head
+    assert '<meta name="description" content="Benieuwd naar het verschil' in head
+    assert '<meta property="og:type" content="article"/>' in head
+    assert (
+        '<link rel="canonical" href="https://voorvoet.nl/nl/blog/'
+        'podotherapeut-of-podoloog"/>'
+    ) in head
+    assert '<link rel="alternate" hreflang="x-default"' in head
+    assert head.count('<script type="application/ld+json">') == 2
+    assert body == '<body><div id="root"></div></body></html>'
+
+
+def test_unknown_post_served_as_not_found(client: TestClient) -> None:
+    """
+    Test that unknown posts and languages get the plain page with 404.
+
+    Parameters
+    ----------
+    client : TestClient
+        Client of the blog post route.
+    """
+    unknown_post = client.get("/nl/blog/bestaat-niet")
+    unknown_language = client.get("/fr/blog/podotherapeut-of-podoloog")
+
+    assert unknown_post.status_code == 404
+    assert unknown_post.text == PAGE_SHELL
+    assert unknown_language.status_code == 404
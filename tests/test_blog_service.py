@@ -0,0 +1,249 @@
+"""Tests for loading and caching blog posts."""
+
+from pathlib import Path
+import os
+import struct
+
+import pytest
+
+from voorvoet_website.services import blog_service
+from voorvoet_website.services.asset_index import (
+    invalidate_asset_index,
+    set_assets_dir,
+)
+
+
+SAMPLE_POST = """---
+title: "Hielspoor"
+slug: "hielspoor"
+summary: "Alles over hielspoor."
+date: "2024-03-01"
+category: "Klachten"
+---
+# Wat is hielspoor?
+Hielspoor is een **pijnlijke** aandoening.
+
+- Rust
+- Steunzolen
+"""
+
+
+@pytest.fixture
+def blog_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """
+    Redirect the on-disk blog cache to a temporary directory.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture.
+
+    Returns
+    -------
+    Path
+        The temporary cache directory.
+    """
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(blog_service, "_get_cache_dir", lambda: cache_dir)
+    return cache_dir
+
+
+def test_cached_post_skips_parsing(
+    tmp_path: Path, blog_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that an unchanged post is served from the cache without parsing.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    blog_cache_dir : Path
+        Temporary cache directory.
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture.
+    """
+    file_path = tmp_path / "901_hielspoor.nl.md"
+    file_path.write_text(SAMPLE_POST, encoding="utf-8")
+
+    first = blog_service.load_blog_post(file_path, use_cache=True)
+    assert first is not None
+    assert (blog_cache_dir / "901_hielspoor.nl.json").exists()
+
+    def fail_parse(*args: object, **kwargs: object) -> None:
+        raise AssertionError("post should have been served from the cache")
+
+    monkeypatch.setattr(blog_service, "parse_blog_content", fail_parse)
+    second = blog_service.load_blog_post(file_path, use_cache=True)
+
+    assert second == first
+
+
+def test_cache_invalidated_on_content_change(
+    tmp_path: Path, blog_cache_dir: Path
+) -> None:
+    """
+    Test that editing a post invalidates its cache entry.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    blog_cache_dir : Path
+        Temporary cache directory.
+    """
+    file_path = tmp_path / "901_hielspoor.nl.md"
+    file_path.write_text(SAMPLE_POST, encoding="utf-8")
+    blog_service.load_blog_post(file_path, use_cache=True)
+
+    file_path.write_text(
+        SAMPLE_POST.replace('title: "Hielspoor"', 'title: "Hielspoor en steunzolen"'),
+        encoding="utf-8",
+    )
+    post = blog_service.load_blog_post(file_path, use_cache=True)
+
+    assert post is not None
+    assert post["title"] == "Hielspoor en steunzolen"
+
+
+def _png(width: int, height: int) -> bytes:
+    """Build the header of a PNG image of the given size."""
+    return b"\x89PNG\r\n\x1a\n" + struct.pack(">I4sII", 13, b"IHDR", width, height)
+
+
+def test_cache_invalidated_when_shared_image_is_replaced(
+    tmp_path: Path, blog_cache_dir: Path
+) -> None:
+    """
+    Test that replacing an image outside the post's own image directory
+    invalidates the cached post, whose image dimensions would be stale.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    blog_cache_dir : Path
+        Temporary cache directory.
+    """
+    image_path = tmp_path / "assets" / "images" / "shared" / "voet.png"
+    image_path.parent.mkdir(parents=True)
+    image_path.write_bytes(_png(800, 600))
+    file_path = tmp_path / "901_hielspoor.nl.md"
+    file_path.write_text(
+        SAMPLE_POST + "\n![Voet](/images/shared/voet.png)\n", encoding="utf-8"
+    )
+
+    set_assets_dir(tmp_path / "assets")
+    try:
+        first = blog_service.load_blog_post(file_path, use_cache=True)
+
+        image_path.write_bytes(_png(1200, 900))
+        mtime = image_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(image_path, ns=(mtime, mtime))
+        invalidate_asset_index()
+        second = blog_service.load_blog_post(file_path, use_cache=True)
+    finally:
+        set_assets_dir(None)
+
+    assert first is not None and second is not None
+    first_image, second_image = (
+        first["content_objects"][-1],
+        second["content_objects"][-1],
+    )
+    assert (first_image.width, first_image.height) == (800, 600)
+    assert (second_image.width, second_image.height) == (1200, 900)
+
+
+def test_post_lookup_by_slug_follows_reloads(
+    tmp_path: Path, blog_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that posts are found by slug, also after a post file changed.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    blog_cache_dir : Path
+        Temporary cache directory.
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(blog_service, "_posts_cache", {})
+    monkeypatch.setattr(blog_service, "_listings_cache", {})
+    monkeypatch.setattr(blog_service, "_slug_index", {})
+    monkeypatch.setattr(blog_service, "_get_blog_content_dir", lambda: tmp_path)
+    file_path = tmp_path / "901_hielspoor.nl.md"
+    file_path.write_text(SAMPLE_POST, encoding="utf-8")
+
+    post = blog_service.get_post_by_slug("nl", "hielspoor")
+
+    assert post is not None
+    assert post["title"] == "Hielspoor"
+    assert blog_service.get_post_by_slug("nl", "onbekend") is None
+    assert blog_service.get_post_by_slug("en", "hielspoor") is None
+
+    file_path.write_text(
+        SAMPLE_POST.replace('slug: "hielspoor"', 'slug: "hielspijn"'),
+        encoding="utf-8",
+    )
+    blog_service.reload_post_file(file_path)
+
+    assert blog_service.get_post_by_slug("nl", "hielspoor") is None
+    assert blog_service.get_post_by_slug("nl", "hielspijn") is not None
+
+
+def test_category_index_groups_posts_and_links_languages(
+    tmp_path: Path, blog_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that posts are grouped by category, newest first, and that the
+    categories of the language variants of a post are linked.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    blog_cache_dir : Path
+        Temporary cache directory.
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(blog_service, "_posts_cache", {})
+    monkeypatch.setattr(blog_service, "_listings_cache", {})
+    monkeypatch.setattr(blog_service, "_slug_index", {})
+    monkeypatch.setattr(blog_service, "_category_index", None)
+    monkeypatch.setattr(blog_service, "_get_blog_content_dir", lambda: tmp_path)
+    (tmp_path / "901_hielspoor.nl.md").write_text(SAMPLE_POST, encoding="utf-8")
+    (tmp_path / "902_hielpijn.nl.md").write_text(
+        SAMPLE_POST.replace("hielspoor", "hielpijn").replace("2024-03", "2024-05"),
+        encoding="utf-8",
+    )
+    (tmp_path / "903_zolen.nl.md").write_text(
+        SAMPLE_POST.replace("hielspoor", "zolen").replace("Klachten", ""),
+        encoding="utf-8",
+    )
+    (tmp_path / "901_fersensporn.de.md").write_text(
+        SAMPLE_POST.replace("hielspoor", "fersensporn").replace(
+            "Klachten", "Fußbeschwerden"
+        ),
+        encoding="utf-8",
+    )
+
+    categories = blog_service.get_category_index("nl")
+
+    assert list(categories) == ["klachten"]
+    assert [listing["slug"] for listing in categories["klachten"]["listings"]] == [
+        "hielpijn",
+        "hielspoor",
+    ]
+    assert categories["klachten"]["alternates"] == {
+        "nl": "klachten",
+        "de": "fussbeschwerden",
+    }
+    assert blog_service.get_category_index("de")["fussbeschwerden"]["name"] == (
+        "Fußbeschwerden"
+    )
+    assert blog_service.get_category_index("en") == {}
@@ -0,0 +1,128 @@
+"""Tests for reloading single blog posts on file changes."""
+
+from pathlib import Path
+
+import pytest
+
+from voorvoet_website.services import blog_service, blog_watcher
+
+
+POST_TEMPLATE = """---
+title: "{title}"
+slug: "{slug}"
+summary: "Samenvatting."
+date: "{date}"
+---
+Tekst over voeten.
+"""
+
+
+@pytest.fixture
+def content_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """
+    Point the blog service and watcher at a temporary content directory.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture.
+
+    Returns
+    -------
+    Path
+        The temporary content directory, holding one Dutch post.
+    """
+    directory = tmp_path / "blog_content"
+    directory.mkdir()
+    (directory / "901_hielspoor.nl.md").write_text(
+        POST_TEMPLATE.format(title="Hielspoor", slug="hielspoor", date="2024-03-01"),
+        encoding="utf-8",
+    )
+
+    monkeypatch.setattr(blog_service, "_posts_cache", {})
+    monkeypatch.setattr(blog_service, "_listings_cache", {})
+    monkeypatch.setattr(blog_service, "_slug_index", {})
+    monkeypatch.setattr(blog_service, "_get_blog_content_dir", lambda: directory)
+    monkeypatch.setattr(blog_service, "_get_cache_dir", lambda: tmp_path / "cache")
+    monkeypatch.setattr(
+        blog_watcher, "_get_watched_dirs", lambda: (directory, tmp_path / "images")
+    )
+    return directory
+
+
+def test_changed_files_are_swapped_into_loaded_posts(content_dir: Path) -> None:
+    """
+    Test that adding, editing and deleting a file updates only that post.
+
+    Parameters
+    ----------
+    content_dir : Path
+        Temporary content directory.
+    """
+    original = blog_service.load_all_posts(force_reload=True, language="nl")[0]
+
+    new_file = content_dir / "902_steunzolen.nl.md"
+    new_file.write_text(
+        POST_TEMPLATE.format(title="Steunzolen", slug="steunzolen", date="2024-04-01"),
+        encoding="utf-8",
+    )
+    blog_watcher.handle_changes({new_file})
+
+    posts = blog_service.load_all_posts(language="nl")
+    assert [post["slug"] for post in posts] == ["steunzolen", "hielspoor"]
+    assert posts[1] is original
+
+    new_file.write_text(
+        POST_TEMPLATE.format(title="Zolen", slug="steunzolen", date="2024-04-01"),
+        encoding="utf-8",
+    )
+    blog_watcher.handle_changes({new_file})
+
+    assert blog_service.load_all_posts(language="nl")[0]["title"] == "Zolen"
+    assert blog_service.load_all_listings("nl")[0]["title"] == "Zolen"
+
+    new_file.unlink()
+    blog_watcher.handle_changes({new_file})
+
+    assert blog_service.load_all_posts(language="nl") == [original]
+
+
+def test_preview_mode_loads_and_reloads_only_the_previewed_file(
+    content_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that a previewed post is the only loaded post, also after edits.
+
+    Parameters
+    ----------
+    content_dir : Path
+        Temporary content directory.
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture.
+    """
+    preview_file = content_dir / "901_hielspoor.nl.md"
+    other_file = content_dir / "902_steunzolen.nl.md"
+    other_file.write_text(
+        POST_TEMPLATE.format(title="Steunzolen", slug="steunzolen", date="2024-04-01"),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(blog_watcher.config, "blog_preview_file", str(preview_file))
+
+    post = blog_service.load_preview_post(preview_file)
+
+    assert blog_service.load_all_posts(language="nl") == [post]
+    assert blog_service.load_all_posts(language="de") == []
+
+    preview_file.write_text(
+        POST_TEMPLATE.format(title="Hielpijn", slug="hielspoor", date="2024-03-01"),
+        encoding="utf-8",
+    )
+    other_file.touch()
+
+    assert blog_watcher.handle_changes({preview_file, other_file}) == [
+        preview_file.resolve()
+    ]
+    assert blog_service.get_post_by_slug("nl", "hielspoor")["title"] == "Hielpijn"  # type: ignore[index]
+    assert blog_service.get_post_by_slug("nl", "steunzolen") is None
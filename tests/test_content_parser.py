@@ -0,0 +1,32 @@
+"""Tests for parsing blog markdown into content objects."""
+
+from voorvoet_website.models import ButtonBlock, ParagraphBlock
+from voorvoet_website.services.content_parser import parse_blog_content
+
+
+def test_button_paragraph_becomes_button_object() -> None:
+    """
+    Test that a paragraph holding only !button[label](url) yields a button.
+    """
+    content_objects = parse_blog_content(
+        "Tekst.\n\n!button[Maak direct een afspraak](https://voorvoet.nl)\n",
+        "901_hielspoor",
+    )
+
+    assert content_objects == (
+        ParagraphBlock(content="Tekst."),
+        ButtonBlock(label="Maak direct een afspraak", url="https://voorvoet.nl"),
+    )
+
+
+def test_inline_button_renders_as_link() -> None:
+    """
+    Test that a button inside running text degrades to a markdown link.
+    """
+    content_objects = parse_blog_content(
+        "Bel !button[ons](tel:0531234567) vandaag.\n", "901_hielspoor"
+    )
+
+    assert content_objects == (
+        ParagraphBlock(content="Bel [ons](tel:0531234567) vandaag."),
+    )
@@ -0,0 +1,43 @@
+"""Tests for the cached blog feeds and their conditional GET handling."""
+
+from starlette.testclient import TestClient
+
+from voorvoet_website.api import api
+
+
+def test_feed_served_with_validators() -> None:
+    """
+    Test that a feed carries a strong ETag and Last-Modified date.
+    """
+    client = TestClient(api)
+
+    response = client.get("/api/blog/nl/rss.xml")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/rss+xml")
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["last-modified"].endswith("GMT")
+    assert b"<rss" in response.content
+
+
+def test_conditional_feed_request_returns_not_modified() -> None:
+    """
+    Test that matching If-None-Match or If-Modified-Since headers yield 304.
+    """
+    client = TestClient(api)
+    first = client.get("/api/blog/en/atom.xml")
+
+    by_etag = client.get(
+        "/api/blog/en/atom.xml", headers={"If-None-Match": first.headers["etag"]}
+    )
+    by_date = client.get(
+        "/api/blog/en/atom.xml",
+        headers={"If-Modified-Since": first.headers["last-modified"]},
+    )
+    stale = client.get("/api/blog/en/atom.xml", headers={"If-None-Match": '"stale"'})
+
+    assert by_etag.status_code == 304
+    assert by_etag.content == b""
+    assert by_date.status_code == 304
+    assert stale.status_code == 200
+    assert stale.content == first.content
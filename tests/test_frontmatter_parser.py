@@ -0,0 +1,65 @@
+"""Tests for the fast-path frontmatter reader."""
+
+import frontmatter
+import pytest
+
+from voorvoet_website.services.blog_service import _get_blog_content_dir
+from voorvoet_website.services.frontmatter_parser import (
+    FRONTMATTER_BOUNDARY,
+    parse_flat_frontmatter,
+    parse_frontmatter,
+)
+
+
+def _parse_with_yaml(source: str) -> tuple[dict[str, str], str]:
+    """Parse with python-frontmatter and stringify like blog_service did."""
+    metadata, content = frontmatter.parse(source)
+    return {str(key): str(value) for key, value in metadata.items()}, content
+
+
+def test_existing_posts_match_yaml_parsing() -> None:
+    """
+    Test that every existing post takes the fast path and yields exactly the
+    metadata and content of python-frontmatter.
+    """
+    file_paths = sorted(_get_blog_content_dir().glob("*.md"))
+    assert file_paths
+
+    for file_path in file_paths:
+        source = file_path.read_text(encoding="utf-8")
+        header = FRONTMATTER_BOUNDARY.split(source.strip(), 2)[1]
+
+        assert parse_flat_frontmatter(header) is not None, file_path.name
+        assert parse_frontmatter(source) == _parse_with_yaml(source), file_path.name
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        "date: 2024-03-01",
+        "draft: yes",
+        "order: 1:30",
+        'title: "Regel\\neen"',
+        "title: 'Kim''s blog'",
+        "title: >\n  Gevouwen\n  titel",
+        "author:\n  name: Kim",
+        "tags:\n  - voet\n  - zolen",
+        "tags: [voet, zolen]",
+        'title: "Hielspoor" # opmerking',
+        "# opmerking\ntitle: Hielspoor",
+        "summary:",
+        "on: Hielspoor",
+    ],
+)
+def test_yaml_constructs_match_yaml_parsing(header: str) -> None:
+    """
+    Test that headers beyond flat quoted values still parse as YAML would.
+
+    Parameters
+    ----------
+    header : str
+        Frontmatter header to parse.
+    """
+    source = f"---\n{header}\n---\n# Hielspoor\nTekst.\n"
+
+    assert parse_frontmatter(source) == _parse_with_yaml(source)
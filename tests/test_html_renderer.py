@@ -0,0 +1,73 @@
+"""Tests for the build time HTML rendering of blog markdown."""
+
+import pytest
+import reflex as rx
+
+from voorvoet_website.models.blog_content import ListBlock
+from voorvoet_website.services import html_renderer
+from voorvoet_website.services.html_renderer import (
+    blog_markdown_body,
+    render_markdown_html,
+)
+
+
+def test_renders_paragraphs_lists_and_buttons() -> None:
+    """Test that inline markdown, lists and inline buttons become HTML."""
+    assert render_markdown_html("Lees [meer](/nl/blog/hielspoor) *hier*") == (
+        '<p>Lees <a href="/nl/blog/hielspoor">meer</a> <em>hier</em></p>'
+    )
+    assert render_markdown_html(ListBlock(ordered=True, items=("a", "b")).markdown) == (
+        "<ol>\n<li>a</li>\n<li>b</li>\n</ol>"
+    )
+    assert render_markdown_html("Plan !button[een afspraak](/nl/contact) nu") == (
+        '<p>Plan <a href="/nl/contact">een afspraak</a> nu</p>'
+    )
+
+
+@pytest.mark.parametrize(
+    "markdown",
+    [
+        "<script>alert(1)</script>",
+        '<img src="x" onerror="alert(1)">',
+        "[klik](javascript:alert(1))",
+        "[klik](JavaScript:alert(1))",
+        "[klik](java\tscript:alert(1))",
+        "!button[klik](javascript:alert(1))",
+        "![plaatje](data:text/html,<script>alert(1)</script>)",
+    ],
+)
+def test_output_is_sanitized(markdown: str) -> None:
+    """
+    Test that raw HTML is escaped and script capable URLs are dropped.
+
+    Parameters
+    ----------
+    markdown : str
+        Markdown trying to inject a script.
+    """
+    html = render_markdown_html(markdown)
+
+    assert "<script" not in html
+    assert '<img src="x"' not in html
+    assert "javascript:" not in html.lower()
+    assert "data:" not in html
+
+
+def test_only_build_time_markdown_is_prerendered(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that markdown is pre-rendered only when enabled and known at build
+    time, and left to rx.markdown otherwise.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(html_renderer.config, "blog_prerender_html", True)
+    assert "<em>hier</em>" in str(blog_markdown_body("Lees *hier*"))
+    assert "<em>" not in str(blog_markdown_body(rx.Var("state.content")))
+
+    monkeypatch.setattr(html_renderer.config, "blog_prerender_html", False)
+    assert "<em>" not in str(blog_markdown_body("Lees *hier*"))
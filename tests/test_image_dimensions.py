@@ -0,0 +1,83 @@
+"""Tests for reading intrinsic image dimensions from file headers."""
+
+from pathlib import Path
+import struct
+
+import pytest
+
+from voorvoet_website.services.image_dimensions import read_image_size
+
+
+def _box(box_type: bytes, payload: bytes) -> bytes:
+    """Build an ISOBMFF box."""
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+JPEG = (
+    b"\xff\xd8"
+    + b"\xff\xe0"
+    + struct.pack(">H", 16)
+    + b"JFIF\0" * 2
+    + b"\0\0\0\0"
+    + b"\xff\xc0"
+    + struct.pack(">HBHH", 11, 8, 683, 1024)
+    + b"\0" * 6
+)
+PNG = b"\x89PNG\r\n\x1a\n" + struct.pack(">I4sII", 13, b"IHDR", 1024, 683)
+WEBP_VP8X = (
+    b"RIFF\0\0\0\0WEBPVP8X"
+    + b"\0" * 8
+    + (1024 - 1).to_bytes(3, "little")
+    + (683 - 1).to_bytes(3, "little")
+)
+AVIF = _box(b"ftyp", b"avif\0\0\0\0") + _box(
+    b"meta",
+    b"\0\0\0\0"
+    + _box(
+        b"iprp",
+        _box(b"ipco", _box(b"ispe", b"\0\0\0\0" + struct.pack(">II", 1024, 683))),
+    ),
+)
+
+
+@pytest.mark.parametrize(
+    "name, data",
+    [
+        ("photo.jpg", JPEG),
+        ("photo.png", PNG),
+        ("photo.webp", WEBP_VP8X),
+        ("photo.avif", AVIF),
+    ],
+)
+def test_read_image_size_from_header(tmp_path: Path, name: str, data: bytes) -> None:
+    """
+    Test that each supported format yields its width and height.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    name : str
+        File name of the image.
+    data : bytes
+        Minimal file content with the format's header.
+    """
+    file_path = tmp_path / name
+    file_path.write_bytes(data)
+
+    assert read_image_size(file_path) == (1024, 683)
+
+
+def test_read_image_size_unknown_format(tmp_path: Path) -> None:
+    """
+    Test that unsupported files yield None instead of raising.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    """
+    file_path = tmp_path / "notes.txt"
+    file_path.write_bytes(b"not an image")
+
+    assert read_image_size(file_path) is None
@@ -0,0 +1,38 @@
+"""Tests for prioritizing the LCP image of a page."""
+
+import reflex as rx
+
+from voorvoet_website.components import prioritize_lcp_image, responsive_image
+
+
+def test_first_candidate_in_document_order_gets_priority() -> None:
+    """
+    Test that only the first candidate of the page loads eagerly and is
+    preloaded, even when a later image is created first.
+    """
+
+    @prioritize_lcp_image
+    def page() -> rx.Component:
+        article_image = responsive_image(
+            src_fallback="/images/artikel.jpg", lcp_candidate=True
+        )
+        hero_image = responsive_image(
+            src_fallback="/images/hero.jpg",
+            src_avif="/images/hero.avif",
+            src_webp="/images/hero.webp",
+            lcp_candidate=True,
+        )
+        footer_image = responsive_image(src_fallback="/images/logo.png")
+        return rx.fragment(
+            rx.box(hero_image), rx.box(article_image), rx.box(footer_image)
+        )
+
+    output = str(page())
+
+    assert output.count('loading:"eager"') == 1
+    assert output.count('fetchPriority:"high"') == 2
+    assert output.count('rel:"preload"') == 1
+    assert 'imageSrcSet:"/images/hero.avif"' in output
+    assert 'type:"image/avif"' in output
+    assert output.index('rel:"preload"') < output.index('src:"/images/hero.jpg"')
+    assert output.index('loading:"eager"') < output.index("/images/artikel.jpg")
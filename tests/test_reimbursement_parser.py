@@ -0,0 +1,86 @@
+"""Tests for parsing free text reimbursement descriptions."""
+
+from decimal import Decimal
+
+import pytest
+
+from voorvoet_website.models import ReimbursementTerms
+from voorvoet_website.services.reimbursement_parser import parse_reimbursement
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        (
+            "€ 150,- (inclusief steunzolen) per kalenderjaar",
+            (Decimal("150"), "year", None, True, False),
+        ),
+        (
+            "Max. € 150,- per kalenderjaar (inclusief 1 paar steunzolen)",
+            (Decimal("150"), "year", None, True, False),
+        ),
+        (
+            "Maximaal €\xa027,50\xa0per behandeldatum, maximaal 6 behandelingen "
+            "per kalenderjaar. Steunzolen: vergoeding tot maximaal € 55,-",
+            (Decimal("27.50"), "treatment", None, False, False),
+        ),
+        (
+            "Max. € 1.000,- per kalenderjaar",
+            (Decimal("1000"), "year", None, False, False),
+        ),
+        (
+            "€ 1.250 per jaar, maximaal € 27,50 per behandeling",
+            (Decimal("1250"), "year", None, False, False),
+        ),
+        (
+            "75% tot maximaal € 250,- per kalenderjaar (inclusief steunzolen)",
+            (Decimal("250"), "year", 75, True, False),
+        ),
+        (
+            "€ 150,- vergoeding voetbehandeling en 100% voor steunzolen",
+            (Decimal("150"), "", None, False, False),
+        ),
+        (
+            "100% voor voetzorg, € 500 euro voor steunzolen",
+            (None, "", 100, False, False),
+        ),
+        (
+            "Podotherapie krijg je volledig vergoed, zonder maximumbedrag per "
+            "jaar Steunzolen* krijg je vergoed tot maximaal € 200 per jaar",
+            (None, "", 100, False, False),
+        ),
+        (
+            "Geen vergoeding voor podotherapie en steunzolen",
+            (None, "", None, False, True),
+        ),
+        (
+            "Vanaf 1 november 2024 gaat PlusGezond verder onder de naam Aevitae.",
+            (None, "", None, False, False),
+        ),
+    ],
+)
+def test_parses_podiatry_terms(
+    text: str,
+    expected: tuple[Decimal | None, str, int | None, bool, bool],
+) -> None:
+    """
+    Test that amounts and percentages for insoles alone are not mistaken for
+    the podiatry reimbursement.
+
+    Parameters
+    ----------
+    text : str
+        Reimbursement description as published.
+    expected : tuple[Decimal | None, str, int | None, bool, bool]
+        Expected amount, period, percentage, insoles_included and
+        no_reimbursement.
+    """
+    terms: ReimbursementTerms = parse_reimbursement(text)
+
+    assert (
+        terms["amount"],
+        terms["period"],
+        terms["percentage"],
+        terms["insoles_included"],
+        terms["no_reimbursement"],
+    ) == expected
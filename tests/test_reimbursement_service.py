@@ -0,0 +1,108 @@
+"""Tests for the reimbursement data store."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from voorvoet_website.services import reimbursement_service
+from voorvoet_website.services.reimbursement_service import (
+    get_insurer_packages,
+    get_reimbursement,
+    load_reimbursement_data,
+    query_reimbursements,
+    suggest_insurers,
+)
+
+
+def test_dataset_is_loaded_once_and_indexed() -> None:
+    """
+    Test that the dataset is cached and indexed by insurer and by package.
+    """
+    data = load_reimbursement_data(force_reload=True)
+
+    assert load_reimbursement_data() is data
+    assert data["columns"] == ["Verzekeraar", "Pakket", "Vergoeding"]
+    assert sum(len(items) for items in data["by_insurer"].values()) == len(
+        data["items"]
+    )
+    assert sum(len(items) for items in data["by_package"].values()) == len(
+        data["items"]
+    )
+
+    packages = get_insurer_packages(data, "Aevitea")
+    assert [item["package"] for item in packages] == [
+        "Laef!1",
+        "Laef!2",
+        "Laef!3",
+        "Laef!4",
+    ]
+    assert get_reimbursement(data, "Aevitea", "Laef!1") == packages[0]
+    assert get_reimbursement(data, "Aevitea", "Onbekend") is None
+    assert len({item["insurer"] for item in data["by_package"]["Extra"]}) > 1
+
+
+def test_invalid_rows_are_rejected(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that a row without reimbursement text fails validation.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory for the dataset.
+    monkeypatch : pytest.MonkeyPatch
+        Fixture to point the service at the temporary dataset.
+    """
+    data_path = tmp_path / "reimbursements.json"
+    data_path.write_text(
+        json.dumps(
+            [
+                {
+                    "verzekeraar": "Verzekeraar",
+                    "pakket": "Pakket",
+                    "vergoeding": "Vergoeding",
+                },
+                {"verzekeraar": "Menzis", "pakket": "Extra", "vergoeding": None},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(
+        reimbursement_service, "_get_reimbursement_data_path", lambda: data_path
+    )
+
+    with pytest.raises(ValueError, match="row 1"):
+        load_reimbursement_data(force_reload=True)
+
+
+def test_query_ignores_case_and_diacritics() -> None:
+    """
+    Test that every query term has to match, regardless of case and accents.
+    """
+    data = load_reimbursement_data()
+
+    result = query_reimbursements(data, "ZILVEREN kruis", sort="insurer", limit=500)
+
+    assert result["total"] == len(result["results"]) > 0
+    assert all(
+        "zilveren kruis" in " ".join(row.values()).lower() for row in result["results"]
+    )
+    assert query_reimbursements(data, "zilveren krüis")["total"] == result["total"]
+    assert query_reimbursements(data, "xyzzy")["total"] == 0
+
+
+def test_misspelled_names_find_the_insurer() -> None:
+    """
+    Test that typos still match, with the insurer of that exact name first.
+    """
+    data = load_reimbursement_data()
+
+    result = query_reimbursements(data, "zilveren krus")
+
+    assert result["total"] > 0
+    assert result["results"][0]["insurer"] == "Zilveren Kruis"
+    assert query_reimbursements(data, "menzsi")["results"][0]["insurer"] == "Menzis"
+    assert suggest_insurers(data, "zilveren krus", limit=1) == ["Zilveren Kruis"]
+    assert suggest_insurers(data, "xyzzy") == []
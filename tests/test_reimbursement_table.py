@@ -0,0 +1,79 @@
+"""Tests for the reimbursement table section and its API."""
+
+from starlette.testclient import TestClient
+
+from voorvoet_website.api import api
+from voorvoet_website.pages.reimbursements.section_reimbursement_table import (
+    section_reimbursement_table,
+)
+from voorvoet_website.services.reimbursement_parser import parse_reimbursement
+
+
+def test_table_fetches_rows_with_page_language() -> None:
+    """
+    Test that the table is rendered once, with the labels of the page
+    language, and loads its rows from the API instead of embedding them.
+    """
+    output = str(section_reimbursement_table("de"))
+
+    assert "Zum Suchen tippen..." in output
+    assert "Typ om te zoeken..." not in output
+    assert "Type to search..." not in output
+    assert "/api/reimbursements?" in output
+    assert "Aevitea" not in output
+
+
+def test_api_searches_sorts_and_paginates() -> None:
+    """
+    Test that the API returns one sorted page of the matching rows.
+    """
+    client = TestClient(api)
+
+    response = client.get(
+        "/api/reimbursements",
+        params={"q": "aevitea", "sort": "-package", "page": 2, "limit": 3},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 4
+    assert body["page"] == 2
+    assert [row["package"] for row in body["results"]] == ["Laef!1"]
+
+    first_page = client.get("/api/reimbursements").json()
+    assert len(first_page["results"]) == 12
+    assert first_page["total"] > 12
+
+
+def test_api_rejects_unknown_sort_field() -> None:
+    """
+    Test that sorting on a field that does not exist yields 400.
+    """
+    response = TestClient(api).get("/api/reimbursements", params={"sort": "prijs"})
+
+    assert response.status_code == 400
+
+
+def test_api_sorts_and_filters_by_amount() -> None:
+    """
+    Test that reimbursements sort numerically and filter on a minimum amount.
+    """
+    client = TestClient(api)
+
+    body = client.get(
+        "/api/reimbursements",
+        params={"sort": "-reimbursement", "min_amount": "300", "limit": 100},
+    ).json()
+
+    assert body["total"] == len(body["results"]) > 0
+    amounts = [
+        parse_reimbursement(row["reimbursement"])["amount"] for row in body["results"]
+    ]
+    listed = [amount for amount in amounts if amount is not None]
+    assert listed == sorted(listed, reverse=True)
+    assert listed[-1] >= 300
+    # Packages reimbursing all costs have no amount and are listed last.
+    assert amounts[len(listed) :] == [None] * (len(amounts) - len(listed))
+
+    invalid = client.get("/api/reimbursements", params={"min_amount": "veel"})
+    assert invalid.status_code == 400
@@ -0,0 +1,74 @@
+"""Tests for the related blog posts index."""
+
+from voorvoet_website.models import BlogPostDict
+from voorvoet_website.services.related_posts_service import (
+    add_post,
+    build_related_index,
+    get_related_slugs,
+    remove_post,
+)
+
+
+def _make_post(slug: str, title: str, content: str) -> BlogPostDict:
+    """Create a minimal parsed post for indexing."""
+    return {
+        "title": title,
+        "slug": slug,
+        "summary": "",
+        "author": "",
+        "category": "",
+        "language": "nl",
+        "date": "2024-03-01",
+        "formatted_date": "1 maart 2024",
+        "datetime_iso": "2024-03-01T00:00:00",
+        "thumbnail_fallback": "",
+        "thumbnail_avif": "",
+        "thumbnail_webp": "",
+        "thumbnail_alt": "",
+        "content": content,
+        "content_objects": (),
+        "url": f"/nl/blog/{slug}/",
+        "filename": f"{slug}.nl.md",
+        "story_number": "",
+    }
+
+
+POSTS = [
+    _make_post("hielspoor", "Hielspoor", "Pijn onder de hiel, steunzolen helpen."),
+    _make_post("steunzolen", "Steunzolen", "Steunzolen op maat tegen hielpijn."),
+    _make_post("wratten", "Wratten", "Een wrat behandelen met stikstof."),
+]
+
+
+def test_related_posts_share_topic() -> None:
+    """
+    Test that posts about the same topic are each other's best match.
+    """
+    index = build_related_index(POSTS, "nl", top_n=1)
+
+    assert get_related_slugs(index, "hielspoor") == ["steunzolen"]
+    assert get_related_slugs(index, "steunzolen") == ["hielspoor"]
+
+
+def test_added_post_gets_neighbours_and_removed_post_disappears() -> None:
+    """
+    Test that an added post is related to its topic in both directions and
+    that a removed post is no longer anyone's neighbour.
+
+    Existing vectors keep their IDF weights until the next full build, so
+    the incremental index is not compared with a rebuilt one.
+    """
+    new_post = _make_post("wrat-kind", "Wrat bij kinderen", "Een wrat bij een kind.")
+
+    index = build_related_index(POSTS, "nl", top_n=2)
+    add_post(index, new_post)
+
+    assert get_related_slugs(index, "wrat-kind")[0] == "wratten"
+    assert get_related_slugs(index, "wratten")[0] == "wrat-kind"
+
+    remove_post(index, "wrat-kind")
+
+    assert "wrat-kind" not in index["vectors"]
+    assert "wrat-kind" not in index["related"]
+    for post in POSTS:
+        assert "wrat-kind" not in get_related_slugs(index, post["slug"])
@@ -0,0 +1,54 @@
+"""Tests for the blog search index."""
+
+from voorvoet_website.models import BlogPostDict, ParagraphBlock
+from voorvoet_website.services.search_service import build_search_index, search
+
+
+def _make_post(slug: str, title: str, paragraph: str) -> BlogPostDict:
+    """Create a minimal parsed post for indexing."""
+    return {
+        "title": title,
+        "slug": slug,
+        "summary": "",
+        "author": "",
+        "category": "",
+        "language": "nl",
+        "date": "2024-03-01",
+        "formatted_date": "1 maart 2024",
+        "datetime_iso": "2024-03-01T00:00:00",
+        "thumbnail_fallback": "",
+        "thumbnail_avif": "",
+        "thumbnail_webp": "",
+        "thumbnail_alt": "",
+        "content": paragraph,
+        "content_objects": (ParagraphBlock(content=paragraph),),
+        "url": f"/nl/blog/{slug}/",
+        "filename": f"{slug}.nl.md",
+        "story_number": "",
+    }
+
+
+def test_search_ranks_title_match_first() -> None:
+    """
+    Test that a query term in the title outranks a single body mention.
+    """
+    posts = [
+        _make_post("steunzolen", "Steunzolen", "Wij maken zolen op maat."),
+        _make_post("hielspoor", "Hielspoor", "Steunzolen kunnen helpen."),
+    ]
+    index = build_search_index(posts, "nl")
+
+    results = search(index, "steunzolen", limit=10)
+
+    assert [result["slug"] for result in results] == ["steunzolen", "hielspoor"]
+
+
+def test_search_folds_diacritics_and_ignores_stopwords() -> None:
+    """
+    Test that accented queries match unaccented text and stopwords match nothing.
+    """
+    posts = [_make_post("fuss", "Fußschmerzen", "Einlagen gegen Fersensporn.")]
+    index = build_search_index(posts, "de")
+
+    assert [result["slug"] for result in search(index, "FUSSSCHMERZEN")] == ["fuss"]
+    assert search(index, "und der die") == []
@@ -0,0 +1,30 @@
+"""Tests for the typo tolerant trigram index."""
+
+from voorvoet_website.services.trigram_index import (
+    build_trigram_index,
+    match_trigrams,
+    trigrams,
+)
+
+
+def test_trigrams_are_folded_and_padded_per_word() -> None:
+    """
+    Test that words are folded and padded before splitting into trigrams.
+    """
+    assert trigrams("CZé") == {" cz", "cze", "ze "}
+    assert trigrams("a.s.r.") == {" a ", " s ", " r "}
+
+
+def test_matches_are_ranked_by_similarity_then_length() -> None:
+    """
+    Test that a misspelled query ranks the closest and shortest name first.
+    """
+    index = build_trigram_index(
+        ["Aon Vitaal (Zilveren Kruis)", "Zilveren Kruis", "Menzis"]
+    )
+
+    matches = match_trigrams(index, "zilveren krus")
+
+    assert [position for position, _ in matches] == [1, 0]
+    assert matches[0][1] == 10 / 12
+    assert match_trigrams(index, "menzis", limit=1) == [(2, 1.0)]
@@ -0,0 +1,27 @@
+"""Backend API routes served next to the Reflex app under ``/api``."""
+
+from starlette.applications import Starlette
+from starlette.routing import Route
+
+from ..config import config
+from .blog import atom_feed, blog_post_page, rss_feed, search_blog
+from .reimbursements import list_reimbursements
+
+routes = [
+    Route("/api/blog/{language}/search", search_blog, methods=["GET"]),
+    Route("/api/blog/{language}/rss.xml", rss_feed, methods=["GET"]),
+    Route("/api/blog/{language}/atom.xml", atom_feed, methods=["GET"]),
+    Route("/api/reimbursements", list_reimbursements, methods=["GET"]),
+]
+
+if config.blog_dynamic_routes:
+    # Serve dynamic blog posts with their head rendered on the server, when
+    # the backend serves the frontend or a proxy forwards these routes.
+    routes += [
+        Route("/{language}/blog/{slug}", blog_post_page, methods=["GET"]),
+        Route("/{language}/blog/{slug}/", blog_post_page, methods=["GET"]),
+    ]
+
+api = Starlette(routes=routes)
+
+__all__ = ["api"]
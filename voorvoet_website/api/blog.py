@@ -0,0 +1,194 @@
+"""Blog API endpoints."""
+
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+from reflex import constants
+from reflex.config import get_config
+from reflex.utils.prerequisites import get_web_dir
+from starlette.requests import Request
+from starlette.responses import HTMLResponse, JSONResponse, Response
+
+from ..models.feed import EncodedFeed
+from ..services.feed_service import FeedFormat, get_feed
+from ..services.head_renderer import inject_head, render_blog_post_head
+from ..services.search_service import search_posts
+from ..translations import ROUTE_MAPPINGS
+
+
+DEFAULT_SEARCH_LIMIT = 10
+MAX_SEARCH_LIMIT = 50
+
+FEED_CACHE_CONTROL = "public, max-age=900"
+
+_page_shell: str | None = None
+
+
+def _parse_limit(raw_limit: str | None) -> int:
+    """Parse the requested number of results, clamped to a sane range."""
+    try:
+        limit = int(raw_limit) if raw_limit else DEFAULT_SEARCH_LIMIT
+    except ValueError:
+        limit = DEFAULT_SEARCH_LIMIT
+    return max(1, min(limit, MAX_SEARCH_LIMIT))
+
+
+async def search_blog(request: Request) -> JSONResponse:
+    """
+    Search the blog posts of one language.
+
+    Query parameters: ``q`` (search text) and ``k`` (number of results,
+    default 10, max 50).
+
+    Parameters
+    ----------
+    request : Request
+        Incoming request with the ``language`` path parameter
+
+    Returns
+    -------
+    JSONResponse
+        ``{"query": str, "language": str, "results": [SearchResult, ...]}``
+    """
+    language = request.path_params["language"]
+    if language not in ROUTE_MAPPINGS:
+        return JSONResponse({"error": "Unknown language"}, status_code=404)
+
+    query = request.query_params.get("q", "").strip()
+    limit = _parse_limit(request.query_params.get("k"))
+
+    return JSONResponse(
+        {
+            "query": query,
+            "language": language,
+            "results": search_posts(query, language, limit),
+        }
+    )
+
+
+def _is_not_modified(request: Request, feed: EncodedFeed) -> bool:
+    """Evaluate If-None-Match, or If-Modified-Since if no ETags were sent."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in etags or feed["etag"] in etags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+            return since >= parsedate_to_datetime(feed["last_modified"])
+        except (TypeError, ValueError):
+            return False
+
+    return False
+
+
+def _feed_response(request: Request, feed_format: FeedFormat) -> Response:
+    """Serve a cached feed, answering conditional requests with 304."""
+    language = request.path_params["language"]
+    if language not in ROUTE_MAPPINGS:
+        return JSONResponse({"error": "Unknown language"}, status_code=404)
+
+    feed = get_feed(language, feed_format)
+    headers = {
+        "ETag": feed["etag"],
+        "Last-Modified": feed["last_modified"],
+        "Cache-Control": FEED_CACHE_CONTROL,
+    }
+
+    if _is_not_modified(request, feed):
+        return Response(status_code=304, headers=headers)
+
+    return Response(feed["body"], media_type=feed["media_type"], headers=headers)
+
+
+async def rss_feed(request: Request) -> Response:
+    """
+    Serve the RSS 2.0 feed of one language.
+
+    Parameters
+    ----------
+    request : Request
+        Incoming request with the ``language`` path parameter
+
+    Returns
+    -------
+    Response
+        Feed document, or 304 if the client's copy is current
+    """
+    return _feed_response(request, "rss")
+
+
+async def atom_feed(request: Request) -> Response:
+    """
+    Serve the Atom 1.0 feed of one language.
+
+    Parameters
+    ----------
+    request : Request
+        Incoming request with the ``language`` path parameter
+
+    Returns
+    -------
+    Response
+        Feed document, or 304 if the client's copy is current
+    """
+    return _feed_response(request, "atom")
+
+
+def _get_page_shell_path() -> Path:
+    """Get the path of the compiled page served for routes not prerendered."""
+    static_dir = get_web_dir() / constants.Dirs.STATIC
+    static_dir /= get_config().frontend_path.strip("/")
+    return static_dir / constants.ReactRouter.SPA_FALLBACK
+
+
+def _load_page_shell() -> str | None:
+    """Read the compiled page shell once, None if the frontend is not built."""
+    global _page_shell
+
+    if _page_shell is None:
+        try:
+            _page_shell = _get_page_shell_path().read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    return _page_shell
+
+
+async def blog_post_page(request: Request) -> Response:
+    """
+    Serve a dynamic blog post route with the head of the post rendered in.
+
+    Only registered with ``config.blog_dynamic_routes``, where all posts of
+    a language share one compiled page. The page shell is the one the
+    frontend would serve, so the post still renders in the browser; crawlers
+    get the post's title, meta tags and structured data without running
+    JavaScript.
+
+    Parameters
+    ----------
+    request : Request
+        Incoming request with the ``language`` and ``slug`` path parameters
+
+    Returns
+    -------
+    Response
+        The page with the post's head tags, the plain page with status 404
+        for unknown posts, or 404 if the frontend has not been built
+    """
+    page_shell = _load_page_shell()
+    if page_shell is None:
+        return JSONResponse({"error": "Frontend not built"}, status_code=404)
+
+    language = request.path_params["language"]
+    head_html = (
+        render_blog_post_head(language, request.path_params["slug"])
+        if language in ROUTE_MAPPINGS
+        else None
+    )
+    if head_html is None:
+        return HTMLResponse(page_shell, status_code=404)
+
+    return HTMLResponse(inject_head(page_shell, head_html))
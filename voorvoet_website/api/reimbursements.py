@@ -0,0 +1,81 @@
+"""Reimbursement table API endpoint."""
+
+from decimal import Decimal, InvalidOperation
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from ..services.reimbursement_service import (
+    load_reimbursement_data,
+    query_reimbursements,
+)
+
+
+DEFAULT_PAGE_LIMIT = 12
+MAX_PAGE_LIMIT = 100
+
+REIMBURSEMENTS_CACHE_CONTROL = "public, max-age=900"
+
+
+def _parse_positive_int(raw_value: str | None, default: int, maximum: int) -> int:
+    """Parse a positive integer query parameter, clamped to [1, maximum]."""
+    try:
+        value = int(raw_value) if raw_value else default
+    except ValueError:
+        value = default
+    return max(1, min(value, maximum))
+
+
+def _parse_min_amount(raw_amount: str | None) -> Decimal | None:
+    """Parse the minimum amount filter ("150", "27.50" or "27,50"), if given."""
+    if not raw_amount:
+        return None
+    try:
+        amount = Decimal(raw_amount.strip().replace(",", "."))
+    except InvalidOperation:
+        raise ValueError(f"Invalid min_amount: '{raw_amount}'") from None
+    if not amount.is_finite() or amount < 0:
+        raise ValueError(f"Invalid min_amount: '{raw_amount}'")
+    return amount
+
+
+async def list_reimbursements(request: Request) -> JSONResponse:
+    """
+    Search, sort and paginate the insurance reimbursements.
+
+    Query parameters: ``q`` (search text), ``sort`` (``insurer``,
+    ``package`` or ``reimbursement``, prefixed with ``-`` for descending
+    order; reimbursements sort by amount), ``min_amount`` (only packages
+    reimbursing at least this many euros), ``page`` (1-based, default 1) and
+    ``limit`` (rows per page, default 12, max 100).
+
+    Parameters
+    ----------
+    request : Request
+        Incoming request
+
+    Returns
+    -------
+    JSONResponse
+        ReimbursementPage with the matching rows of the requested page, or
+        400 for an unknown sort field or invalid minimum amount
+    """
+    params = request.query_params
+    page = _parse_positive_int(params.get("page"), 1, maximum=10_000)
+    limit = _parse_positive_int(
+        params.get("limit"), DEFAULT_PAGE_LIMIT, maximum=MAX_PAGE_LIMIT
+    )
+
+    try:
+        result = query_reimbursements(
+            load_reimbursement_data(),
+            query=params.get("q", "").strip(),
+            sort=params.get("sort", "").strip(),
+            min_amount=_parse_min_amount(params.get("min_amount")),
+            page=page,
+            limit=limit,
+        )
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+
+    return JSONResponse(result, headers={"Cache-Control": REIMBURSEMENTS_CACHE_CONTROL})
@@ -26,6 +26,7 @@ from .location_map_section import location_section, LocationConfig
 from .regular_text import regular_text
 from .responsive_grid import responsive_grid
 from .responsive_image import responsive_image
+from .lcp_image import prioritize_lcp_image
 from .risk_level_card import risk_level_card
 from .section import section
 from .header import header
@@ -33,16 +34,20 @@ from .jumbo_text import jumbo_text
 from .structured_data import (
     organization_brand_schema,
     organization_schema,
+    article_json_ld,
     article_schema,
+    breadcrumb_json_ld,
     breadcrumb_schema,
 )
 from .toast import toast
 
 
 __all__ = [
+    "article_json_ld",
     "article_schema",
     "blog_card",
     "blog_header",
+    "breadcrumb_json_ld",
     "breadcrumb_schema",
     "blog_image",
     "blog_list",
@@ -74,6 +79,7 @@ __all__ = [
     "regular_text",
     "responsive_grid",
     "responsive_image",
+    "prioritize_lcp_image",
     "risk_level_card",
     "section",
     "toast",
@@ -2,7 +2,7 @@
 
 import reflex as rx
 
-from ..models.blog_post import BlogPostDict
+from ..models.blog_post import BlogListingDict
 from ..theme import Colors, FontSizes, Layout, ImageDimensions
 from ..config import config
 
@@ -10,7 +10,7 @@ from .responsive_image import responsive_image
 
 
 def blog_card(
-    post: BlogPostDict,
+    post: BlogListingDict,
     language: str = "nl",
     flip: bool = False,
 ) -> rx.Component:
@@ -19,8 +19,8 @@ def blog_card(
 
     Parameters
     ----------
-    post : dict
-        Dictionary containing all post data and metadata.
+    post : BlogListingDict
+        Listing record of the post (title, summary, slug, thumbnails, ...).
     language : str
         Current language code ("nl", "de", or "en")
     flip : bool, optional
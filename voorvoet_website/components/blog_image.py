@@ -1,35 +1,59 @@
 """Blog image component for rendering images with optional captions."""
 
+from typing import Any
+
 import reflex as rx
 from ..theme import Colors, FontSizes, Spacing, Layout
 from .responsive_image import responsive_image
 
 
 def blog_image(
-    src_fallback: str,
-    alt: str,
-    src_avif: str = "",
-    src_webp: str = "",
-    caption: str = "",
+    src_fallback: str | rx.Var,
+    alt: str | rx.Var,
+    src_avif: str | rx.Var = "",
+    src_webp: str | rx.Var = "",
+    caption: str | rx.Var = "",
+    width: int | rx.Var[int] = 0,
+    height: int | rx.Var[int] = 0,
 ) -> rx.Component:
     """
     Create a styled image for blog content with optional caption.
 
     Parameters
     ----------
-    src : str
+    src : str | rx.Var
         The image source URL or path (absolute or relative)
-    alt : str
+    alt : str | rx.Var
         Alternative text for the image (for accessibility and SEO)
-    caption : str, optional
+    caption : str | rx.Var, optional
         Optional caption text to display below the image (default: "")
         Caption is displayed in italic, muted color, and centered
+    width : int | rx.Var[int], optional
+        Intrinsic image width in pixels; 0 if unknown (default: 0)
+    height : int | rx.Var[int], optional
+        Intrinsic image height in pixels; 0 if unknown (default: 0)
+        Together with width, reserves the image box before it loads
+        Both may be vars, for pages rendered from state
 
     Returns
     -------
     rx.Component
         A Reflex box component containing the styled image and optional caption
     """
+    size_props: dict[str, Any]
+    if isinstance(width, rx.Var) and isinstance(height, rx.Var):
+        size_props = {
+            "custom_attrs": {
+                "width": rx.cond(width.bool(), width, None),
+                "height": rx.cond(height.bool(), height, None),
+            }
+        }
+    else:
+        size_props = {
+            "img_width": str(width) if width else None,
+            "img_height": str(height) if height else None,
+        }
+
     return rx.box(
         responsive_image(
             src_fallback=src_fallback,
@@ -37,6 +61,8 @@ def blog_image(
             src_webp=src_webp,
             alt=alt,
             loading="lazy",
+            lcp_candidate=True,
+            **size_props,
         ),
         rx.cond(
             caption != "",
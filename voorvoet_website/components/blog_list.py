@@ -1,16 +1,17 @@
 """Blog list component for rendering ordered and unordered lists."""
 
 import reflex as rx
-from ..theme import Colors, FontSizes, Spacing
+from ..services.html_renderer import LIST_STYLE, blog_markdown_body
+from ..theme import Colors, Spacing
 
 
-def blog_list(markdown: str) -> rx.Component:
+def blog_list(markdown: str | rx.Var) -> rx.Component:
     """
     Create a styled list for blog content from markdown format.
 
     Parameters
     ----------
-    markdown : str
+    markdown : str | rx.Var
         The list content in markdown format, either:
         - Unordered list: lines starting with "- " or "* "
         - Ordered list: lines starting with "1. ", "2. ", etc.
@@ -19,16 +20,14 @@ def blog_list(markdown: str) -> rx.Component:
     Returns
     -------
     rx.Component
-        A Reflex markdown component that renders the list with proper styling
+        A Reflex markdown component, or static HTML rendered at build time
+        when ``config.blog_prerender_html`` is enabled, that renders the list with proper styling
     """
     return rx.box(
-        rx.markdown(  # type: ignore[operator]  # Due to missing stubs in Relfex
-            markdown,
-            color=Colors.text["content"],
-            font_size=FontSizes.regular,
-        ),
+        blog_markdown_body(markdown),
         margin_bottom=Spacing.blog_content_margin_bottom,
         style={
+            **LIST_STYLE,
             "& a": {
                 "color": f"{Colors.primary['300']} !important",
                 "textDecoration": "underline",
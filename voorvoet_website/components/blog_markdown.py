@@ -1,7 +1,8 @@
 """Blog markdown component for rendering mixed markdown content blocks."""
 
 import reflex as rx
-from ..theme import Colors, FontSizes, Spacing
+from ..services.html_renderer import LIST_STYLE, blog_markdown_body
+from ..theme import Colors, Spacing
 
 
 def blog_markdown(content: str) -> rx.Component:
@@ -18,14 +19,11 @@ def blog_markdown(content: str) -> rx.Component:
     Returns
     -------
     rx.Component
-        A Reflex markdown component styled for blog content blocks
+        A Reflex markdown component, or static HTML rendered at build time
+        when ``config.blog_prerender_html`` is enabled, styled for blog content blocks
     """
     return rx.box(
-        rx.markdown(  # type: ignore[operator]  # Due to missing stubs in Relfex
-            content,
-            color=Colors.text["content"],
-            font_size=FontSizes.regular,
-        ),
+        blog_markdown_body(content),
         margin_bottom=Spacing.blog_content_margin_bottom,
         style={
             "& p": {
@@ -37,6 +35,7 @@ def blog_markdown(content: str) -> rx.Component:
                 "marginBottom": Spacing.blog_heading_margin_bottom,
                 "color": Colors.text["heading"],
             },
+            **LIST_STYLE,
             "& a": {
                 "color": f"{Colors.primary['300']} !important",
                 "textDecoration": "underline",
@@ -1,30 +1,28 @@
 """Blog paragraph component for rendering paragraph text with markdown support."""
 
 import reflex as rx
-from ..theme import Colors, FontSizes, Spacing
+from ..services.html_renderer import blog_markdown_body
+from ..theme import Colors, Spacing
 
 
-def blog_paragraph(content: str) -> rx.Component:
+def blog_paragraph(content: str | rx.Var) -> rx.Component:
     """
     Create a styled paragraph for blog content with markdown support.
 
     Parameters
     ----------
-    content : str
+    content : str | rx.Var
         The paragraph text content, which may include inline markdown formatting
         such as **bold**, *italic*, [links](url), and `code`
 
     Returns
     -------
     rx.Component
-        A Reflex markdown component styled for blog paragraphs
+        A Reflex markdown component, or static HTML rendered at build time
+        when ``config.blog_prerender_html`` is enabled, styled for blog paragraphs
     """
     return rx.box(
-        rx.markdown(  # type: ignore[operator]  # Due to missing stubs in Relfex
-            content,
-            color=Colors.text["content"],
-            font_size=FontSizes.regular,
-        ),
+        blog_markdown_body(content),
         margin_bottom=Spacing.blog_content_margin_bottom,
         style={
             "& p": {
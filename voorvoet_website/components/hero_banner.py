@@ -56,7 +56,7 @@ def hero_banner(
             width="100%",
             height="100%",
             filter="brightness(1.05) saturate(1.06)",
-            loading="eager",
+            lcp_candidate=True,
         ),
         rx.box(
             position="absolute",
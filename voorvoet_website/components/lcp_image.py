@@ -0,0 +1,137 @@
+"""Loading priority for the Largest Contentful Paint image of a page.
+
+Images that may be the first thing visible on a page (hero banners, article
+images) are created with ``responsive_image(..., lcp_candidate=True)``. They
+load lazily like every other image until the page they belong to is built:
+``prioritize_lcp_image`` then walks the page in document order and promotes
+only the first candidate to ``loading="eager"`` with ``fetchPriority="high"``,
+preceded by a ``<link rel="preload" as="image">`` for its best format. React
+hoists the preload link into the document head.
+
+The decision is made on the finished page rather than while components are
+created, because pages do not necessarily build their sections in document
+order (the blog post page builds its article before the hero above it).
+"""
+
+from collections.abc import Callable
+from functools import wraps
+from typing import ParamSpec
+
+import reflex as rx
+from reflex.components.component import Component
+
+P = ParamSpec("P")
+
+# Candidates of the page being built: id(picture) -> (picture, img, preload
+# link). Holding the picture keeps its id unique until the page is processed.
+_candidates: dict[int, tuple[Component, Component, rx.Component]] = {}
+
+
+def _best_source(
+    src_fallback: str | rx.Var, src_avif: str | rx.Var, src_webp: str | rx.Var
+) -> tuple[str | rx.Var, str | rx.Var]:
+    """Get the URL and MIME type of the preferred format (AVIF, WebP, fallback)."""
+    if not any(isinstance(src, rx.Var) for src in (src_fallback, src_avif, src_webp)):
+        if src_avif:
+            return src_avif, "image/avif"
+        if src_webp:
+            return src_webp, "image/webp"
+        return src_fallback, ""
+
+    url = rx.cond(
+        src_avif != "", src_avif, rx.cond(src_webp != "", src_webp, src_fallback)
+    ).to(str)
+    mime_type = rx.cond(
+        src_avif != "", "image/avif", rx.cond(src_webp != "", "image/webp", "")
+    ).to(str)
+    return url, mime_type
+
+
+def register_lcp_candidate(
+    picture: Component,
+    img: Component,
+    src_fallback: str | rx.Var,
+    src_avif: str | rx.Var = "",
+    src_webp: str | rx.Var = "",
+) -> None:
+    """
+    Register a picture that may hold the LCP image of its page.
+
+    Parameters
+    ----------
+    picture : Component
+        The picture element returned by responsive_image()
+    img : Component
+        The img element inside the picture
+    src_fallback : str | rx.Var
+        Fallback image path (JPG or PNG)
+    src_avif : str | rx.Var, optional
+        AVIF image path (empty string if not available)
+    src_webp : str | rx.Var, optional
+        WebP image path (empty string if not available)
+    """
+    url, mime_type = _best_source(src_fallback, src_avif, src_webp)
+    link_attrs: dict[str, str | rx.Var] = {
+        "as": "image",
+        "imageSrcSet": url,
+        "fetchPriority": "high",
+    }
+    if not isinstance(mime_type, str) or mime_type:
+        # Browsers skip preloads of a type they cannot decode, and then use
+        # the next <source> of the picture instead.
+        link_attrs["type"] = mime_type
+    preload_link = rx.el.link(rel="preload", href=url, custom_attrs=link_attrs)
+
+    _candidates[id(picture)] = (picture, img, preload_link)
+
+
+def _promote_first_candidate(page: Component) -> None:
+    """Give the first candidate of the page priority and forget all others."""
+    promoted = False
+    stack: list[tuple[Component | None, Component]] = [(None, page)]
+
+    while stack and not promoted:
+        parent, component = stack.pop()
+        candidate = _candidates.get(id(component))
+        if candidate is not None:
+            if parent is not None:
+                _, img, preload_link = candidate
+                img.loading = rx.Var.create("eager")  # type: ignore[attr-defined]
+                img.custom_attrs["fetchPriority"] = "high"
+                parent.children.insert(parent.children.index(component), preload_link)
+                promoted = True
+            continue
+
+        children = [
+            child for child in component.children if isinstance(child, Component)
+        ]
+        stack.extend((component, child) for child in reversed(children))
+
+    # Candidates that were not reached (not on the page, or rendered from
+    # state by rx.foreach) stay lazy.
+    _candidates.clear()
+
+
+def prioritize_lcp_image(page: Callable[P, rx.Component]) -> Callable[P, rx.Component]:
+    """
+    Decorate a page function so that its first LCP candidate loads eagerly.
+
+    Parameters
+    ----------
+    page : Callable[P, rx.Component]
+        Function building a page
+
+    Returns
+    -------
+    Callable[P, rx.Component]
+        The page function, promoting the first image registered with
+        ``lcp_candidate=True`` in document order
+    """
+
+    @wraps(page)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> rx.Component:
+        component = page(*args, **kwargs)
+        _promote_first_candidate(component)
+        return component
+
+    return wrapper
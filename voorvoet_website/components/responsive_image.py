@@ -3,13 +3,14 @@
 import reflex as rx
 from typing import Any
 from ..theme import Layout
+from .lcp_image import register_lcp_candidate
 
 
 def responsive_image(
-    src_fallback: str = "",
-    src_avif: str = "",
-    src_webp: str = "",
-    alt: str = "",
+    src_fallback: str | rx.Var = "",
+    src_avif: str | rx.Var = "",
+    src_webp: str | rx.Var = "",
+    alt: str | rx.Var = "",
     dimensions: dict[str, str] | None = None,
     img_width: str | None = None,
     img_height: str | None = None,
@@ -21,6 +22,7 @@ def responsive_image(
     margin_y: str | None = None,
     class_name: str | None = None,
     loading: str = "lazy",
+    lcp_candidate: bool = False,
     **props: Any,
 ) -> rx.Component:
     """
@@ -59,6 +61,11 @@ def responsive_image(
         CSS class name
     loading : str, default "lazy"
         Loading strategy: "lazy" or "eager"
+    lcp_candidate : bool, default False
+        Whether the image may be the Largest Contentful Paint element of the
+        page. The first candidate of a page built by a function decorated
+        with ``prioritize_lcp_image`` loads eagerly with high fetch priority
+        and is preloaded; other candidates keep ``loading``.
     src : str | list[str], optional
         Legacy parameter for backward compatibility
     **props
@@ -69,6 +76,7 @@ def responsive_image(
     rx.Component
         Picture element with AVIF, WebP sources and fallback img
     """
+    alt_value: str | rx.Var
     if isinstance(alt, rx.Var):  # Fix to supress Reflex warning
         alt_value = rx.cond(alt is not None, alt, "").to(str)
     else:
@@ -108,7 +116,8 @@ def responsive_image(
     if class_name:
         img_props["class_name"] = class_name
 
-    return rx.el.picture(
+    img = rx.image(src=src_fallback, **img_props)
+    picture = rx.el.picture(
         rx.cond(
             src_avif != "",
             rx.el.source(type="image/avif", custom_attrs={"srcset": src_avif}),
@@ -117,5 +126,10 @@ def responsive_image(
             src_webp != "",
             rx.el.source(type="image/webp", custom_attrs={"srcset": src_webp}),
         ),
-        rx.image(src=src_fallback, **img_props),
+        img,
     )
+
+    if lcp_candidate:
+        register_lcp_candidate(picture, img, src_fallback, src_avif, src_webp)
+
+    return picture
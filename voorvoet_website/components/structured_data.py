@@ -196,21 +196,21 @@ def organization_schema() -> rx.Component:
     )
 
 
-def article_schema(post: BlogPostDict, language: str) -> rx.Component:
+def article_json_ld(post: BlogPostDict, language: str) -> str:
     """
-    Generate Article JSON-LD structured data for blog posts.
+    Serialize the Article structured data of a blog post to JSON-LD.
 
     Parameters
     ----------
-    post : dict
+    post : BlogPostDict
         The blog post dictionary to generate schema for
     language : str
         Language code ("nl", "de", or "en")
 
     Returns
     -------
-    rx.Component
-        A script tag containing JSON-LD Article structured data
+    str
+        JSON-LD Article structured data
     """
     base_url = "https://voorvoet.nl"
 
@@ -263,16 +263,33 @@ def article_schema(post: BlogPostDict, language: str) -> rx.Component:
     if post.get("category"):
         article_data["articleSection"] = post["category"]
 
-    json_ld = json.dumps(article_data, ensure_ascii=False, indent=2)
+    return json.dumps(article_data, ensure_ascii=False, indent=2)
+
 
+def article_schema(post: BlogPostDict, language: str) -> rx.Component:
+    """
+    Generate Article JSON-LD structured data for blog posts.
+
+    Parameters
+    ----------
+    post : BlogPostDict
+        The blog post dictionary to generate schema for
+    language : str
+        Language code ("nl", "de", or "en")
+
+    Returns
+    -------
+    rx.Component
+        A script tag containing JSON-LD Article structured data
+    """
     return rx.el.script(
-        json_ld,
+        article_json_ld(post, language),
         type="application/ld+json",
     )
 
 
-def breadcrumb_schema(items: list[dict[str, str]]) -> rx.Component:
-    """Generate BreadcrumbList JSON-LD structured data for navigation hierarchy.
+def breadcrumb_json_ld(items: list[dict[str, str]]) -> str:
+    """Serialize a BreadcrumbList to JSON-LD.
 
     Parameters
     ----------
@@ -282,8 +299,8 @@ def breadcrumb_schema(items: list[dict[str, str]]) -> rx.Component:
 
     Returns
     -------
-    rx.Component
-        A script tag containing JSON-LD BreadcrumbList structured data.
+    str
+        JSON-LD BreadcrumbList structured data.
     """
     breadcrumb_data: dict[str, Any] = {
         "@context": "https://schema.org",
@@ -299,9 +316,24 @@ def breadcrumb_schema(items: list[dict[str, str]]) -> rx.Component:
         ],
     }
 
-    json_ld = json.dumps(breadcrumb_data, ensure_ascii=False, indent=2)
+    return json.dumps(breadcrumb_data, ensure_ascii=False, indent=2)
+
+
+def breadcrumb_schema(items: list[dict[str, str]]) -> rx.Component:
+    """Generate BreadcrumbList JSON-LD structured data for navigation hierarchy.
+
+    Parameters
+    ----------
+    items : list[dict[str, str]]
+        List of breadcrumb items, each with 'name' and 'url' keys.
+        Items should be in order from root to current page.
 
+    Returns
+    -------
+    rx.Component
+        A script tag containing JSON-LD BreadcrumbList structured data.
+    """
     return rx.el.script(
-        json_ld,
+        breadcrumb_json_ld(items),
         type="application/ld+json",
     )
@@ -45,6 +45,31 @@ class Config(BaseSettings):
         Show author name on blog posts.
     blog_show_publication_date : bool
         Show publication date on blog posts.
+    blog_page_size : int
+        Number of posts per blog overview page.
+    blog_related_posts : int
+        Number of related posts shown below a blog post (0 disables).
+    blog_cache_enabled : bool
+        Cache parsed blog posts on disk, keyed by content hash.
+    blog_cache_dir : str
+        Directory of the blog post cache, relative to the project root.
+    blog_parallel_loading : bool
+        Parse blog posts in a process pool at startup.
+    blog_parallel_workers : int | None
+        Number of worker processes for parallel loading (default: CPU count).
+    blog_watch : bool
+        Watch blog content and images and reload changed posts at runtime.
+    blog_watch_interval : float
+        Seconds between scans when watching without filesystem events.
+    blog_dynamic_routes : bool
+        Serve blog posts through one dynamic route per language instead of
+        compiling a page per post.
+    blog_prerender_html : bool
+        Render blog paragraphs and lists to sanitized HTML at build time
+        instead of parsing their markdown in the browser.
+    blog_preview_file : str | None
+        Path of a single blog post file to preview. When set, the app only
+        serves that post and reloads it whenever the file changes.
     reimbursements_data_file : str
         Filename of the reimbursements data JSON file.
     pricing_data_file : str
@@ -156,6 +181,53 @@ class Config(BaseSettings):
         default=False,
         description="Show publication date on blog posts",
     )
+    blog_page_size: int = Field(
+        default=10,
+        ge=1,
+        description="Number of posts per blog overview page",
+    )
+    blog_related_posts: int = Field(
+        default=3,
+        ge=0,
+        description="Number of related posts shown below a blog post (0 disables)",
+    )
+    blog_cache_enabled: bool = Field(
+        default=True,
+        description="Cache parsed blog posts on disk, keyed by content hash",
+    )
+    blog_cache_dir: str = Field(
+        default=".cache/blog",
+        description="Directory of the blog post cache, relative to the project root",
+    )
+    blog_parallel_loading: bool = Field(
+        default=False,
+        description="Parse blog posts in a process pool at startup",
+    )
+    blog_parallel_workers: int | None = Field(
+        default=None,
+        description="Number of worker processes for parallel loading (default: CPU count)",
+    )
+    blog_watch: bool = Field(
+        default=False,
+        description="Watch blog content and images and reload changed posts at runtime",
+    )
+    blog_watch_interval: float = Field(
+        default=1.0,
+        gt=0,
+        description="Seconds between scans when watching without filesystem events",
+    )
+    blog_dynamic_routes: bool = Field(
+        default=False,
+        description="Serve blog posts through one dynamic route per language instead of compiling a page per post",
+    )
+    blog_prerender_html: bool = Field(
+        default=False,
+        description="Render blog paragraphs and lists to sanitized HTML at build time instead of in the browser",
+    )
+    blog_preview_file: str | None = Field(
+        default=None,
+        description="Path of a single blog post file to preview instead of serving the full site",
+    )
 
     site_url: str = Field(
         default="https://voorvoet.nl",
@@ -3,16 +3,62 @@
 from .phone_number import PhoneNumber
 from .email_address import EmailAddress
 from .contact_form import ContactForm
-from .blog_post import BlogPostDict, ContentType, ContentDict
+from .blog_content import (
+    ButtonBlock,
+    ContentBlock,
+    HeadingBlock,
+    ImageBlock,
+    ListBlock,
+    ParagraphBlock,
+)
+from .blog_post import (
+    BlogCategoryDict,
+    BlogPostDict,
+    BlogListingDict,
+    ContentType,
+    ContentDict,
+)
 from .pricing import PricingItem, PricingData
+from .reimbursement import (
+    ReimbursementItem,
+    ReimbursementData,
+    ReimbursementPage,
+    ReimbursementPeriod,
+    ReimbursementTerms,
+)
+from .asset_index import AssetIndex
+from .feed import EncodedFeed
+from .related import RelatedIndex
+from .search import SearchDocument, SearchIndex, SearchResult
+from .trigram import TrigramIndex
 
 __all__ = [
     "PhoneNumber",
     "EmailAddress",
     "ContactForm",
     "BlogPostDict",
+    "BlogListingDict",
+    "BlogCategoryDict",
     "ContentType",
     "ContentDict",
+    "ContentBlock",
+    "HeadingBlock",
+    "ParagraphBlock",
+    "ImageBlock",
+    "ButtonBlock",
+    "ListBlock",
     "PricingItem",
     "PricingData",
+    "ReimbursementItem",
+    "ReimbursementData",
+    "ReimbursementPage",
+    "ReimbursementPeriod",
+    "ReimbursementTerms",
+    "AssetIndex",
+    "EncodedFeed",
+    "RelatedIndex",
+    "SearchDocument",
+    "SearchIndex",
+    "SearchResult",
+    "TrigramIndex",
 ]
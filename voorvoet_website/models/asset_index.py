@@ -0,0 +1,25 @@
+"""Asset index data model for fast image existence lookups."""
+
+from typing import TypedDict
+
+
+class AssetIndex(TypedDict):
+    """
+    In-memory snapshot of the files below ``assets/images``.
+
+    Attributes
+    ----------
+    formats : dict[str, frozenset[str]]
+        Maps a URL path without extension (e.g., "/images/page_blog/thumb")
+        to the file extensions available for it (e.g., {".jpg", ".webp"})
+    directories : dict[str, tuple[str, ...]]
+        Maps a directory URL path (e.g., "/images/page_blog/001_post") to the
+        sorted names of the files directly inside it
+    mtimes : dict[str, int]
+        Maps a file URL path (e.g., "/images/page_blog/001_post/photo.jpg")
+        to its modification time in nanoseconds
+    """
+
+    formats: dict[str, frozenset[str]]
+    directories: dict[str, tuple[str, ...]]
+    mtimes: dict[str, int]
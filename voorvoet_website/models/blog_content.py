@@ -0,0 +1,202 @@
+"""Compact typed representation of parsed blog content blocks."""
+
+from dataclasses import dataclass
+from typing import Any, ClassVar, Union
+import sys
+
+
+@dataclass(frozen=True, slots=True)
+class HeadingBlock:
+    """
+    Section heading.
+
+    Attributes
+    ----------
+    level : int
+        Heading level (1-6)
+    content : str
+        Heading text as inline markdown
+    """
+
+    type: ClassVar[str] = sys.intern("heading")
+
+    level: int
+    content: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the content dict consumed by the page components."""
+        return {"type": self.type, "level": self.level, "content": self.content}
+
+
+@dataclass(frozen=True, slots=True)
+class ParagraphBlock:
+    """
+    Paragraph of inline markdown.
+
+    Attributes
+    ----------
+    content : str
+        Paragraph text as inline markdown
+    """
+
+    type: ClassVar[str] = sys.intern("paragraph")
+
+    content: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the content dict consumed by the page components."""
+        return {"type": self.type, "content": self.content}
+
+
+@dataclass(frozen=True, slots=True)
+class ImageBlock:
+    """
+    Article image with its modern format variants.
+
+    The alt text doubles as caption, so it is stored once.
+
+    Attributes
+    ----------
+    src_fallback : str
+        JPG/PNG source
+    src_avif : str
+        AVIF source, empty if not available
+    src_webp : str
+        WebP source, empty if not available
+    alt : str
+        Alt text and caption
+    width : int
+        Intrinsic width in pixels, 0 if unknown
+    height : int
+        Intrinsic height in pixels, 0 if unknown
+    """
+
+    type: ClassVar[str] = sys.intern("image")
+
+    src_fallback: str
+    src_avif: str
+    src_webp: str
+    alt: str
+    width: int
+    height: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the content dict consumed by the page components."""
+        return {
+            "type": self.type,
+            "src_fallback": self.src_fallback,
+            "src_avif": self.src_avif,
+            "src_webp": self.src_webp,
+            "alt": self.alt,
+            "caption": self.alt,
+            "width": self.width,
+            "height": self.height,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ButtonBlock:
+    """
+    Call-to-action button.
+
+    Attributes
+    ----------
+    label : str
+        Button text
+    url : str
+        Link target
+    """
+
+    type: ClassVar[str] = sys.intern("button")
+
+    label: str
+    url: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the content dict consumed by the page components."""
+        return {"type": self.type, "label": self.label, "url": self.url}
+
+
+@dataclass(frozen=True, slots=True)
+class ListBlock:
+    """
+    Ordered or unordered list.
+
+    Only the items are stored; the markdown source of the whole list is
+    derived from them when needed.
+
+    Attributes
+    ----------
+    ordered : bool
+        True for a numbered list
+    items : tuple[str, ...]
+        Item texts as inline markdown
+    """
+
+    type: ClassVar[str] = sys.intern("list")
+
+    ordered: bool
+    items: tuple[str, ...]
+
+    @property
+    def markdown(self) -> str:
+        """Markdown source of the list, e.g., "- a\\n- b"."""
+        if self.ordered:
+            return "\n".join(f"{i + 1}. {item}" for i, item in enumerate(self.items))
+        return "\n".join(f"- {item}" for item in self.items)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the content dict consumed by the page components."""
+        return {
+            "type": self.type,
+            "ordered": self.ordered,
+            "items": list(self.items),
+            "markdown": self.markdown,
+        }
+
+
+ContentBlock = Union[HeadingBlock, ParagraphBlock, ImageBlock, ButtonBlock, ListBlock]
+
+
+def content_block_from_dict(data: dict[str, Any]) -> ContentBlock:
+    """
+    Rebuild a content block from its dict form (see ``to_dict``).
+
+    Derived keys (``caption``, ``markdown``) are ignored.
+
+    Parameters
+    ----------
+    data : dict[str, Any]
+        Content dict with a "type" key
+
+    Returns
+    -------
+    ContentBlock
+        The typed block
+
+    Raises
+    ------
+    ValueError
+        If the type is unknown
+    """
+    content_type = data["type"]
+
+    if content_type == "heading":
+        return HeadingBlock(level=data["level"], content=data["content"])
+    if content_type == "paragraph":
+        return ParagraphBlock(content=data["content"])
+    if content_type == "image":
+        return ImageBlock(
+            src_fallback=data["src_fallback"],
+            src_avif=data["src_avif"],
+            src_webp=data["src_webp"],
+            alt=data["alt"],
+            width=data["width"],
+            height=data["height"],
+        )
+    if content_type == "button":
+        return ButtonBlock(label=data["label"], url=data["url"])
+    if content_type == "list":
+        return ListBlock(ordered=data["ordered"], items=tuple(data["items"]))
+
+    raise ValueError(f"Unknown content block type: {content_type}")
@@ -3,6 +3,8 @@
 from typing import TypedDict, Any, Literal
 from datetime import datetime
 
+from .blog_content import ContentBlock
+
 
 ContentType = Literal["heading", "paragraph", "markdown", "image", "button", "list"]
 ContentDict = dict[str, Any]
@@ -60,7 +62,9 @@ class BlogPostDict(TypedDict):
     Blog post data structure with all pre-computed fields.
 
     All dynamic properties (formatted_date, url, datetime) are pre-computed
-    during parsing, so this is a plain dictionary with no methods.
+    during parsing, so this is a plain dictionary with no methods. The
+    article body is kept as compact typed blocks; they are converted to
+    plain dicts with ``to_dict()`` only where Reflex needs them.
     """
 
     title: str
@@ -77,12 +81,47 @@ class BlogPostDict(TypedDict):
     thumbnail_webp: str
     thumbnail_alt: str
     content: str
-    content_objects: list[dict[str, Any]]
+    content_objects: tuple[ContentBlock, ...]
     url: str
     filename: str
     story_number: str
 
 
+class BlogListingDict(TypedDict):
+    """
+    Lightweight projection of a blog post for overview pages.
+
+    Contains only the fields rendered by ``blog_card``, so the compiled
+    overview page does not embed the content of every article.
+    """
+
+    title: str
+    slug: str
+    summary: str
+    author: str
+    date: str
+    formatted_date: str
+    thumbnail_fallback: str
+    thumbnail_avif: str
+    thumbnail_webp: str
+    thumbnail_alt: str
+
+
+class BlogCategoryDict(TypedDict):
+    """
+    Posts of one blog category, precomputed for category overview pages.
+
+    The listings are sorted by date (newest first). ``alternates`` maps
+    every language that has a variant of one of the posts to the slug of
+    the category that variant belongs to, including the own language.
+    """
+
+    name: str
+    slug: str
+    listings: list[BlogListingDict]
+    alternates: dict[str, str]
+
+
 def parse_datetime(date_str: str) -> datetime:
     """
     Parse date string to datetime (YYYY-MM-DD, DD-MM-YYYY, or ISO format).
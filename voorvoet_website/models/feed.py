@@ -0,0 +1,25 @@
+"""Serialized blog feed model."""
+
+from typing import TypedDict
+
+
+class EncodedFeed(TypedDict):
+    """
+    RSS or Atom feed serialized once and served as-is.
+
+    Attributes
+    ----------
+    body : bytes
+        UTF-8 encoded XML document
+    media_type : str
+        Content type, e.g., "application/rss+xml"
+    etag : str
+        Strong entity tag derived from the body, including quotes
+    last_modified : str
+        HTTP date of the newest post, e.g., "Fri, 01 Mar 2024 00:00:00 GMT"
+    """
+
+    body: bytes
+    media_type: str
+    etag: str
+    last_modified: str
@@ -0,0 +1,132 @@
+"""Insurance reimbursement data models for VoorVoet website."""
+
+from decimal import Decimal
+from typing import Literal, TypedDict
+
+from .trigram import TrigramIndex
+
+
+ReimbursementPeriod = Literal["year", "two_years", "treatment", ""]
+
+
+class ReimbursementItem(TypedDict):
+    """
+    Reimbursement of podiatry by one insurance package.
+
+    Attributes
+    ----------
+    insurer : str
+        Name of the health insurer, e.g., "Zilveren Kruis"
+    package : str
+        Name of the supplementary package, e.g., "Aanvullend 3 sterren",
+        or "-" if the insurer has no package names
+    reimbursement : str
+        Dutch reimbursement description as published by the NVvP,
+        e.g., "€ 250,- (inclusief steunzolen) per kalenderjaar"
+    """
+
+    insurer: str
+    package: str
+    reimbursement: str
+
+
+class ReimbursementTerms(TypedDict):
+    """
+    Terms parsed from the free text reimbursement description of a package.
+
+    Attributes
+    ----------
+    amount : Decimal | None
+        Maximum reimbursed amount for podiatry, e.g., Decimal("150"), or
+        None if the description states no amount for it
+    period : ReimbursementPeriod
+        Period the amount applies to: "year" (per (kalender)jaar),
+        "two_years" (per 2 kalenderjaren), "treatment" (per behandeldatum),
+        or "" if not stated
+    percentage : int | None
+        Reimbursed percentage of the podiatry costs, e.g., 75, with 100 for
+        full reimbursement ("volledig vergoed"), or None if not stated
+    insoles_included : bool
+        Whether insoles are paid from the same amount ("inclusief
+        steunzolen", "samen vergoed")
+    no_reimbursement : bool
+        Whether the package explicitly reimburses no podiatry ("Geen
+        vergoeding")
+    """
+
+    amount: Decimal | None
+    period: ReimbursementPeriod
+    percentage: int | None
+    insoles_included: bool
+    no_reimbursement: bool
+
+
+class ReimbursementData(TypedDict):
+    """
+    Container for all reimbursement data with lookup capabilities.
+
+    Attributes
+    ----------
+    columns : list[str]
+        Dutch column headers from the dataset, e.g., ["Verzekeraar",
+        "Pakket", "Vergoeding"]
+    items : list[ReimbursementItem]
+        Complete list of all reimbursements in order from the dataset
+    by_insurer : dict[str, list[ReimbursementItem]]
+        Packages of each insurer, in dataset order
+    by_package : dict[str, list[ReimbursementItem]]
+        Reimbursements per package name; names such as "Extra" are used
+        by several insurers
+    terms : list[ReimbursementTerms]
+        Parsed reimbursement terms of each item (same order as items)
+    search_text : list[str]
+        Lowercase, diacritic folded text of each item (same order as items)
+        that search queries are matched against
+    sort_orders : dict[str, list[int]]
+        Positions of the items in the order of each sort key, e.g.,
+        sort_orders["insurer"] or sort_orders["-reimbursement"] (descending)
+    name_index : TrigramIndex
+        Trigram index of the "insurer package" name of each item (same
+        order as items) for typo tolerant search
+    insurer_index : TrigramIndex
+        Trigram index of the insurer names, in the order of by_insurer
+    """
+
+    columns: list[str]
+    items: list[ReimbursementItem]
+    by_insurer: dict[str, list[ReimbursementItem]]
+    by_package: dict[str, list[ReimbursementItem]]
+    terms: list[ReimbursementTerms]
+    search_text: list[str]
+    sort_orders: dict[str, list[int]]
+    name_index: TrigramIndex
+    insurer_index: TrigramIndex
+
+
+class ReimbursementPage(TypedDict):
+    """
+    One page of reimbursements matching a table query.
+
+    Attributes
+    ----------
+    query : str
+        Search text the items were filtered with
+    sort : str
+        Sort field, prefixed with "-" for descending order, or "" for
+        relevance or dataset order
+    page : int
+        1-based page number
+    limit : int
+        Maximum number of items per page
+    total : int
+        Number of items matching the query on all pages
+    results : list[ReimbursementItem]
+        Items on the requested page
+    """
+
+    query: str
+    sort: str
+    page: int
+    limit: int
+    total: int
+    results: list[ReimbursementItem]
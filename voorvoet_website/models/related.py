@@ -0,0 +1,33 @@
+"""Related blog posts index model."""
+
+from typing import TypedDict
+
+
+class RelatedIndex(TypedDict):
+    """
+    Sparse TF-IDF vectors and precomputed neighbours of one language's posts.
+
+    Attributes
+    ----------
+    language : str
+        Language code of the indexed posts
+    top_n : int
+        Number of related posts kept per post
+    vectors : dict[str, dict[str, float]]
+        Maps a post slug to its L2-normalised TF-IDF vector (token → weight)
+    postings : dict[str, dict[str, float]]
+        Maps a token to the posts containing it and their weight, i.e. the
+        transposed vectors used for sparse dot products
+    document_frequency : dict[str, int]
+        Number of posts containing each token
+    related : dict[str, list[tuple[float, str]]]
+        Maps a post slug to its most similar posts as (similarity, slug),
+        most similar first
+    """
+
+    language: str
+    top_n: int
+    vectors: dict[str, dict[str, float]]
+    postings: dict[str, dict[str, float]]
+    document_frequency: dict[str, int]
+    related: dict[str, list[tuple[float, str]]]
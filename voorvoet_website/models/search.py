@@ -0,0 +1,75 @@
+"""Blog search index and result models."""
+
+from typing import TypedDict
+
+
+class SearchDocument(TypedDict):
+    """
+    Blog post as stored in the search index.
+
+    Attributes
+    ----------
+    slug : str
+        URL slug of the post
+    title : str
+        Post title
+    url : str
+        Site-relative URL of the post, e.g., "/nl/blog/hielspoor/"
+    blocks : list[str]
+        Plain text of the summary and content blocks, used for snippets
+    length : int
+        Number of indexed tokens (for BM25 length normalisation)
+    """
+
+    slug: str
+    title: str
+    url: str
+    blocks: list[str]
+    length: int
+
+
+class SearchIndex(TypedDict):
+    """
+    Inverted index over the blog posts of one language.
+
+    Attributes
+    ----------
+    language : str
+        Language code of the indexed posts
+    documents : list[SearchDocument]
+        Indexed posts; positions are the document ids used in ``postings``
+    postings : dict[str, list[tuple[int, int]]]
+        Maps a token to (document id, term frequency) pairs
+    average_length : float
+        Average document length in tokens
+    """
+
+    language: str
+    documents: list[SearchDocument]
+    postings: dict[str, list[tuple[int, int]]]
+    average_length: float
+
+
+class SearchResult(TypedDict):
+    """
+    Single ranked search hit.
+
+    Attributes
+    ----------
+    slug : str
+        URL slug of the post
+    title : str
+        Post title
+    url : str
+        Site-relative URL of the post
+    score : float
+        BM25 score, higher is more relevant
+    snippet : str
+        Short excerpt around the first matching term
+    """
+
+    slug: str
+    title: str
+    url: str
+    score: float
+    snippet: str
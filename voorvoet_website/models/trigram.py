@@ -0,0 +1,19 @@
+"""Trigram index model for typo tolerant name lookup."""
+
+from typing import TypedDict
+
+
+class TrigramIndex(TypedDict):
+    """
+    Inverted index from character trigrams to the texts containing them.
+
+    Attributes
+    ----------
+    postings : dict[str, list[int]]
+        Maps a trigram to the positions of the indexed texts containing it
+    sizes : list[int]
+        Number of distinct trigrams of each indexed text
+    """
+
+    postings: dict[str, list[int]]
+    sizes: list[int]
@@ -1,7 +1,7 @@
 """Module holding all pages for the website."""
 
 from .home import page_home
-from .blog import page_blog, page_blog_post
+from .blog import page_blog, page_blog_post, page_blog_post_dynamic
 from .information import page_information
 from .reimbursements import page_reimbursements
 from .contact import page_contact
@@ -13,6 +13,7 @@ __all__ = [
     "page_home",
     "page_blog",
     "page_blog_post",
+    "page_blog_post_dynamic",
     "page_information",
     "page_reimbursements",
     "page_contact",
@@ -1,6 +1,6 @@
 """Blog page module."""
 
 from .page_blog import page_blog
-from .page_blog_post import page_blog_post
+from .page_blog_post import page_blog_post, page_blog_post_dynamic
 
-__all__ = ["page_blog", "page_blog_post"]
+__all__ = ["page_blog", "page_blog_post", "page_blog_post_dynamic"]
@@ -4,51 +4,83 @@ import reflex as rx
 
 from .section_hero import section_hero
 from .section_blog_list import section_blog_list
+from .section_categories import section_categories
 from .section_starter import section_starter
 from ..shared_sections import footer, header
-from ...components import breadcrumb_schema
-from ...translations import BREADCRUMB_NAMES
+from ...components import breadcrumb_schema, prioritize_lcp_image
+from ...models import BlogCategoryDict, BlogListingDict
+from ...translations import BREADCRUMB_NAMES, get_blog_category_breadcrumbs
 from ...config import config
 
 
-def page_blog(language: str = "nl", posts: list = []) -> rx.Component:
+@prioritize_lcp_image
+def page_blog(
+    language: str = "nl",
+    posts: list[BlogListingDict] = [],
+    page: int = 1,
+    total_pages: int = 1,
+    categories: list[BlogCategoryDict] = [],
+    category: BlogCategoryDict | None = None,
+) -> rx.Component:
     """
     Create the complete blog page with all sections.
 
     The blog page is composed of: header, hero banner, starter text,
-    blog list grid, footer. The page title is
-    dynamically set based on the current language.
+    category links, blog list grid, footer. The page title is
+    dynamically set based on the current language. A category page shows
+    the category name instead of the starter text and lists only the posts
+    of that category.
 
     Parameters
     ----------
     language : str
         Current language code ("nl", "de", or "en")
-    posts : list
-        List of blog post dictionaries to display for the given language
+    posts : list[BlogListingDict]
+        Listing records of the posts on this overview page
+    page : int
+        1-based number of the overview page (default: 1)
+    total_pages : int
+        Total number of overview pages for the language (default: 1)
+    categories : list[BlogCategoryDict]
+        All categories of the language, linked above the posts
+    category : BlogCategoryDict | None
+        The category the page lists, None for the full blog (default: None)
 
     Returns
     -------
     rx.Component
         A fragment containing all sections of the blog page in order.
     """
-    breadcrumb_items = [
-        {
-            "name": BREADCRUMB_NAMES.get(language, {}).get("home", "Home"),
-            "url": f"{config.site_url}/{language}",
-        },
-        {
-            "name": BREADCRUMB_NAMES.get(language, {}).get("blog", "Blog"),
-            "url": f"{config.site_url}/{language}/blog/",
-        },
-    ]
+    if category is not None:
+        breadcrumb_items = get_blog_category_breadcrumbs(
+            language, category["name"], category["slug"]
+        )
+    else:
+        breadcrumb_items = [
+            {
+                "name": BREADCRUMB_NAMES.get(language, {}).get("home", "Home"),
+                "url": f"{config.site_url}/{language}",
+            },
+            {
+                "name": BREADCRUMB_NAMES.get(language, {}).get("blog", "Blog"),
+                "url": f"{config.site_url}/{language}/blog/",
+            },
+        ]
 
     return rx.fragment(
         breadcrumb_schema(breadcrumb_items),
         header(language, page_key="blog"),
         rx.box(
             section_hero(language),
-            section_starter(language),
-            section_blog_list(language, posts),
+            section_starter(language) if category is None else rx.fragment(),
+            section_categories(language, categories, category),
+            section_blog_list(
+                language,
+                posts,
+                page=page,
+                total_pages=total_pages,
+                category_slug=category["slug"] if category is not None else None,
+            ),
             id="main-content",
             role="main",
         ),
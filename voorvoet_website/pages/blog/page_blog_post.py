@@ -1,77 +1,199 @@
 """Individual blog post page displaying full content."""
 
 import reflex as rx
+from reflex.vars import ObjectVar
 from typing import Any
 
 from .section_hero import section_hero
 from ..shared_sections import footer, header
-from ...models import BlogPostDict
+from ...models import BlogListingDict, BlogPostDict
+from ...models.blog_content import (
+    ButtonBlock,
+    ContentBlock,
+    HeadingBlock,
+    ImageBlock,
+    ListBlock,
+    ParagraphBlock,
+)
 from ...theme import Colors, FontSizes, Spacing
 from ...components import (
+    prioritize_lcp_image,
     container,
     section,
     article_schema,
     breadcrumb_schema,
     blog_header,
     blog_paragraph,
-    blog_markdown,
     blog_image,
     blog_list,
     button,
 )
 from ...config import config
+from ...states import BlogPostState
 from ...utils import get_translation
-from ...translations import BREADCRUMB_NAMES
+from ...translations import get_blog_post_breadcrumbs
 
 
 TRANSLATIONS = {
     "nl": {
         "back_to_blog": "← Terug naar blog overzicht",
+        "related_posts": "Gerelateerde artikelen",
     },
     "de": {
         "back_to_blog": "← Zurück zur Blog-Übersicht",
+        "related_posts": "Ähnliche Artikel",
     },
     "en": {
         "back_to_blog": "← Back to blog overview",
+        "related_posts": "Related articles",
     },
 }
 
 
-def _build_content_component(obj: dict[str, Any]) -> rx.Component:
-    """Build a single content component from a content object dict at compile time."""
-    content_type = obj.get("type", "")
-
-    if content_type == "heading":
-        return blog_header(obj.get("content", ""), obj.get("level", 2))
-    elif content_type == "paragraph":
-        return blog_paragraph(obj.get("content", ""))
-    elif content_type == "markdown":
-        return blog_markdown(obj.get("content", ""))
-    elif content_type == "image":
+def _build_content_component(block: ContentBlock) -> rx.Component:
+    """Build a single content component from a content block at compile time."""
+    if isinstance(block, HeadingBlock):
+        return blog_header(block.content, block.level)
+    elif isinstance(block, ParagraphBlock):
+        return blog_paragraph(block.content)
+    elif isinstance(block, ImageBlock):
         return blog_image(
-            src_fallback=obj.get("src_fallback", ""),
-            alt=obj.get("alt", ""),
-            src_avif=obj.get("src_avif", ""),
-            src_webp=obj.get("src_webp", ""),
-            caption=obj.get("caption", ""),
+            src_fallback=block.src_fallback,
+            alt=block.alt,
+            src_avif=block.src_avif,
+            src_webp=block.src_webp,
+            caption=block.alt,
+            width=block.width,
+            height=block.height,
         )
-    elif content_type == "button":
+    elif isinstance(block, ButtonBlock):
         return rx.box(
-            button(label=obj.get("label", ""), href=obj.get("url", "")),
+            button(label=block.label, href=block.url),
             display="flex",
             justify_content="center",
             width="100%",
             margin_y="1.5rem",
         )
-    elif content_type == "list":
-        return blog_list(obj.get("markdown", ""))
+    elif isinstance(block, ListBlock):
+        return blog_list(block.markdown)
     else:
         return rx.box()
 
 
+def _related_post_link(listing: BlogListingDict, language: str) -> rx.Component:
+    """Build the link card of one related post (a listing dict or var)."""
+    return rx.link(
+        rx.vstack(
+            rx.text(
+                listing["title"],
+                color=Colors.text["heading"],
+                font_weight="600",
+                font_size=FontSizes.regular,
+            ),
+            rx.text(
+                listing["summary"],
+                color=Colors.text["content"],
+                font_size="0.9rem",
+                line_height="1.5",
+            ),
+            spacing="1",
+            align_items="start",
+        ),
+        href=f"/{language}/blog/{listing['slug']}/",
+        text_decoration="none",
+        padding="1rem",
+        border_radius="8px",
+        background=Colors.backgrounds["white"],
+        box_shadow="0 4px 12px rgba(0, 0, 0, 0.08)",
+        width="100%",
+        _hover={"box_shadow": f"0 4px 12px {Colors.primary['300']}66"},
+    )
+
+
+def _related_posts_section(links: list[rx.Component], language: str) -> rx.Component:
+    """Build the list of links to related posts below the article."""
+    return rx.el.aside(
+        rx.heading(
+            get_translation(TRANSLATIONS, "related_posts", language),
+            as_="h2",
+            font_size=FontSizes.regular,
+            color=Colors.text["heading"],
+            margin_bottom="1rem",
+        ),
+        rx.vstack(*links, spacing="3", width="100%"),
+        width="100%",
+        margin_top="3rem",
+    )
+
+
+def _metadata_components(author: str, formatted_date: str) -> list[rx.Component]:
+    """Build the author and publication date line, as configured."""
+    metadata_components: list[rx.Component] = []
+    if config.blog_show_author and author:
+        metadata_components.append(
+            rx.text(author, color=Colors.text["content"], font_size="1rem")
+        )
+        metadata_components.append(
+            rx.text("•", color=Colors.text["content"], font_size="1rem")
+        )
+
+    if config.blog_show_publication_date:
+        metadata_components.append(
+            rx.text(formatted_date, color=Colors.text["content"], font_size="1rem")
+        )
+
+    return metadata_components
+
+
+def _back_to_blog_link(language: str) -> rx.Component:
+    """Build the link back to the blog overview."""
+    return rx.link(
+        rx.text(get_translation(TRANSLATIONS, "back_to_blog", language)),
+        href=f"/{language}/blog/",
+        color=Colors.primary["500"],
+        font_size=FontSizes.regular,
+        font_weight="600",
+        text_decoration="none",
+        margin_top="3rem",
+        _hover={
+            "text_decoration": "underline",
+        },
+    )
+
+
+def _page_layout(
+    language: str, schemas: list[rx.Component], page_components: list[rx.Component]
+) -> rx.Component:
+    """Wrap the article components in the shared blog post page layout."""
+    return rx.fragment(
+        *schemas,
+        header(language, page_key="blog"),
+        rx.box(
+            section_hero(language),
+            section(
+                container(
+                    rx.vstack(
+                        *page_components,
+                        spacing="0",
+                        align_items="start",
+                        width="100%",
+                    ),
+                ),
+                padding_top="1em",
+                padding_bottom="2em",
+            ),
+            id="main-content",
+            role="main",
+        ),
+        footer(language),
+    )
+
+
+@prioritize_lcp_image
 def page_blog_post(
     post: BlogPostDict,
     language: str = "nl",
+    related: list[BlogListingDict] | None = None,
 ) -> rx.Component:
     """
     Create the individual blog post page with full content.
@@ -82,6 +204,8 @@ def page_blog_post(
         Blog post data as dictionary.
     language : str
         Current language code ("nl", "de", or "en")
+    related : list[BlogListingDict] | None
+        Precomputed related posts, rendered below the content if given.
 
     Returns
     -------
@@ -92,23 +216,11 @@ def page_blog_post(
     title_val = post.get("title", "")
     author_val = post.get("author", "") or ""
     formatted_date_val = post.get("formatted_date", "")
-    content_objects_val = post.get("content_objects", [])
+    content_objects_val = post.get("content_objects", ())
 
     content_components = [_build_content_component(obj) for obj in content_objects_val]
 
-    metadata_components = []
-    if config.blog_show_author and author_val:
-        metadata_components.append(
-            rx.text(author_val, color=Colors.text["content"], font_size="1rem")
-        )
-        metadata_components.append(
-            rx.text("•", color=Colors.text["content"], font_size="1rem")
-        )
-
-    if config.blog_show_publication_date:
-        metadata_components.append(
-            rx.text(formatted_date_val, color=Colors.text["content"], font_size="1rem")
-        )
+    metadata_components = _metadata_components(author_val, formatted_date_val)
 
     page_components: list[rx.Component] = [
         rx.heading(
@@ -132,61 +244,159 @@ def page_blog_post(
 
     page_components.extend(content_components)
 
-    page_components.append(
-        rx.link(
-            rx.text(get_translation(TRANSLATIONS, "back_to_blog", language)),
-            href=f"/{language}/blog/",
-            color=Colors.primary["500"],
-            font_size=FontSizes.regular,
-            font_weight="600",
-            text_decoration="none",
-            margin_top="3rem",
-            _hover={
-                "text_decoration": "underline",
-            },
+    if related:
+        page_components.append(
+            _related_posts_section(
+                [_related_post_link(listing, language) for listing in related],
+                language,
+            )
         )
+
+    page_components.append(_back_to_blog_link(language))
+
+    breadcrumb_items = get_blog_post_breadcrumbs(
+        language, title_val, post.get("slug", "")
     )
 
-    content_component = rx.vstack(
-        *page_components,
-        spacing="0",
-        align_items="start",
-        width="100%",
+    return _page_layout(
+        language,
+        [article_schema(post, language), breadcrumb_schema(breadcrumb_items)],
+        page_components,
     )
 
-    article_schema_component = article_schema(post, language)
 
-    breadcrumb_items = [
-        {
-            "name": BREADCRUMB_NAMES.get(language, {}).get("home", "Home"),
-            "url": f"{config.site_url}/{language}",
-        },
-        {
-            "name": BREADCRUMB_NAMES.get(language, {}).get("blog", "Blog"),
-            "url": f"{config.site_url}/{language}/blog/",
-        },
-        {
-            "name": title_val,
-            "url": f"{config.site_url}/{language}/blog/{post.get('slug', '')}/",
-        },
+def _build_dynamic_content_component(
+    block: ObjectVar[dict[str, Any]],
+) -> rx.Component | rx.Var:
+    """Build a content component from a content dict var at runtime."""
+    return rx.match(
+        block["type"],
+        (
+            "heading",
+            rx.match(
+                block["level"],
+                *[
+                    (level, blog_header(block["content"].to(str), level))
+                    for level in range(1, 7)
+                ],
+                blog_header(block["content"].to(str)),
+            ),
+        ),
+        ("paragraph", blog_paragraph(block["content"].to(str))),
+        (
+            "image",
+            blog_image(
+                src_fallback=block["src_fallback"].to(str),
+                alt=block["alt"].to(str),
+                src_avif=block["src_avif"].to(str),
+                src_webp=block["src_webp"].to(str),
+                caption=block["caption"].to(str),
+                width=block["width"].to(int),
+                height=block["height"].to(int),
+            ),
+        ),
+        (
+            "button",
+            rx.box(
+                button(label=block["label"].to(str), href=block["url"].to(str)),
+                display="flex",
+                justify_content="center",
+                width="100%",
+                margin_y="1.5rem",
+            ),
+        ),
+        ("list", blog_list(block["markdown"].to(str))),
+        rx.box(),
+    )
+
+
+@prioritize_lcp_image
+def page_blog_post_dynamic(language: str = "nl") -> rx.Component:
+    """
+    Create the shared blog post page of a language, rendered from state.
+
+    Used with ``config.blog_dynamic_routes``: one compiled page serves
+    every post of the language, filled in by BlogPostState.load_post.
+
+    Parameters
+    ----------
+    language : str
+        Current language code ("nl", "de", or "en")
+
+    Returns
+    -------
+    rx.Component
+        A fragment containing header, hero, blog post content section,
+        footer.
+    """
+    page_components: list[rx.Component] = [
+        rx.heading(
+            BlogPostState.title,
+            as_="h1",
+            font_size=FontSizes.section_title,
+            color=Colors.text["heading"],
+            margin_bottom=Spacing.blog_heading_margin_bottom,
+        )
     ]
-    breadcrumb_schema_component = breadcrumb_schema(breadcrumb_items)
 
-    return rx.fragment(
-        article_schema_component,
-        breadcrumb_schema_component,
-        header(language, page_key="blog"),
-        rx.box(
-            section_hero(language),
-            section(
-                container(
-                    content_component,
+    metadata_components: list[rx.Component] = []
+    if config.blog_show_author:
+        metadata_components.append(
+            rx.cond(
+                BlogPostState.author != "",
+                rx.hstack(
+                    rx.text(
+                        BlogPostState.author,
+                        color=Colors.text["content"],
+                        font_size="1rem",
+                    ),
+                    rx.text("•", color=Colors.text["content"], font_size="1rem"),
+                    spacing="2",
                 ),
-                padding_top="1em",
-                padding_bottom="2em",
+            )
+        )
+
+    if config.blog_show_publication_date:
+        metadata_components.append(
+            rx.text(
+                BlogPostState.formatted_date,
+                color=Colors.text["content"],
+                font_size="1rem",
+            )
+        )
+
+    if metadata_components:
+        page_components.append(
+            rx.hstack(
+                *metadata_components,
+                spacing="2",
+                wrap="wrap",
+                margin_bottom="2rem",
+            )
+        )
+
+    page_components.append(
+        rx.foreach(BlogPostState.content, _build_dynamic_content_component)
+    )
+    page_components.append(
+        rx.cond(
+            BlogPostState.has_related,
+            _related_posts_section(
+                [
+                    rx.foreach(
+                        BlogPostState.related,
+                        lambda listing: _related_post_link(listing, language),
+                    )
+                ],
+                language,
             ),
-            id="main-content",
-            role="main",
-        ),
-        footer(language),
+        )
     )
+    page_components.append(_back_to_blog_link(language))
+
+    schemas: list[rx.Component] = [
+        rx.el.script(BlogPostState.article_json_ld, type="application/ld+json"),
+        rx.el.script(BlogPostState.breadcrumb_json_ld, type="application/ld+json"),
+    ]
+
+    return _page_layout(language, schemas, page_components)
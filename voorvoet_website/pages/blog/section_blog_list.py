@@ -2,38 +2,159 @@
 
 import reflex as rx
 
+from ...models import BlogListingDict
 from ...theme import Colors, FontSizes
 from ...components import container, blog_card, section
+from ...translations import get_blog_category_route, get_blog_page_route
 from ...utils import get_translation
 
 
 TRANSLATIONS = {
     "nl": {
         "no_posts": "Nog geen blogposts beschikbaar.",
+        "previous": "← Vorige",
+        "next": "Volgende →",
+        "pagination": "Blog paginering",
     },
     "de": {
         "no_posts": "Noch keine Blogbeiträge verfügbar.",
+        "previous": "← Zurück",
+        "next": "Weiter →",
+        "pagination": "Blog-Seitennavigation",
     },
     "en": {
         "no_posts": "No blog posts available yet.",
+        "previous": "← Previous",
+        "next": "Next →",
+        "pagination": "Blog pagination",
     },
 }
 
 
-def section_blog_list(language: str, posts: list[dict] = []) -> rx.Component:
+def _page_link(label: str, href: str) -> rx.Component:
+    """Create a link to another blog overview page."""
+    return rx.link(
+        label,
+        href=href,
+        color=Colors.primary["500"],
+        font_size=FontSizes.regular,
+        font_weight="600",
+        text_decoration="none",
+        padding_x="0.5rem",
+        _hover={"text_decoration": "underline"},
+    )
+
+
+def _page_route(language: str, page: int, category_slug: str | None) -> str:
+    """Get the route of an overview page of the blog or of one category."""
+    if category_slug is None:
+        return get_blog_page_route(language, page)
+    return get_blog_category_route(language, category_slug, page)
+
+
+def _pagination(
+    language: str, page: int, total_pages: int, category_slug: str | None = None
+) -> rx.Component:
+    """
+    Create the navigation between blog overview pages.
+
+    Parameters
+    ----------
+    language : str
+        Current language code ("nl", "de", or "en")
+    page : int
+        1-based number of the current page
+    total_pages : int
+        Total number of overview pages
+    category_slug : str | None
+        Slug of the category the pages belong to, None for the full blog
+
+    Returns
+    -------
+    rx.Component
+        A nav element with previous/next links and a link per page.
+    """
+    items: list[rx.Component] = []
+
+    if page > 1:
+        items.append(
+            _page_link(
+                get_translation(TRANSLATIONS, "previous", language),
+                _page_route(language, page - 1, category_slug),
+            )
+        )
+
+    for number in range(1, total_pages + 1):
+        if number == page:
+            items.append(
+                rx.text(
+                    str(number),
+                    color=Colors.text["heading"],
+                    font_size=FontSizes.regular,
+                    font_weight="700",
+                    padding_x="0.5rem",
+                    custom_attrs={"aria-current": "page"},
+                )
+            )
+        else:
+            items.append(
+                _page_link(str(number), _page_route(language, number, category_slug))
+            )
+
+    if page < total_pages:
+        items.append(
+            _page_link(
+                get_translation(TRANSLATIONS, "next", language),
+                _page_route(language, page + 1, category_slug),
+            )
+        )
+
+    return rx.el.nav(
+        rx.hstack(
+            *items,
+            spacing="2",
+            wrap="wrap",
+            justify="center",
+            align="center",
+        ),
+        custom_attrs={
+            "aria-label": get_translation(TRANSLATIONS, "pagination", language)
+        },
+        width="100%",
+        margin_top="1rem",
+    )
+
+
+def section_blog_list(
+    language: str,
+    posts: list[BlogListingDict] = [],
+    page: int = 1,
+    total_pages: int = 1,
+    category_slug: str | None = None,
+) -> rx.Component:
     """
     Display a grid of blog post cards.
 
-    Creates a responsive layout that shows all blog posts in a vertical stack.
-    Each blog post card alternates its layout (flipped) for visual variety.
+    Creates a responsive layout that shows the blog posts of one overview
+    page in a vertical stack, followed by page navigation when there is more
+    than one page. Each blog post card alternates its layout (flipped) for
+    visual variety. Thumbnails load lazily; the hero above the list is the
+    image the page prioritizes.
     Displays an empty state message when no posts are available.
 
     Parameters
     ----------
     language : str
         Current language code ("nl", "de", or "en")
-    posts : list[dict]
-        List of blog post dictionaries to display
+    posts : list[BlogListingDict]
+        List of blog listing records to display
+    page : int
+        1-based number of the overview page (default: 1)
+    total_pages : int
+        Total number of overview pages (default: 1)
+    category_slug : str | None
+        Slug of the category the overview pages belong to, None for the
+        full blog (default: None)
 
     Returns
     -------
@@ -49,7 +170,9 @@ def section_blog_list(language: str, posts: list[dict] = []) -> rx.Component:
                     rx.foreach(
                         posts,
                         lambda post, index: blog_card(
-                            post, language=language, flip=index % 2 == 1
+                            post,
+                            language=language,
+                            flip=index % 2 == 1,
                         ),
                     ),
                     spacing="5",
@@ -64,6 +187,9 @@ def section_blog_list(language: str, posts: list[dict] = []) -> rx.Component:
                     align_items="center",
                 ),
             ),
+            _pagination(language, page, total_pages, category_slug)
+            if total_pages > 1
+            else rx.fragment(),
         ),
         background=Colors.backgrounds["white"],
     )
@@ -0,0 +1,108 @@
+"""Category navigation section for the blog overview pages."""
+
+import reflex as rx
+
+from ...models import BlogCategoryDict
+from ...theme import Colors, FontSizes
+from ...components import container, header, section
+from ...translations import ROUTE_MAPPINGS, get_blog_category_route
+from ...utils import get_translation
+
+
+TRANSLATIONS = {
+    "nl": {
+        "all_posts": "Alle artikelen",
+        "categories": "Blog categorieën",
+    },
+    "de": {
+        "all_posts": "Alle Artikel",
+        "categories": "Blog-Kategorien",
+    },
+    "en": {
+        "all_posts": "All articles",
+        "categories": "Blog categories",
+    },
+}
+
+
+def _category_link(label: str, href: str, active: bool) -> rx.Component:
+    """Create a pill shaped link to a category overview page."""
+    return rx.link(
+        label,
+        href=href,
+        color=Colors.backgrounds["white"] if active else Colors.primary["500"],
+        background=Colors.primary["500"] if active else "transparent",
+        border=f"1px solid {Colors.primary['500']}",
+        border_radius="999px",
+        padding_x="1rem",
+        padding_y="0.25rem",
+        font_size=FontSizes.regular,
+        font_weight="600",
+        text_decoration="none",
+        custom_attrs={"aria-current": "page"} if active else {},
+        _hover={"text_decoration": "underline"},
+    )
+
+
+def section_categories(
+    language: str,
+    categories: list[BlogCategoryDict],
+    category: BlogCategoryDict | None = None,
+) -> rx.Component:
+    """
+    Display links to the category overview pages of the blog.
+
+    On a category page the category name is shown as page heading above
+    the links and the link of that category is highlighted.
+
+    Parameters
+    ----------
+    language : str
+        Current language code ("nl", "de", or "en")
+    categories : list[BlogCategoryDict]
+        All categories of the language
+    category : BlogCategoryDict | None
+        The category of the current page, None on the general overview
+
+    Returns
+    -------
+    rx.Component
+        A section with the category links, or an empty fragment if the
+        language has no categories.
+    """
+    if not categories:
+        return rx.fragment()
+
+    links = [
+        _category_link(
+            get_translation(TRANSLATIONS, "all_posts", language),
+            ROUTE_MAPPINGS[language]["blog"],
+            active=category is None,
+        )
+    ]
+    links.extend(
+        _category_link(
+            item["name"],
+            get_blog_category_route(language, item["slug"]),
+            active=category is not None and item["slug"] == category["slug"],
+        )
+        for item in categories
+    )
+
+    return section(
+        container(
+            header(category["name"], level=1, margin_bottom=10)
+            if category is not None
+            else rx.fragment(),
+            rx.el.nav(
+                rx.hstack(*links, spacing="2", wrap="wrap", align="center"),
+                custom_attrs={
+                    "aria-label": get_translation(TRANSLATIONS, "categories", language)
+                },
+                width="100%",
+            ),
+        ),
+        background=Colors.backgrounds["white"],
+        padding=0,
+        padding_top=10,
+    )
@@ -6,11 +6,12 @@ from .section_hero import section_hero
 from .section_starter import section_starter
 from .section_contact_form import section_contact_form
 from ..shared_sections import footer, header
-from ...components import toast, breadcrumb_schema
+from ...components import toast, breadcrumb_schema, prioritize_lcp_image
 from ...translations import BREADCRUMB_NAMES
 from ...config import config
 
 
+@prioritize_lcp_image
 def page_contact(language: str = "nl") -> rx.Component:
     """
     Create the complete contact page with all sections.
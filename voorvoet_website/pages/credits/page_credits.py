@@ -5,11 +5,12 @@ import reflex as rx
 from .section_hero import section_hero
 from .section_content import section_content
 from ..shared_sections import footer, header
-from ...components import breadcrumb_schema
+from ...components import breadcrumb_schema, prioritize_lcp_image
 from ...translations import BREADCRUMB_NAMES
 from ...config import config
 
 
+@prioritize_lcp_image
 def page_credits(language: str = "nl") -> rx.Component:
     """
     Create the complete credits page with all sections.
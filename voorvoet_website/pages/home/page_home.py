@@ -9,9 +9,14 @@ from .section_introduction import section_introduction
 from .section_information import section_information
 from .section_locations import section_locations
 from ..shared_sections import footer, header
-from ...components import organization_brand_schema, organization_schema
+from ...components import (
+    organization_brand_schema,
+    organization_schema,
+    prioritize_lcp_image,
+)
 
 
+@prioritize_lcp_image
 def page_home(language: str = "nl") -> rx.Component:
     """
     Create the complete home page with all sections.
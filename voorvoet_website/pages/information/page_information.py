@@ -12,11 +12,12 @@ from .section_bedrijfspodotherapie import section_bedrijfspodotherapie
 from .section_risicovoet import section_risicovoet
 
 from ..shared_sections import footer, header
-from ...components import breadcrumb_schema
+from ...components import breadcrumb_schema, prioritize_lcp_image
 from ...translations import BREADCRUMB_NAMES
 from ...config import config
 
 
+@prioritize_lcp_image
 def page_information(language: str = "nl") -> rx.Component:
     """
     Create the complete information page with all sections.
@@ -5,8 +5,10 @@ import reflex as rx
 from .section_hero import section_hero
 from .section_content import section_content
 from ..shared_sections import footer, header
+from ...components import prioritize_lcp_image
 
 
+@prioritize_lcp_image
 def page_not_found() -> rx.Component:
     """
     Create the complete 404 error page.
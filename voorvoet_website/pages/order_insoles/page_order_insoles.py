@@ -7,12 +7,13 @@ from .section_starter import section_starter
 from .section_order_form import section_order_form
 
 from ..shared_sections import footer, header
-from ...components import toast, breadcrumb_schema
+from ...components import toast, breadcrumb_schema, prioritize_lcp_image
 from ...translations import BREADCRUMB_NAMES
 from ...config import config
 from ...models.pricing import PricingData
 
 
+@prioritize_lcp_image
 def page_order_insoles(language: str, pricing: PricingData) -> rx.Component:
     """
     Create the complete order insoles page with all sections.
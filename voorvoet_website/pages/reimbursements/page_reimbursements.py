@@ -8,12 +8,13 @@ from .section_reimbursement_table import section_reimbursement_table
 from .section_pricing_table import section_pricing_table
 
 from ..shared_sections import footer, header
-from ...components import breadcrumb_schema
+from ...components import breadcrumb_schema, prioritize_lcp_image
 from ...translations import BREADCRUMB_NAMES
 from ...config import config
 from ...models.pricing import PricingData
 
 
+@prioritize_lcp_image
 def page_reimbursements(language: str, pricing: PricingData) -> rx.Component:
     """
     Create the complete reimbursements page with all sections.
@@ -1,14 +1,18 @@
 """Section displaying insurance reimbursement information in a searchable table."""
 
-import reflex as rx
 import json
-from pathlib import Path
+from typing import Any
+
+import reflex as rx
+from reflex.config import get_config
 
 from ...theme import Colors
 from ...components import section, container, header
 from ...utils import get_translation
-from ...states import WebsiteState
-from ...config import config
+from ...services.reimbursement_service import SORT_FIELDS, load_reimbursement_data
+
+
+PAGE_LIMIT = 12
 
 
 TRANSLATIONS = {
@@ -75,13 +79,9 @@ TRANSLATIONS = {
 }
 
 
-def load_reimbursement_data() -> tuple[list[str], list[list[str]]]:
+def _grid_language(language: str) -> dict[str, Any]:
     """
-    Load reimbursement data from JSON file and convert to table format.
-
-    Reads the 2025 reimbursement data from the data directory and transforms
-    it from JSON dictionary format to a list of lists suitable for display
-    in a data table component.
+    Build the gridjs language labels for the table.
 
     Parameters
     ----------
@@ -90,28 +90,68 @@ def load_reimbursement_data() -> tuple[list[str], list[list[str]]]:
 
     Returns
     -------
-    tuple[list[str], list[list[str]]]
-        A tuple containing:
-        - Column headers as a list of strings
-        - Table rows as a list of lists, where each inner list represents
-          one row with [verzekeraar, pakket, vergoeding]
+    dict[str, Any]
+        Labels in the structure of the gridjs ``language`` option
     """
-    data_path = (
-        Path(__file__).parent.parent.parent
-        / "data"
-        / "reimbursements"
-        / config.reimbursements_data_file
-    )
-    with open(data_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
 
-    columns = ["Verzekeraar", "Pakket", "Vergoeding"]
+    def t(key: str) -> str:
+        return get_translation(TRANSLATIONS, key, language)
+
+    return {
+        "search": {"placeholder": t("search_placeholder")},
+        "sort": {"sortAsc": t("sort_asc"), "sortDesc": t("sort_desc")},
+        "pagination": {
+            "previous": t("previous"),
+            "next": t("next"),
+            "showing": t("showing"),
+            "of": t("of"),
+            "to": t("to"),
+            "results": t("results"),
+        },
+        "loading": t("loading"),
+        "noRecordsFound": t("no_records"),
+        "error": t("error"),
+    }
+
+
+def _grid_server_options() -> dict[str, rx.Var]:
+    """
+    Build the gridjs options that fetch rows from the reimbursements API.
+
+    Search, sort and pagination each extend the request URL, so the browser
+    only downloads the rows of the visible page.
 
-    rows = [
-        [item["verzekeraar"], item["pakket"], item["vergoeding"]] for item in data[1:]
-    ]
+    Returns
+    -------
+    dict[str, rx.Var]
+        The gridjs ``server``, ``search``, ``sort`` and ``pagination``
+        options as JavaScript expressions
+    """
+    url = json.dumps(f"{get_config().api_url}/api/reimbursements?")
+    fields = json.dumps(list(SORT_FIELDS))
 
-    return columns, rows
+    return {
+        "server": rx.Var(
+            f"({{url: {url}, "
+            "then: (data) => data.results.map("
+            "(row) => [row.insurer, row.package, row.reimbursement]), "
+            "total: (data) => data.total})"
+        ),
+        "search": rx.Var(
+            "({server: {url: (prev, keyword) => "
+            "`${prev}&q=${encodeURIComponent(keyword)}`}})"
+        ),
+        "sort": rx.Var(
+            "({multiColumn: false, server: {url: (prev, columns) => "
+            "columns.length === 0 ? prev : "
+            '`${prev}&sort=${columns[0].direction === 1 ? "" : "-"}'
+            f"${{{fields}[columns[0].index]}}`}}}})"
+        ),
+        "pagination": rx.Var(
+            f"({{limit: {PAGE_LIMIT}, server: {{url: (prev, page, limit) => "
+            "`${prev}&page=${page + 1}&limit=${limit}`}})"
+        ),
+    }
 
 
 def section_reimbursement_table(language: str) -> rx.Component:
@@ -120,9 +160,9 @@ def section_reimbursement_table(language: str) -> rx.Component:
 
     Displays a comprehensive, searchable table of insurance providers
     and their reimbursement amounts for podiatry services in 2025.
-    The table includes built-in search, sort, and pagination functionality
-    for easy navigation. Features alternating row colors (white and light
-    green) for better readability.
+    Search, sort, and pagination are answered by the reimbursements API,
+    so only the visible rows are downloaded. Features alternating row
+    colors (white and light green) for better readability.
 
     Parameters
     ----------
@@ -135,7 +175,7 @@ def section_reimbursement_table(language: str) -> rx.Component:
         A section component containing a data table with insurance
         reimbursement information and a disclaimer note.
     """
-    columns, data = load_reimbursement_data()
+    columns = load_reimbursement_data()["columns"]
 
     table_styles = {
         ".gridjs-th": {
@@ -243,95 +283,13 @@ def section_reimbursement_table(language: str) -> rx.Component:
                 ),
             ),
             rx.box(
-                rx.cond(
-                    WebsiteState.current_language == "nl",
-                    rx.data_table(
-                        data=data,
-                        columns=columns,
-                        search=True,
-                        sort=True,
-                        pagination={"limit": 12},
-                        resizable=False,
-                        custom_attrs={
-                            "language": {
-                                "search": {"placeholder": "Typ om te zoeken..."},
-                                "sort": {
-                                    "sortAsc": "Kolom oplopend sorteren",
-                                    "sortDesc": "Kolom aflopend sorteren",
-                                },
-                                "pagination": {
-                                    "previous": "Vorige",
-                                    "next": "Volgende",
-                                    "showing": "Tonen",
-                                    "of": "van",
-                                    "to": "tot",
-                                    "results": "resultaten",
-                                },
-                                "loading": "Laden...",
-                                "noRecordsFound": "Geen resultaten gevonden",
-                                "error": "Er is een fout opgetreden bij het ophalen van de gegevens",
-                            }
-                        },
-                    ),
-                    rx.cond(
-                        WebsiteState.current_language == "de",
-                        rx.data_table(
-                            data=data,
-                            columns=columns,
-                            search=True,
-                            sort=True,
-                            pagination={"limit": 12},
-                            resizable=False,
-                            custom_attrs={
-                                "language": {
-                                    "search": {"placeholder": "Zum Suchen tippen..."},
-                                    "sort": {
-                                        "sortAsc": "Spalte aufsteigend sortieren",
-                                        "sortDesc": "Spalte absteigend sortieren",
-                                    },
-                                    "pagination": {
-                                        "previous": "Zurück",
-                                        "next": "Weiter",
-                                        "showing": "Anzeigen",
-                                        "of": "von",
-                                        "to": "bis",
-                                        "results": "Ergebnisse",
-                                    },
-                                    "loading": "Lädt...",
-                                    "noRecordsFound": "Keine Ergebnisse gefunden",
-                                    "error": "Beim Abrufen der Daten ist ein Fehler aufgetreten",
-                                }
-                            },
-                        ),
-                        rx.data_table(
-                            data=data,
-                            columns=columns,
-                            search=True,
-                            sort=True,
-                            pagination={"limit": 12},
-                            resizable=False,
-                            custom_attrs={
-                                "language": {
-                                    "search": {"placeholder": "Type to search..."},
-                                    "sort": {
-                                        "sortAsc": "Sort column ascending",
-                                        "sortDesc": "Sort column descending",
-                                    },
-                                    "pagination": {
-                                        "previous": "Previous",
-                                        "next": "Next",
-                                        "showing": "Showing",
-                                        "of": "of",
-                                        "to": "to",
-                                        "results": "results",
-                                    },
-                                    "loading": "Loading...",
-                                    "noRecordsFound": "No results found",
-                                    "error": "An error occurred while fetching the data",
-                                }
-                            },
-                        ),
-                    ),
+                rx.data_table(
+                    columns=columns,
+                    resizable=False,
+                    custom_attrs={
+                        "language": _grid_language(language),
+                        **_grid_server_options(),
+                    },
                 ),
                 width="100%",
                 margin_top="2rem",
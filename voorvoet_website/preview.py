@@ -0,0 +1,58 @@
+"""Single blog post preview app.
+
+Selected by ``rxconfig.py`` instead of the full site when
+``config.blog_preview_file`` is set (see ``make preview``). Only that file is
+parsed and only its route is compiled, so the preview starts without
+compiling the pages of every language. The post is rendered with the shared
+blog post template and read from the blog store on every page load, while the
+blog watcher reloads it when the file or its images change: saving the file
+and refreshing the browser shows the edit without another compile.
+"""
+
+from pathlib import Path
+
+import reflex as rx
+
+from .config import config
+from .pages import page_blog_post_dynamic
+from .services.blog_service import load_preview_post
+from .services.blog_watcher import blog_watcher_lifespan
+from .states import BlogPostState
+from .theme import APP_STYLE, STYLESHEETS
+from .translations import ROUTE_MAPPINGS, get_dynamic_blog_post_meta_tags
+from .utils import wrap_with_lang_script
+
+if not config.blog_preview_file:
+    raise RuntimeError("Set BLOG_PREVIEW_FILE to the blog post file to preview")
+
+preview_file = Path(config.blog_preview_file)
+post = load_preview_post(preview_file)
+language = post["language"]
+route = f"{ROUTE_MAPPINGS[language]['blog']}/{post['slug']}"
+
+
+def _page() -> rx.Component:
+    return wrap_with_lang_script(language, page_blog_post_dynamic(language=language))
+
+
+app = rx.App(
+    html_lang=language,
+    stylesheets=STYLESHEETS,
+    style=APP_STYLE,
+)
+app.register_lifespan_task(blog_watcher_lifespan)
+
+app.add_page(
+    component=_page,
+    route=route,
+    title=f"{BlogPostState.title} - VoorVoet Blog",
+    meta=get_dynamic_blog_post_meta_tags(
+        language,
+        post_title=BlogPostState.title,
+        post_summary=BlogPostState.summary,
+        route=BlogPostState.route,
+        image_url=BlogPostState.image_url,
+        hreflang_links=BlogPostState.hreflang_links,
+    ),
+    on_load=BlogPostState.load_post(language),  # type: ignore[operator]
+)
@@ -0,0 +1,166 @@
+"""In-memory index of image assets, replacing per-image filesystem probes."""
+
+from pathlib import Path
+import os
+from typing import Optional
+
+from ..models.asset_index import AssetIndex
+
+
+_asset_index: Optional[AssetIndex] = None
+_assets_dir_override: Optional[Path] = None
+
+
+def _get_assets_dir() -> Path:
+    """Get path to the public assets directory."""
+    if _assets_dir_override is not None:
+        return _assets_dir_override
+
+    current_file = Path(__file__)
+    project_root = current_file.parent.parent.parent
+    return project_root / "assets"
+
+
+def set_assets_dir(assets_dir: Optional[Path]) -> None:
+    """
+    Serve assets from another directory, e.g., a synthetic benchmark corpus.
+
+    Parameters
+    ----------
+    assets_dir : Optional[Path]
+        Directory containing ``images/``, or None to restore the default
+    """
+    global _assets_dir_override
+    _assets_dir_override = assets_dir
+    invalidate_asset_index()
+
+
+def load_asset_index(force_reload: bool = False) -> AssetIndex:
+    """
+    Walk ``assets/images`` once and index the available files.
+
+    Each file is stat'ed once during the walk, so lookups of modification
+    times (image dimensions, blog cache validation) need no further system
+    calls. Results are cached for subsequent calls until the index is invalidated
+    or force_reload is True.
+
+    Parameters
+    ----------
+    force_reload : bool
+        If True, rescan the assets directory even if cached (default: False)
+
+    Returns
+    -------
+    AssetIndex
+        Dictionary containing:
+        - formats: base URL path → available file extensions
+        - directories: directory URL path → file names
+        - mtimes: file URL path → modification time in nanoseconds
+    """
+    global _asset_index
+
+    if _asset_index is not None and not force_reload:
+        return _asset_index
+
+    assets_dir = _get_assets_dir()
+    formats: dict[str, set[str]] = {}
+    directories: dict[str, tuple[str, ...]] = {}
+    mtimes: dict[str, int] = {}
+
+    for dir_path, _, file_names in os.walk(assets_dir / "images"):
+        relative_dir = Path(dir_path).relative_to(assets_dir).as_posix()
+        dir_url = f"/{relative_dir}"
+        directories[dir_url] = tuple(sorted(file_names))
+
+        for file_name in file_names:
+            stem, extension = os.path.splitext(file_name)
+            formats.setdefault(f"{dir_url}/{stem}", set()).add(extension)
+            try:
+                mtime = os.stat(os.path.join(dir_path, file_name)).st_mtime_ns
+            except OSError:
+                continue
+            mtimes[f"{dir_url}/{file_name}"] = mtime
+
+    _asset_index = {
+        "formats": {base: frozenset(exts) for base, exts in formats.items()},
+        "directories": directories,
+        "mtimes": mtimes,
+    }
+
+    return _asset_index
+
+
+def invalidate_asset_index() -> None:
+    """Drop the cached index so the next lookup rescans the assets directory."""
+    global _asset_index
+    _asset_index = None
+
+
+def get_available_formats(url_path: str) -> frozenset[str]:
+    """
+    Get the file extensions available for an asset, ignoring its own extension.
+
+    Parameters
+    ----------
+    url_path : str
+        Asset URL path with or without extension, e.g., "/images/a/b.jpg"
+
+    Returns
+    -------
+    frozenset[str]
+        Available extensions, e.g., frozenset({".jpg", ".avif", ".webp"})
+    """
+    base_path = os.path.splitext(url_path)[0]
+    return load_asset_index()["formats"].get(base_path, frozenset())
+
+
+def asset_exists(url_path: str) -> bool:
+    """
+    Check whether an asset exists below ``assets/``.
+
+    Parameters
+    ----------
+    url_path : str
+        Asset URL path including extension, e.g., "/images/a/b.jpg"
+
+    Returns
+    -------
+    bool
+        True if the file is present in the index
+    """
+    base_path, extension = os.path.splitext(url_path)
+    return extension in load_asset_index()["formats"].get(base_path, frozenset())
+
+
+def list_directory(dir_url: str) -> tuple[str, ...]:
+    """
+    List the file names directly inside an asset directory.
+
+    Parameters
+    ----------
+    dir_url : str
+        Directory URL path, e.g., "/images/page_blog/001_post"
+
+    Returns
+    -------
+    tuple[str, ...]
+        Sorted file names, empty if the directory does not exist
+    """
+    return load_asset_index()["directories"].get(dir_url.rstrip("/"), ())
+
+
+def get_asset_mtime(url_path: str) -> Optional[int]:
+    """
+    Get the modification time of an asset as recorded by the last walk.
+
+    Parameters
+    ----------
+    url_path : str
+        Asset URL path including extension, e.g., "/images/a/b.jpg"
+
+    Returns
+    -------
+    Optional[int]
+        Modification time in nanoseconds, or None if the file is not indexed
+    """
+    return load_asset_index()["mtimes"].get(url_path)
@@ -1,12 +1,40 @@
 """Blog service for loading and managing blog posts from the file system."""
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import frontmatter
-
-from ..models.blog_post import BlogPostDict, parse_datetime, format_date
-from .content_parser import parse_blog_content
+from typing import Callable
+import hashlib
+import json
+import os
+import re
+
+from ..models.blog_content import ImageBlock, content_block_from_dict
+from ..models.blog_post import (
+    BlogCategoryDict,
+    BlogListingDict,
+    BlogPostDict,
+    parse_datetime,
+    format_date,
+)
+from ..config import config
+from .asset_index import (
+    asset_exists,
+    get_asset_mtime,
+    get_available_formats,
+    list_directory,
+)
+from .content_parser import PARSER_VERSION, parse_blog_content
+from .frontmatter_parser import parse_frontmatter
+from .text_analysis import fold_diacritics
 
 _posts_cache: dict[str, list[BlogPostDict]] = {}
+_listings_cache: dict[str, list[BlogListingDict]] = {}
+_slug_index: dict[str, dict[str, BlogPostDict]] = {}
+_story_index: dict[str, dict[str, str]] | None = None
+_category_index: dict[str, dict[str, BlogCategoryDict]] | None = None
+
+PostChangeHook = Callable[[str, BlogPostDict | None, BlogPostDict | None], None]
+_reload_hooks: list[tuple[Callable[[str], None], PostChangeHook | None]] = []
 
 
 def _get_blog_content_dir() -> Path:
@@ -16,14 +44,122 @@ def _get_blog_content_dir() -> Path:
     return project_root / "voorvoet_website" / "data" / "blog_content"
 
 
-def _resolve_thumbnail_path(filename: str, thumbnail_filename: str) -> str:
-    """Resolve thumbnail path with fallback to default image."""
+def _get_cache_dir() -> Path:
+    """Get the path to the on-disk cache of parsed blog posts."""
     current_file = Path(__file__)
     project_root = current_file.parent.parent.parent
+    return project_root / config.blog_cache_dir
+
+
+def _compute_cache_key(source: bytes, filename: str) -> str:
+    """
+    Compute the cache key of a blog post source file.
+
+    The key covers the parser version, the raw file content and the names of
+    the image files available for the post (taken from the asset index), as
+    these decide which image paths the post resolves to. Adding an image to
+    ``assets/images/page_blog/<filename>/`` therefore invalidates the cached
+    post just like editing the markdown does. Replaced images are detected
+    by _read_cached_post(), which checks the images the post resolved.
+
+    Parameters
+    ----------
+    source : bytes
+        Encoded content of the markdown file (including frontmatter)
+    filename : str
+        Blog post filename without language and extension
+
+    Returns
+    -------
+    str
+        Hex encoded SHA-256 digest
+    """
+    hasher = hashlib.sha256()
+    hasher.update(PARSER_VERSION.encode("utf-8"))
+    hasher.update(b"\0")
+    hasher.update(source)
+    hasher.update(b"\0")
+    hasher.update(
+        "\n".join(list_directory(f"/images/page_blog/{filename}")).encode("utf-8")
+    )
+    return hasher.hexdigest()
+
+
+def _get_image_mtimes(post: BlogPostDict) -> dict[str, int | None]:
+    """
+    Get the modification times of the local images a parsed post resolved.
+
+    Covers the thumbnail and every content image, including absolute
+    ``/images/...`` sources and the default filler, as the parsed post
+    records their dimensions. Times come from the asset index.
+    """
+    image_paths = [post["thumbnail_fallback"]] + [
+        block.src_fallback
+        for block in post["content_objects"]
+        if isinstance(block, ImageBlock)
+        and not block.src_fallback.startswith(("http://", "https://"))
+    ]
+    return {path: get_asset_mtime(path) for path in image_paths}
+
+
+def _read_cached_post(file_path: Path, cache_key: str) -> BlogPostDict | None:
+    """
+    Return the cached post for a source file if it is still up to date.
+
+    The entry must match the cache key, and every image the post resolved
+    must still have the modification time recorded when it was parsed.
+    """
+    cache_file = _get_cache_dir() / f"{file_path.stem}.json"
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(entry, dict) or entry.get("key") != cache_key:
+        return None
+    image_mtimes = entry.get("images")
+    if not isinstance(image_mtimes, dict) or any(
+        get_asset_mtime(path) != mtime for path, mtime in image_mtimes.items()
+    ):
+        return None
+
+    post: BlogPostDict = entry["post"]
+    post["content_objects"] = tuple(
+        content_block_from_dict(block) for block in entry["post"]["content_objects"]
+    )
+    return post
+
+
+def _write_cached_post(file_path: Path, cache_key: str, post: BlogPostDict) -> None:
+    """Store a parsed post on disk, replacing any previous entry atomically."""
+    cache_dir = _get_cache_dir()
+    cache_file = cache_dir / f"{file_path.stem}.json"
+    tmp_file = cache_dir / f".{file_path.stem}.{os.getpid()}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            entry = {
+                "key": cache_key,
+                "images": _get_image_mtimes(post),
+                "post": {
+                    **post,
+                    "content_objects": [
+                        block.to_dict() for block in post["content_objects"]
+                    ],
+                },
+            }
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"Warning: Could not write blog cache {cache_file}: {e}")
+
+
+def _resolve_thumbnail_path(filename: str, thumbnail_filename: str) -> str:
+    """Resolve thumbnail path with fallback to default image."""
     thumbnail_path = f"/images/page_blog/{filename}/{thumbnail_filename}"
-    file_system_path = project_root / f"assets{thumbnail_path}"
 
-    if not file_system_path.exists():
+    if not asset_exists(thumbnail_path):
         thumbnail_path = "/images/page_blog/default_thumbnail.jpg"
 
     return thumbnail_path
@@ -37,30 +173,28 @@ def _build_thumbnail_paths(
 
     Returns tuple of (fallback, avif, webp). Empty string if format doesn't exist.
     """
-    current_file = Path(__file__)
-    project_root = current_file.parent.parent.parent
-
     url_path = Path(thumbnail_url)
     base_path = str(url_path.with_suffix(""))
-    asset_base = base_path.lstrip("/")
+    available_formats = get_available_formats(thumbnail_url)
 
     avif_path = ""
-    if (project_root / f"assets/{asset_base}.avif").exists():
+    if ".avif" in available_formats:
         avif_path = f"{base_path}.avif"
 
     webp_path = ""
-    if (project_root / f"assets/{asset_base}.webp").exists():
+    if ".webp" in available_formats:
         webp_path = f"{base_path}.webp"
 
     return thumbnail_url, avif_path, webp_path
 
 
-def parse_blog_post(file_path: Path) -> BlogPostDict | None:
+def parse_blog_post(file_path: Path, source: str | None = None) -> BlogPostDict | None:
     """Parse a single blog post markdown file into a BlogPostDict."""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            metadata_raw, content = frontmatter.parse(f.read())
-        metadata = {str(key): str(value) for key, value in metadata_raw.items()}
+        if source is None:
+            with open(file_path, "r", encoding="utf-8") as f:
+                source = f.read()
+        metadata, content = parse_frontmatter(source)
 
         filename, language = (part for part in file_path.stem.rsplit(".", 1))
         story_number = filename.split("_")[0]
@@ -108,6 +242,220 @@ def parse_blog_post(file_path: Path) -> BlogPostDict | None:
         raise ValueError(f"Failed to parse blog post {file_path}: {e}") from e
 
 
+def load_blog_post(
+    file_path: Path, use_cache: bool | None = None
+) -> BlogPostDict | None:
+    """
+    Load a single blog post, using the on-disk parse cache when possible.
+
+    Parameters
+    ----------
+    file_path : Path
+        Path to the ``*.{lang}.md`` source file
+    use_cache : bool | None
+        Whether to read from and write to the on-disk cache. Defaults to
+        ``config.blog_cache_enabled``.
+
+    Returns
+    -------
+    BlogPostDict | None
+        The parsed blog post
+    """
+    if use_cache is None:
+        use_cache = config.blog_cache_enabled
+
+    if not use_cache:
+        return parse_blog_post(file_path)
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        source = f.read()
+    filename = file_path.stem.rsplit(".", 1)[0]
+    cache_key = _compute_cache_key(source.encode("utf-8"), filename)
+
+    cached_post = _read_cached_post(file_path, cache_key)
+    if cached_post is not None:
+        return cached_post
+
+    post = parse_blog_post(file_path, source=source)
+    if post:
+        _write_cached_post(file_path, cache_key, post)
+    return post
+
+
+def load_blog_posts(
+    file_paths: list[Path],
+    parallel: bool | None = None,
+    use_cache: bool | None = None,
+) -> list[BlogPostDict]:
+    """
+    Load several blog posts, optionally parsing them in a process pool.
+
+    In parallel mode the on-disk cache is consulted in the calling process
+    and only the cache misses are sent to the worker processes, so a warm
+    cache never pays for starting the pool.
+
+    Parameters
+    ----------
+    file_paths : list[Path]
+        Paths to the ``*.{lang}.md`` source files
+    parallel : bool | None
+        Parse cache misses in a process pool. Defaults to
+        ``config.blog_parallel_loading``.
+    use_cache : bool | None
+        Whether to use the on-disk cache. Defaults to
+        ``config.blog_cache_enabled``.
+
+    Returns
+    -------
+    list[BlogPostDict]
+        Parsed posts in the order of ``file_paths`` (unsorted)
+    """
+    if parallel is None:
+        parallel = config.blog_parallel_loading
+    if use_cache is None:
+        use_cache = config.blog_cache_enabled
+
+    if not parallel or len(file_paths) < 2:
+        return [
+            post
+            for file_path in file_paths
+            if (post := load_blog_post(file_path, use_cache=use_cache))
+        ]
+
+    results: list[BlogPostDict | None] = [None] * len(file_paths)
+    miss_indices: list[int] = []
+    miss_sources: list[str] = []
+    miss_keys: list[str] = []
+
+    for index, file_path in enumerate(file_paths):
+        with open(file_path, "r", encoding="utf-8") as f:
+            source = f.read()
+
+        if use_cache:
+            filename = file_path.stem.rsplit(".", 1)[0]
+            cache_key = _compute_cache_key(source.encode("utf-8"), filename)
+            cached_post = _read_cached_post(file_path, cache_key)
+            if cached_post is not None:
+                results[index] = cached_post
+                continue
+            miss_keys.append(cache_key)
+
+        miss_indices.append(index)
+        miss_sources.append(source)
+
+    if miss_indices:
+        workers = config.blog_parallel_workers or os.cpu_count() or 1
+        chunksize = max(1, len(miss_indices) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed_posts = executor.map(
+                parse_blog_post,
+                [file_paths[index] for index in miss_indices],
+                miss_sources,
+                chunksize=chunksize,
+            )
+            for position, post in enumerate(parsed_posts):
+                index = miss_indices[position]
+                results[index] = post
+                if use_cache and post:
+                    _write_cached_post(file_paths[index], miss_keys[position], post)
+
+    return [post for post in results if post]
+
+
+def register_reload_hook(
+    hook: Callable[[str], None], on_post_change: PostChangeHook | None = None
+) -> None:
+    """
+    Register a callback to run whenever the posts of a language are (re)loaded.
+
+    Services that cache data derived from the posts (search indexes, feeds,
+    ...) use this to drop their caches. The hook receives the language code.
+
+    Parameters
+    ----------
+    hook : Callable[[str], None]
+        Callback receiving the language code of the reloaded posts
+    on_post_change : PostChangeHook | None
+        Optional callback for a single added, changed or removed post,
+        receiving (language, old_post, new_post). Services that can update
+        their data incrementally provide it; without it, ``hook`` runs.
+    """
+    if all(registered != hook for registered, _ in _reload_hooks):
+        _reload_hooks.append((hook, on_post_change))
+
+
+def _invalidate_derived_data(language: str) -> None:
+    """Drop data derived from the posts of a language after they (re)load."""
+    global _story_index, _category_index
+
+    _listings_cache.pop(language, None)
+    _slug_index.pop(language, None)
+    _story_index = None
+    _category_index = None
+
+    for hook, _ in _reload_hooks:
+        hook(language)
+
+
+def _notify_post_change(
+    language: str, old_post: BlogPostDict | None, new_post: BlogPostDict | None
+) -> None:
+    """Update data derived from the posts of a language after one post changed."""
+    global _story_index, _category_index
+
+    _listings_cache.pop(language, None)
+    _slug_index.pop(language, None)
+    _story_index = None
+    _category_index = None
+
+    for hook, on_post_change in _reload_hooks:
+        if on_post_change is None:
+            hook(language)
+        else:
+            on_post_change(language, old_post, new_post)
+
+
+def reload_post_file(file_path: Path) -> bool:
+    """
+    Re-parse a single post file and swap it into the loaded posts.
+
+    A deleted file removes its post. The post list of the language is
+    replaced as a whole, so readers never see a partially updated list.
+    Languages that were not loaded yet are left alone.
+
+    Parameters
+    ----------
+    file_path : Path
+        Path to the ``*.{lang}.md`` source file
+
+    Returns
+    -------
+    bool
+        True if the loaded posts changed
+    """
+    filename, language = file_path.stem.rsplit(".", 1)
+    posts = _posts_cache.get(language)
+    if posts is None:
+        return False
+
+    old_post = next((post for post in posts if post["filename"] == filename), None)
+    new_post = load_blog_post(file_path) if file_path.exists() else None
+    if old_post is None and new_post is None:
+        return False
+    if old_post == new_post:
+        return False
+
+    updated_posts = [post for post in posts if post is not old_post]
+    if new_post:
+        updated_posts.append(new_post)
+    updated_posts.sort(key=lambda p: p["datetime_iso"], reverse=True)
+
+    _posts_cache[language] = updated_posts
+    _notify_post_change(language, old_post, new_post)
+
+    return True
+
+
 def load_all_posts(
     force_reload: bool = False,
     language: str | None = None,
@@ -121,7 +469,6 @@ def load_all_posts(
     if language in _posts_cache and not force_reload:
         return _posts_cache[language]
 
-    posts = []
     blog_dir = _get_blog_content_dir()
 
     if not blog_dir.exists():
@@ -129,23 +476,317 @@ def load_all_posts(
         return []
 
     pattern = f"*.{language}.md"
-    for file_path in blog_dir.glob(pattern):
-        post = parse_blog_post(file_path)
-        if post:
-            posts.append(post)
+    posts = load_blog_posts(sorted(blog_dir.glob(pattern)))
 
     posts.sort(key=lambda p: p["datetime_iso"], reverse=True)
     _posts_cache[language] = posts
+    _invalidate_derived_data(language)
 
     return posts
 
 
 def load_all_blog_posts_dict() -> dict[str, list[BlogPostDict]]:
-    """Load all blog posts for all languages as BlogPostDict dictionaries."""
+    """
+    Load all blog posts for all languages as BlogPostDict dictionaries.
+
+    When ``config.blog_parallel_loading`` is enabled, the files of all
+    languages that are not cached yet are parsed together in one process
+    pool instead of one language at a time.
+    """
     languages = ["nl", "en", "de"]
     result: dict[str, list[BlogPostDict]] = {}
 
+    missing_languages = [lang for lang in languages if lang not in _posts_cache]
+    blog_dir = _get_blog_content_dir()
+
+    if config.blog_parallel_loading and missing_languages and blog_dir.exists():
+        file_paths = [
+            file_path
+            for lang in missing_languages
+            for file_path in sorted(blog_dir.glob(f"*.{lang}.md"))
+        ]
+        posts_by_language: dict[str, list[BlogPostDict]] = {
+            lang: [] for lang in missing_languages
+        }
+        for post in load_blog_posts(file_paths, parallel=True):
+            posts_by_language[post["language"]].append(post)
+
+        for lang, posts in posts_by_language.items():
+            posts.sort(key=lambda p: p["datetime_iso"], reverse=True)
+            _posts_cache[lang] = posts
+            _invalidate_derived_data(lang)
+
     for lang in languages:
         result[lang] = load_all_posts(force_reload=False, language=lang)
 
     return result
+
+
+def load_preview_post(file_path: Path) -> BlogPostDict:
+    """
+    Load a single post file as the only loaded blog post.
+
+    Used by the preview app: the other post files are never read, so the
+    other languages are loaded as empty and lookups only find this post.
+
+    Parameters
+    ----------
+    file_path : Path
+        Path to the ``*.{lang}.md`` source file
+
+    Returns
+    -------
+    BlogPostDict
+        The parsed blog post
+
+    Raises
+    ------
+    ValueError
+        If the file cannot be parsed
+    """
+    post = parse_blog_post(file_path)
+    if post is None:
+        raise ValueError(f"Failed to parse blog post {file_path}")
+
+    for lang in ["nl", "en", "de"]:
+        _posts_cache[lang] = [post] if lang == post["language"] else []
+        _invalidate_derived_data(lang)
+
+    return post
+
+
+def get_post_by_slug(language: str, slug: str) -> BlogPostDict | None:
+    """
+    Look up a loaded blog post by its slug.
+
+    Parameters
+    ----------
+    language : str
+        Language code of the post
+    slug : str
+        URL slug of the post
+
+    Returns
+    -------
+    BlogPostDict | None
+        The post, or None if the language has no post with this slug
+    """
+    if language not in _slug_index:
+        posts = load_all_posts(force_reload=False, language=language)
+        _slug_index[language] = {post["slug"]: post for post in posts}
+
+    return _slug_index[language].get(slug)
+
+
+def build_story_index(
+    all_blog_posts: dict[str, list[BlogPostDict]],
+) -> dict[str, dict[str, str]]:
+    """
+    Map every story number to the slug of each of its language variants.
+
+    Parameters
+    ----------
+    all_blog_posts : dict[str, list[BlogPostDict]]
+        Posts per language, as returned by load_all_blog_posts_dict()
+
+    Returns
+    -------
+    dict[str, dict[str, str]]
+        Index of the form {story_number: {language: slug}}, with languages
+        in the order of ``all_blog_posts``
+    """
+    story_index: dict[str, dict[str, str]] = {}
+
+    for lang, posts in all_blog_posts.items():
+        for post in posts:
+            story_index.setdefault(post["story_number"], {}).setdefault(
+                lang, post["slug"]
+            )
+
+    return story_index
+
+
+def get_story_index(force_reload: bool = False) -> dict[str, dict[str, str]]:
+    """Get the cached story number index of all loaded blog posts."""
+    global _story_index
+
+    if _story_index is None or force_reload:
+        _story_index = build_story_index(load_all_blog_posts_dict())
+
+    return _story_index
+
+
+def category_slug(name: str) -> str:
+    """
+    Derive the URL slug of a category name.
+
+    Parameters
+    ----------
+    name : str
+        Category as written in the frontmatter (e.g., "Gezondheid en preventie")
+
+    Returns
+    -------
+    str
+        Lowercase ASCII slug (e.g., "gezondheid-en-preventie")
+    """
+    return re.sub(r"[^a-z0-9]+", "-", fold_diacritics(name)).strip("-")
+
+
+def build_category_index(
+    all_blog_posts: dict[str, list[BlogPostDict]],
+) -> dict[str, dict[str, BlogCategoryDict]]:
+    """
+    Group the posts of every language by category.
+
+    Categories are matched across languages through the story numbers of
+    their posts: the alternate of a category in another language is the
+    category of the newest post whose variant exists in that language.
+
+    Parameters
+    ----------
+    all_blog_posts : dict[str, list[BlogPostDict]]
+        Posts per language sorted by date (newest first), as returned by
+        load_all_blog_posts_dict()
+
+    Returns
+    -------
+    dict[str, dict[str, BlogCategoryDict]]
+        Index of the form {language: {category_slug: category}}, with the
+        categories of a language sorted by name. Posts without a category
+        are left out.
+    """
+    story_categories: dict[str, dict[str, str]] = {}
+    story_numbers: dict[tuple[str, str], list[str]] = {}
+    grouped: dict[str, dict[str, BlogCategoryDict]] = {}
+
+    for lang, posts in all_blog_posts.items():
+        categories = grouped.setdefault(lang, {})
+        for post in posts:
+            slug = category_slug(post["category"])
+            if not slug:
+                continue
+            story_categories.setdefault(post["story_number"], {}).setdefault(lang, slug)
+            if slug not in categories:
+                categories[slug] = {
+                    "name": post["category"],
+                    "slug": slug,
+                    "listings": [],
+                    "alternates": {},
+                }
+            categories[slug]["listings"].append(to_blog_listing(post))
+            story_numbers.setdefault((lang, slug), []).append(post["story_number"])
+
+    index: dict[str, dict[str, BlogCategoryDict]] = {}
+    for lang, categories in grouped.items():
+        index[lang] = {}
+        for category in sorted(categories.values(), key=lambda c: c["name"].lower()):
+            numbers = story_numbers[(lang, category["slug"])]
+            for other_lang in all_blog_posts:
+                alternate = next(
+                    (
+                        story_categories[number][other_lang]
+                        for number in numbers
+                        if other_lang in story_categories[number]
+                    ),
+                    None,
+                )
+                if alternate is not None:
+                    category["alternates"][other_lang] = alternate
+            index[lang][category["slug"]] = category
+
+    return index
+
+
+def get_category_index(language: str) -> dict[str, BlogCategoryDict]:
+    """
+    Get the cached categories of a language.
+
+    Parameters
+    ----------
+    language : str
+        Language code ("nl", "de", or "en")
+
+    Returns
+    -------
+    dict[str, BlogCategoryDict]
+        Categories by slug, sorted by name, see build_category_index()
+    """
+    global _category_index
+
+    if _category_index is None:
+        _category_index = build_category_index(load_all_blog_posts_dict())
+
+    return _category_index.get(language, {})
+
+
+def to_blog_listing(post: BlogPostDict) -> BlogListingDict:
+    """
+    Project a blog post onto the fields needed by overview pages.
+
+    Parameters
+    ----------
+    post : BlogPostDict
+        Fully parsed blog post
+
+    Returns
+    -------
+    BlogListingDict
+        Listing record without the article content
+    """
+    return {
+        "title": post["title"],
+        "slug": post["slug"],
+        "summary": post["summary"],
+        "author": post["author"],
+        "date": post["date"],
+        "formatted_date": post["formatted_date"],
+        "thumbnail_fallback": post["thumbnail_fallback"],
+        "thumbnail_avif": post["thumbnail_avif"],
+        "thumbnail_webp": post["thumbnail_webp"],
+        "thumbnail_alt": post["thumbnail_alt"],
+    }
+
+
+def load_all_listings(language: str | None = None) -> list[BlogListingDict]:
+    """Load the listing records of a language, sorted by date (newest first)."""
+    if language is None:
+        language = "nl"
+
+    if language not in _listings_cache:
+        posts = load_all_posts(force_reload=False, language=language)
+        _listings_cache[language] = [to_blog_listing(post) for post in posts]
+
+    return _listings_cache[language]
+
+
+def load_all_blog_listings_dict() -> dict[str, list[BlogListingDict]]:
+    """Load the listing records of all languages for overview pages."""
+    return {lang: load_all_listings(lang) for lang in load_all_blog_posts_dict()}
+
+
+def paginate_listings(
+    listings: list[BlogListingDict], page_size: int
+) -> list[list[BlogListingDict]]:
+    """
+    Split listing records into overview pages.
+
+    Parameters
+    ----------
+    listings : list[BlogListingDict]
+        Listing records sorted by date (newest first)
+    page_size : int
+        Maximum number of posts per page
+
+    Returns
+    -------
+    list[list[BlogListingDict]]
+        One list of listings per page; always at least one (possibly empty) page
+    """
+    if not listings:
+        return [[]]
+
+    return [
+        listings[start : start + page_size]
+        for start in range(0, len(listings), page_size)
+    ]
@@ -0,0 +1,189 @@
+"""Watch blog content and images and reload changed posts while running."""
+
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Iterator
+import os
+import threading
+
+from ..config import config
+from . import blog_service
+from .asset_index import _get_assets_dir, invalidate_asset_index
+
+try:
+    import watchfiles
+except ImportError:  # pragma: no cover - depends on the environment
+    watchfiles = None  # type: ignore[assignment]
+
+
+_watcher_thread: threading.Thread | None = None
+_stop_event = threading.Event()
+
+
+def _get_watched_dirs() -> tuple[Path, Path]:
+    """Get the blog content directory and the blog image directory."""
+    return (
+        blog_service._get_blog_content_dir(),
+        _get_assets_dir() / "images" / "page_blog",
+    )
+
+
+def handle_changes(changed_paths: set[Path]) -> list[Path]:
+    """
+    Reload the posts affected by changed files.
+
+    Markdown files are re-parsed individually. A change below a post's
+    image directory refreshes the asset index and re-parses the language
+    variants of that post, as their image variants may have changed. In
+    preview mode only the previewed file is reloaded.
+
+    Parameters
+    ----------
+    changed_paths : set[Path]
+        Added, modified or deleted files
+
+    Returns
+    -------
+    list[Path]
+        Post files whose loaded post changed
+    """
+    content_dir, image_dir = _get_watched_dirs()
+    post_files: set[Path] = set()
+    post_image_dirs: set[str] = set()
+    assets_changed = False
+
+    for path in changed_paths:
+        if path.parent == content_dir and path.suffix == ".md":
+            post_files.add(path)
+        elif path.is_relative_to(image_dir):
+            assets_changed = True
+            relative_parts = path.relative_to(image_dir).parts
+            if len(relative_parts) > 1:
+                post_image_dirs.add(relative_parts[0])
+
+    if assets_changed:
+        invalidate_asset_index()
+    for dir_name in post_image_dirs:
+        post_files.update(content_dir.glob(f"{dir_name}.*.md"))
+    if config.blog_preview_file:
+        # The preview only serves one post, whose file may live outside the
+        # content directory; leave the other files unloaded.
+        preview_file = Path(config.blog_preview_file).resolve()
+        preview_changed = preview_file in {path.resolve() for path in changed_paths}
+        post_files = (
+            {preview_file}
+            if preview_changed or preview_file.stem.rsplit(".", 1)[0] in post_image_dirs
+            else set()
+        )
+
+    reloaded: list[Path] = []
+    for file_path in sorted(post_files):
+        try:
+            if blog_service.reload_post_file(file_path):
+                reloaded.append(file_path)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not reload blog post {file_path}: {e}")
+
+    for file_path in reloaded:
+        print(f"Reloaded blog post {file_path.name}")
+
+    return reloaded
+
+
+def _snapshot(directories: tuple[Path, ...]) -> dict[Path, tuple[int, int]]:
+    """Record modification time and size of every file below the directories."""
+    snapshot: dict[Path, tuple[int, int]] = {}
+    for directory in directories:
+        for dir_path, _, file_names in os.walk(directory):
+            for file_name in file_names:
+                path = Path(dir_path) / file_name
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def _poll_changes(
+    directories: tuple[Path, ...], stop_event: threading.Event, interval: float
+) -> Iterator[set[Path]]:
+    """Yield changed files by comparing directory snapshots."""
+    previous = _snapshot(directories)
+    while not stop_event.wait(interval):
+        current = _snapshot(directories)
+        changed = {
+            path
+            for path in previous.keys() | current.keys()
+            if previous.get(path) != current.get(path)
+        }
+        previous = current
+        if changed:
+            yield changed
+
+
+def _event_changes(
+    directories: tuple[Path, ...], stop_event: threading.Event
+) -> Iterator[set[Path]]:
+    """Yield changed files from filesystem notifications (inotify, FSEvents, ...)."""
+    for changes in watchfiles.watch(
+        *directories, stop_event=stop_event, debounce=300, raise_interrupt=False
+    ):
+        yield {Path(path) for _, path in changes}
+
+
+def _watch(stop_event: threading.Event) -> None:
+    """Run the watch loop until the stop event is set."""
+    watched_dirs: tuple[Path, ...] = _get_watched_dirs()
+    if config.blog_preview_file:
+        watched_dirs += (Path(config.blog_preview_file).resolve().parent,)
+    directories = tuple(
+        directory for directory in dict.fromkeys(watched_dirs) if directory.exists()
+    )
+    if watchfiles is not None:
+        changes = _event_changes(directories, stop_event)
+    else:
+        changes = _poll_changes(directories, stop_event, config.blog_watch_interval)
+
+    for changed_paths in changes:
+        handle_changes(changed_paths)
+
+
+def start_blog_watcher() -> None:
+    """Start watching in a background thread, unless already running."""
+    global _watcher_thread
+
+    if _watcher_thread is not None and _watcher_thread.is_alive():
+        return
+
+    _stop_event.clear()
+    _watcher_thread = threading.Thread(
+        target=_watch, args=(_stop_event,), name="blog-watcher", daemon=True
+    )
+    _watcher_thread.start()
+
+    mode = "filesystem events" if watchfiles is not None else "polling"
+    print(f"Watching blog content for changes ({mode})")
+
+
+def stop_blog_watcher() -> None:
+    """Stop the background watcher and wait for it to finish."""
+    global _watcher_thread
+
+    _stop_event.set()
+    if _watcher_thread is not None:
+        _watcher_thread.join(timeout=5)
+        _watcher_thread = None
+
+
+@asynccontextmanager
+async def blog_watcher_lifespan() -> AsyncIterator[None]:
+    """Run the blog watcher for the lifetime of the backend if enabled."""
+    watch = config.blog_watch or config.blog_preview_file is not None
+    if watch:
+        start_blog_watcher()
+    try:
+        yield
+    finally:
+        if watch:
+            stop_blog_watcher()
@@ -2,7 +2,6 @@
 
 import re
 from typing import Any
-from pathlib import Path
 from mistletoe.block_token import (
     Document,
     Heading,
@@ -10,15 +9,68 @@ from mistletoe.block_token import (
     List as MarkdownList,
     BlockToken,
 )
-from mistletoe.span_token import RawText, Image, Link
+from mistletoe.base_renderer import BaseRenderer
+from mistletoe.span_token import RawText, Image, Link, SpanToken
+
+from ..models.blog_content import (
+    ButtonBlock,
+    ContentBlock,
+    HeadingBlock,
+    ImageBlock,
+    ListBlock,
+    ParagraphBlock,
+)
+from .asset_index import asset_exists, get_available_formats
+from .image_dimensions import get_image_dimensions
+
+# Bump whenever the structure of the produced content objects changes, so
+# that on-disk caches of parsed posts are invalidated.
+PARSER_VERSION = "4"
+
+
+class ButtonToken(SpanToken):
+    """
+    Call-to-action button written as ``!button[label](url)``.
+
+    Attributes
+    ----------
+    label : str
+        Button text
+    target : str
+        URL the button links to
+    """
+
+    pattern = re.compile(r"!button\[([^\]]+)\]\(([^)]+)\)")
+    parse_inner = False
+    # Must win over the [label](url) link that mistletoe finds inside it.
+    precedence = 6
+
+    def __init__(self, match: re.Match[str]) -> None:
+        self.label = match.group(1)
+        self.target = match.group(2)
+
+
+class BlogTokenRenderer(BaseRenderer):
+    """
+    Renderer context that registers the blog specific span tokens.
+
+    Documents must be parsed inside ``with BlogTokenRenderer():`` for
+    ``!button[...]`` to be recognised.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(ButtonToken)
+
+    def render_button_token(self, token: ButtonToken) -> str:
+        return f"[{token.label}]({token.target})"
 
 
 def parse_blog_content(
     markdown_content: str,
     filename: str,
-) -> list[dict[str, Any]]:
+) -> tuple[ContentBlock, ...]:
     """
-    Parse markdown content into structured content dictionaries for rendering.
+    Parse markdown content into typed content blocks for rendering.
 
     Parameters
     ----------
@@ -30,59 +82,31 @@ def parse_blog_content(
 
     Returns
     -------
-    list[dict[str, Any]]
-        List of content dictionaries, each with a 'type' key and type-specific data:
-        - heading: {'type': 'heading', 'level': int (1-6), 'content': str}
-        - paragraph: {'type': 'paragraph', 'content': str}
-        - image: {'type': 'image', 'src': str, 'alt': str, 'caption': str}
-        - button: {'type': 'button', 'label': str, 'url': str}
-        - list: {'type': 'list', 'ordered': bool, 'items': list[str]}
+    tuple[ContentBlock, ...]
+        Content blocks in document order: HeadingBlock, ParagraphBlock,
+        ImageBlock, ButtonBlock or ListBlock (see models.blog_content)
     """
-    current_file = Path(__file__)
-    project_root = current_file.parent.parent.parent
-
-    button_pattern = r"!button\[([^\]]+)\]\(([^)]+)\)"
-    button_placeholder = "BUTTON_PLACEHOLDER_{index}"
-
-    buttons = []
-    button_index = 0
-
-    def replace_button(match: re.Match[str]) -> str:
-        nonlocal button_index
-        buttons.append(
-            {
-                "label": match.group(1),
-                "url": match.group(2),
-            }
-        )
-        placeholder = button_placeholder.format(index=button_index)
-        button_index += 1
-        return placeholder
-
-    processed_content = re.sub(button_pattern, replace_button, markdown_content)
+    with BlogTokenRenderer():
+        doc = Document(markdown_content)
 
-    doc = Document(processed_content)
-
-    content_objects: list[dict[str, Any]] = []
+    content_objects: list[ContentBlock] = []
 
     children = doc.children if doc.children is not None else []
     for child in children:
         if isinstance(child, BlockToken):
-            obj = _process_block_token(child, filename, buttons, project_root)
+            obj = _process_block_token(child, filename)
             if obj:
                 content_objects.append(obj)
 
-    return content_objects
+    return tuple(content_objects)
 
 
 def _process_block_token(
     token: BlockToken,
     filename: str,
-    buttons: list[dict[str, str]],
-    project_root: Path,
-) -> dict[str, Any] | None:
+) -> ContentBlock | None:
     """
-    Process a single mistletoe block token into a content object.
+    Process a single mistletoe block token into a content block.
 
     Parameters
     ----------
@@ -90,50 +114,37 @@ def _process_block_token(
         Mistletoe AST block token to process
     filename : str
         Blog post filename for image path resolution
-    buttons : list[dict[str, str]]
-        List of extracted button objects with label and url
-    project_root : Path
-        Project root path for image file validation
 
     Returns
     -------
-    dict[str, Any] | None
-        Content object dictionary or None if token should be skipped
+    ContentBlock | None
+        Content block or None if token should be skipped
     """
     if isinstance(token, Heading):
         children = token.children if token.children is not None else []
-        content = _render_span_tokens(children, filename, buttons, project_root)
+        content = _render_span_tokens(children, filename)
         if content.strip():
-            return {
-                "type": "heading",
-                "level": token.level,
-                "content": content,
-            }
+            return HeadingBlock(level=token.level, content=content)
 
     elif isinstance(token, Paragraph):
         children = token.children if token.children is not None else []
-        content = _render_span_tokens(children, filename, buttons, project_root)
-
-        button_match = re.match(r"^BUTTON_PLACEHOLDER_(\d+)$", content.strip())
-        if button_match:
-            button_index = int(button_match.group(1))
-            if button_index < len(buttons):
-                return {
-                    "type": "button",
-                    "label": buttons[button_index]["label"],
-                    "url": buttons[button_index]["url"],
-                }
-
-        children_list = list(children)
+        children_list = [
+            child
+            for child in children
+            if not (isinstance(child, RawText) and not child.content.strip())
+        ]
+        if len(children_list) == 1 and isinstance(children_list[0], ButtonToken):
+            button_token = children_list[0]
+            return ButtonBlock(label=button_token.label, url=button_token.target)
+
+        content = _render_span_tokens(children, filename)
+
         if len(children_list) == 1 and isinstance(children_list[0], Image):
             image = children_list[0]
-            return _process_image(image, filename, project_root)
+            return _process_image(image, filename)
 
         if content.strip():
-            return {
-                "type": "paragraph",
-                "content": content,
-            }
+            return ParagraphBlock(content=content)
 
     elif isinstance(token, MarkdownList):
         items = []
@@ -141,34 +152,19 @@ def _process_block_token(
         for item in list_children:
             if hasattr(item, "children"):
                 item_children = item.children if item.children is not None else []
-                item_content = _render_span_tokens(
-                    item_children, filename, buttons, project_root
-                )
+                item_content = _render_span_tokens(item_children, filename)
                 if item_content.strip():
                     items.append(item_content)
 
         if items:
-            is_ordered = token.start is not None
-            if is_ordered:
-                markdown_list = "\n".join(
-                    [f"{i + 1}. {item}" for i, item in enumerate(items)]
-                )
-            else:
-                markdown_list = "\n".join([f"- {item}" for item in items])
-
-            return {
-                "type": "list",
-                "ordered": is_ordered,
-                "items": items,
-                "markdown": markdown_list,
-            }
+            return ListBlock(ordered=token.start is not None, items=tuple(items))
 
     return None
 
 
-def _process_image(image: Image, filename: str, project_root: Path) -> dict[str, Any]:
+def _process_image(image: Image, filename: str) -> ImageBlock:
     """
-    Process an image token into an image content object with path resolution.
+    Process an image token into an image block with path resolution.
 
     Parameters
     ----------
@@ -176,24 +172,20 @@ def _process_image(image: Image, filename: str, project_root: Path) -> dict[str,
         Mistletoe Image span token
     filename : str
         Blog post filename for path resolution
-    project_root : Path
-        Project root for file validation
 
     Returns
     -------
-    dict[str, Any]
-        Image content object with src, alt, and caption
+    ImageBlock
+        Image block with sources, alt text, and the intrinsic width and
+        height in pixels (0 if unknown, e.g., for remote images)
     """
     src_fallback = image.src
     src_avif = ""
     src_webp = ""
+    width, height = 0, 0
 
     image_children = image.children if image.children is not None else []
-    alt = (
-        _render_span_tokens(image_children, filename, [], project_root)
-        if image_children
-        else ""
-    )
+    alt = _render_span_tokens(image_children, filename) if image_children else ""
 
     if not (
         src_fallback.startswith("http://")
@@ -201,9 +193,8 @@ def _process_image(image: Image, filename: str, project_root: Path) -> dict[str,
         or src_fallback.startswith("/")
     ):
         resolved_path = f"/images/page_blog/{filename}/{src_fallback}"
-        file_system_path = project_root / f"assets{resolved_path}"
 
-        if not file_system_path.exists():
+        if not asset_exists(resolved_path):
             resolved_path = "/images/page_blog/default_image_filler.jpg"
 
         src_fallback = resolved_path
@@ -211,27 +202,28 @@ def _process_image(image: Image, filename: str, project_root: Path) -> dict[str,
         base_path = (
             src_fallback.rsplit(".", 1)[0] if "." in src_fallback else src_fallback
         )
-        asset_base = base_path.lstrip("/")
-        if (project_root / f"assets/{asset_base}.avif").exists():
+        available_formats = get_available_formats(src_fallback)
+        if ".avif" in available_formats:
             src_avif = f"{base_path}.avif"
-        if (project_root / f"assets/{asset_base}.webp").exists():
+        if ".webp" in available_formats:
             src_webp = f"{base_path}.webp"
 
-    return {
-        "type": "image",
-        "src_fallback": src_fallback,
-        "src_avif": src_avif,
-        "src_webp": src_webp,
-        "alt": alt,
-        "caption": alt,
-    }
+    if not src_fallback.startswith(("http://", "https://")):
+        width, height = get_image_dimensions(src_fallback) or (0, 0)
+
+    return ImageBlock(
+        src_fallback=src_fallback,
+        src_avif=src_avif,
+        src_webp=src_webp,
+        alt=alt,
+        width=width,
+        height=height,
+    )
 
 
 def _render_span_tokens(
     tokens: Any,
     filename: str,
-    buttons: list[dict[str, str]],
-    project_root: Path,
 ) -> str:
     """
     Render mistletoe span tokens back to text/markdown.
@@ -242,10 +234,6 @@ def _render_span_tokens(
         List of mistletoe span tokens
     filename : str
         Blog post filename (for potential nested image handling)
-    buttons : list[dict[str, str]]
-        Button objects list
-    project_root : Path
-        Project root path
 
     Returns
     -------
@@ -259,25 +247,18 @@ def _render_span_tokens(
             result.append(token.content)
         elif isinstance(token, Image):
             img_children = token.children if token.children is not None else []
-            alt = (
-                _render_span_tokens(img_children, filename, buttons, project_root)
-                if img_children
-                else ""
-            )
+            alt = _render_span_tokens(img_children, filename) if img_children else ""
             result.append(f"![{alt}]({token.src})")
         elif isinstance(token, Link):
             link_children = token.children if token.children is not None else []
-            text = (
-                _render_span_tokens(link_children, filename, buttons, project_root)
-                if link_children
-                else ""
-            )
+            text = _render_span_tokens(link_children, filename) if link_children else ""
             result.append(f"[{text}]({token.target})")
+        elif isinstance(token, ButtonToken):
+            # A button inside running text degrades to a regular link.
+            result.append(f"[{token.label}]({token.target})")
         elif hasattr(token, "children"):
             nested_children = token.children if token.children is not None else []
-            result.append(
-                _render_span_tokens(nested_children, filename, buttons, project_root)
-            )
+            result.append(_render_span_tokens(nested_children, filename))
         else:
             result.append(getattr(token, "content", str(token)))
 
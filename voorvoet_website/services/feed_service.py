@@ -0,0 +1,205 @@
+"""RSS and Atom feeds of the blog, serialized once per content version."""
+
+from datetime import datetime, timezone
+from email.utils import format_datetime
+import hashlib
+from typing import Literal
+from xml.etree import ElementTree
+
+from ..config import config
+from ..models.blog_post import BlogPostDict
+from ..models.feed import EncodedFeed
+from ..translations import (
+    LOCALE_MAP,
+    PAGE_DESCRIPTIONS,
+    PAGE_TITLES,
+    get_blog_feed_route,
+)
+from . import blog_service
+
+
+FeedFormat = Literal["rss", "atom"]
+
+FEED_MAX_ITEMS = 20
+
+FEED_MEDIA_TYPES: dict[FeedFormat, str] = {
+    "rss": "application/rss+xml; charset=utf-8",
+    "atom": "application/atom+xml; charset=utf-8",
+}
+
+ATOM_NAMESPACE = "http://www.w3.org/2005/Atom"
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+ElementTree.register_namespace("atom", ATOM_NAMESPACE)
+
+_feed_cache: dict[tuple[str, FeedFormat], EncodedFeed] = {}
+
+
+def _post_datetime(post: BlogPostDict) -> datetime:
+    """Get the publication time of a post; dates without a zone are UTC."""
+    published = datetime.fromisoformat(post["datetime_iso"])
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published
+
+
+def _post_url(post: BlogPostDict, language: str) -> str:
+    """Get the absolute URL of a post."""
+    return f"{config.site_url}/{language}/blog/{post['slug']}/"
+
+
+def _serialize(root: ElementTree.Element) -> bytes:
+    """Encode an XML tree as UTF-8 with declaration."""
+    body: bytes = ElementTree.tostring(root, encoding="utf-8", xml_declaration=True)
+    return body
+
+
+def _build_rss(posts: list[BlogPostDict], language: str, updated: datetime) -> bytes:
+    """Serialize posts as an RSS 2.0 document."""
+    rss = ElementTree.Element("rss", version="2.0")
+    channel = ElementTree.SubElement(rss, "channel")
+
+    ElementTree.SubElement(channel, "title").text = PAGE_TITLES[language]["blog"]
+    ElementTree.SubElement(channel, "link").text = f"{config.site_url}/{language}/blog/"
+    ElementTree.SubElement(channel, "description").text = PAGE_DESCRIPTIONS[language][
+        "blog"
+    ]
+    ElementTree.SubElement(channel, "language").text = LOCALE_MAP[language].replace(
+        "_", "-"
+    )
+    ElementTree.SubElement(channel, "lastBuildDate").text = format_datetime(updated)
+    ElementTree.SubElement(
+        channel,
+        f"{{{ATOM_NAMESPACE}}}link",
+        href=f"{config.site_url}{get_blog_feed_route(language, 'rss')}",
+        rel="self",
+        type="application/rss+xml",
+    )
+
+    for post in posts:
+        item = ElementTree.SubElement(channel, "item")
+        url = _post_url(post, language)
+        ElementTree.SubElement(item, "title").text = post["title"]
+        ElementTree.SubElement(item, "link").text = url
+        ElementTree.SubElement(item, "guid", isPermaLink="true").text = url
+        ElementTree.SubElement(item, "description").text = post["summary"]
+        ElementTree.SubElement(item, "pubDate").text = format_datetime(
+            _post_datetime(post)
+        )
+        if post["category"]:
+            ElementTree.SubElement(item, "category").text = post["category"]
+
+    return _serialize(rss)
+
+
+def _build_atom(posts: list[BlogPostDict], language: str, updated: datetime) -> bytes:
+    """Serialize posts as an Atom 1.0 document."""
+    feed = ElementTree.Element("feed", xmlns=ATOM_NAMESPACE)
+    feed.set(f"{{{XML_NAMESPACE}}}lang", language)
+    blog_url = f"{config.site_url}/{language}/blog/"
+
+    ElementTree.SubElement(feed, "id").text = blog_url
+    ElementTree.SubElement(feed, "title").text = PAGE_TITLES[language]["blog"]
+    ElementTree.SubElement(feed, "subtitle").text = PAGE_DESCRIPTIONS[language]["blog"]
+    ElementTree.SubElement(feed, "updated").text = updated.isoformat()
+    ElementTree.SubElement(
+        feed, "link", href=blog_url, rel="alternate", type="text/html"
+    )
+    ElementTree.SubElement(
+        feed,
+        "link",
+        href=f"{config.site_url}{get_blog_feed_route(language, 'atom')}",
+        rel="self",
+        type="application/atom+xml",
+    )
+
+    for post in posts:
+        entry = ElementTree.SubElement(feed, "entry")
+        url = _post_url(post, language)
+        published = _post_datetime(post).isoformat()
+        ElementTree.SubElement(entry, "id").text = url
+        ElementTree.SubElement(entry, "title").text = post["title"]
+        ElementTree.SubElement(
+            entry, "link", href=url, rel="alternate", type="text/html"
+        )
+        ElementTree.SubElement(entry, "published").text = published
+        ElementTree.SubElement(entry, "updated").text = published
+        ElementTree.SubElement(entry, "summary").text = post["summary"]
+        author = ElementTree.SubElement(entry, "author")
+        ElementTree.SubElement(author, "name").text = post["author"] or "VoorVoet"
+        if post["category"]:
+            ElementTree.SubElement(entry, "category", term=post["category"])
+
+    return _serialize(feed)
+
+
+def build_feed(
+    posts: list[BlogPostDict], language: str, feed_format: FeedFormat
+) -> EncodedFeed:
+    """
+    Serialize the newest posts of a language with their cache validators.
+
+    Parameters
+    ----------
+    posts : list[BlogPostDict]
+        Posts of the language, newest first
+    language : str
+        Language code ("nl", "de", or "en")
+    feed_format : FeedFormat
+        "rss" or "atom"
+
+    Returns
+    -------
+    EncodedFeed
+        Encoded document with strong ETag and Last-Modified date
+    """
+    feed_posts = posts[:FEED_MAX_ITEMS]
+    updated = max(
+        (_post_datetime(post) for post in feed_posts),
+        default=datetime(1970, 1, 1, tzinfo=timezone.utc),
+    )
+
+    if feed_format == "rss":
+        body = _build_rss(feed_posts, language, updated)
+    else:
+        body = _build_atom(feed_posts, language, updated)
+
+    return {
+        "body": body,
+        "media_type": FEED_MEDIA_TYPES[feed_format],
+        "etag": f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+        "last_modified": format_datetime(updated, usegmt=True),
+    }
+
+
+def _invalidate_feeds(language: str) -> None:
+    """Drop the feeds of a language after its posts were reloaded."""
+    for feed_format in FEED_MEDIA_TYPES:
+        _feed_cache.pop((language, feed_format), None)
+
+
+blog_service.register_reload_hook(_invalidate_feeds)
+
+
+def get_feed(language: str, feed_format: FeedFormat) -> EncodedFeed:
+    """
+    Get the cached feed of a language, serializing it on first use.
+
+    Parameters
+    ----------
+    language : str
+        Language code ("nl", "de", or "en")
+    feed_format : FeedFormat
+        "rss" or "atom"
+
+    Returns
+    -------
+    EncodedFeed
+        Encoded feed document
+    """
+    key = (language, feed_format)
+    if key not in _feed_cache:
+        posts = blog_service.load_all_posts(force_reload=False, language=language)
+        _feed_cache[key] = build_feed(posts, language, feed_format)
+
+    return _feed_cache[key]
@@ -0,0 +1,146 @@
+"""Fast frontmatter reader for flat blog post headers.
+
+Blog posts start with a flat YAML header of quoted ``key: "value"`` pairs and
+the occasional flow list of quoted tags. Reading those does not need a full
+YAML parser, so ``parse_frontmatter`` handles them line by line and only
+falls back to ``frontmatter.parse`` when a header uses anything else
+(unquoted values that YAML would read as dates, numbers or booleans, escape
+sequences, nested or multi-line values, comments, ...). Either way the result
+is the same stringified metadata ``frontmatter.parse`` produces.
+"""
+
+from functools import lru_cache
+import re
+
+import frontmatter
+from yaml.nodes import ScalarNode
+from yaml.reader import Reader
+from yaml.resolver import Resolver
+
+FRONTMATTER_BOUNDARY = re.compile(r"^-{3,}\s*$", re.MULTILINE)
+# The closing boundary always follows a newline; anchoring on it lets the
+# regex engine skip ahead instead of trying every position of the header.
+_CLOSING_BOUNDARY = re.compile(r"\n(-{3,}\s*$)", re.MULTILINE)
+
+_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*")
+_QUOTED = r"""(?:"[^"\\]*+"|'[^']*+(?:''[^']*+)*+')"""
+_QUOTED_ITEM = re.compile(_QUOTED)
+_QUOTED_LIST = re.compile(rf"\[ *+(?:{_QUOTED}(?: *+, *+{_QUOTED})*+)?+ *+\]")
+_PLAIN_INDICATORS = frozenset("-?:,[]{}#&*!|>'\"%@`")
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_resolver = Resolver()
+
+
+@lru_cache(maxsize=256)
+def _is_plain_key(key: str) -> bool:
+    """Whether YAML reads a mapping key as this exact string."""
+    return _KEY.fullmatch(key) is not None and _is_plain_string(key)
+
+
+def _is_plain_string(value: str) -> bool:
+    """Whether YAML reads an unquoted scalar as this exact string."""
+    if not value or value[0] in _PLAIN_INDICATORS:
+        return False
+    if ": " in value or " #" in value or "\t#" in value or value.endswith(":"):
+        return False
+    tag: str = _resolver.resolve(ScalarNode, value, (True, False))
+    return tag == _STR_TAG
+
+
+def _unquote(value: str) -> str | None:
+    """Read a single line double or single quoted scalar without escapes."""
+    if len(value) < 2 or value[0] != value[-1]:
+        return None
+
+    inner = value[1:-1]
+    if value[0] == '"':
+        if '"' in inner or "\\" in inner:
+            return None
+        return inner
+    if value[0] == "'":
+        if "'" in inner.replace("''", ""):
+            return None
+        return inner.replace("''", "'")
+    return None
+
+
+def _parse_value(value: str) -> str | None:
+    """Stringify a scalar or quoted list the way YAML + str() would."""
+    if value[0] in "\"'":
+        return _unquote(value)
+    if _QUOTED_LIST.fullmatch(value):
+        return str([_unquote(item) for item in _QUOTED_ITEM.findall(value)])
+    if _is_plain_string(value):
+        return value
+    return None
+
+
+def parse_flat_frontmatter(header: str) -> dict[str, str] | None:
+    """
+    Read a flat frontmatter header without a YAML parser.
+
+    Parameters
+    ----------
+    header : str
+        Text between the ``---`` delimiters
+
+    Returns
+    -------
+    dict[str, str] | None
+        Stringified metadata, or None if the header uses YAML constructs
+        this reader does not handle
+    """
+    if Reader.NON_PRINTABLE.search(header):
+        return None
+
+    metadata: dict[str, str] = {}
+    for line in header.splitlines():
+        if not line.strip(" "):
+            continue
+
+        key, separator, raw_value = line.partition(": ")
+        raw_value = raw_value.lstrip(" ").rstrip(" \t")
+        if not separator or not raw_value:
+            return None
+        if not _is_plain_key(key):
+            return None
+
+        value = _parse_value(raw_value)
+        if value is None:
+            return None
+
+        metadata[key] = value
+
+    return metadata or None
+
+
+def parse_frontmatter(source: str) -> tuple[dict[str, str], str]:
+    """
+    Split a blog post into stringified metadata and markdown content.
+
+    Equivalent to ``frontmatter.parse`` followed by converting every key and
+    value with ``str()``, but flat headers are read without YAML.
+
+    Parameters
+    ----------
+    source : str
+        Full text of the markdown file
+
+    Returns
+    -------
+    tuple[dict[str, str], str]
+        The metadata and the content without the header
+    """
+    text = source.replace("\r\n", "\n").strip()
+
+    opening = FRONTMATTER_BOUNDARY.match(text)
+    if opening is not None:
+        closing = _CLOSING_BOUNDARY.search(text, opening.end())
+        if closing is not None:
+            metadata = parse_flat_frontmatter(text[opening.end() : closing.start(1)])
+            if metadata is not None:
+                return metadata, text[closing.end() :].strip()
+
+    metadata_raw, content = frontmatter.parse(source)
+    return {str(key): str(value) for key, value in metadata_raw.items()}, content
@@ -0,0 +1,124 @@
+"""Server side rendering of the head of dynamic blog post routes.
+
+With ``config.blog_dynamic_routes`` enabled, one compiled page serves every
+post of a language and its head tags are bound to ``BlogPostState``, which
+is only filled in by the page's on_load event in the browser. Crawlers that
+do not run JavaScript would see empty tags, so the backend serves the
+compiled page shell with the head of the requested post rendered into it.
+"""
+
+from html import escape
+import re
+
+from ..components.structured_data import article_json_ld, breadcrumb_json_ld
+from ..config import config
+from ..translations import (
+    get_blog_post_breadcrumbs,
+    get_blog_post_hreflang_links,
+    get_blog_post_meta,
+)
+from . import blog_service
+
+_head_cache: dict[str, dict[str, str]] = {}
+
+_TITLE_PATTERN = re.compile(r"<title>.*?</title>", re.DOTALL)
+
+
+def _invalidate_head_cache(language: str) -> None:
+    """Drop the rendered heads of a language after its posts (re)load."""
+    _head_cache.pop(language, None)
+
+
+blog_service.register_reload_hook(_invalidate_head_cache)
+
+
+def _json_ld_script(json_ld: str) -> str:
+    """Wrap JSON-LD in a script tag, escaping "</" so it cannot end the tag."""
+    escaped = json_ld.replace("</", "<\\/")
+    return f'<script type="application/ld+json">{escaped}</script>'
+
+
+def render_blog_post_head(language: str, slug: str) -> str | None:
+    """
+    Render the head tags of a blog post as HTML.
+
+    Covers the title, description, Open Graph and Twitter meta, canonical
+    and hreflang links and the Article and BreadcrumbList structured data,
+    matching what the dynamic blog post page renders in the browser.
+
+    Parameters
+    ----------
+    language : str
+        Language code of the blog ("nl", "de", "en")
+    slug : str
+        Slug of the post
+
+    Returns
+    -------
+    str | None
+        HTML of the head tags, or None if the language has no such post
+    """
+    rendered = _head_cache.setdefault(language, {})
+    if slug in rendered:
+        return rendered[slug]
+
+    post = blog_service.get_post_by_slug(language, slug)
+    if post is None:
+        return None
+
+    page_url = f"{config.site_url}/{language}/blog/{slug}"
+    image_url = (
+        f"{config.site_url}{post['thumbnail_fallback']}"
+        if post["thumbnail_fallback"]
+        else None
+    )
+
+    tags = [f"<title>{escape(post['title'])} - VoorVoet Blog</title>"]
+    for meta in get_blog_post_meta(
+        language, post["title"], post["summary"], page_url, image_url
+    ):
+        key = "property" if "property" in meta else "name"
+        tags.append(
+            f'<meta {key}="{escape(meta[key])}" content="{escape(meta["content"])}"/>'
+        )
+    if image_url:
+        tags.append(f'<meta property="og:image" content="{escape(image_url)}"/>')
+
+    tags.append(f'<link rel="canonical" href="{escape(page_url)}"/>')
+    for link in get_blog_post_hreflang_links(
+        post["story_number"], blog_service.get_story_index()
+    ):
+        tags.append(
+            f'<link rel="alternate" hreflang="{escape(link["hreflang"])}" '
+            f'href="{escape(link["href"])}"/>'
+        )
+
+    tags.append(_json_ld_script(article_json_ld(post, language)))
+    tags.append(
+        _json_ld_script(
+            breadcrumb_json_ld(get_blog_post_breadcrumbs(language, post["title"], slug))
+        )
+    )
+
+    rendered[slug] = "".join(tags)
+    return rendered[slug]
+
+
+def inject_head(page_html: str, head_html: str) -> str:
+    """
+    Insert head tags into a compiled page, replacing its title.
+
+    Parameters
+    ----------
+    page_html : str
+        HTML document of the compiled page
+    head_html : str
+        Tags to add at the end of its head
+
+    Returns
+    -------
+    str
+        The page with the tags inserted before ``</head>``
+    """
+    page_html = _TITLE_PATTERN.sub("", page_html, count=1)
+    return page_html.replace("</head>", f"{head_html}</head>", 1)
@@ -0,0 +1,136 @@
+"""Build time HTML rendering of blog markdown.
+
+With ``config.blog_prerender_html`` enabled, paragraphs and lists of blog
+posts are rendered to HTML while the pages compile instead of being shipped
+as markdown to ``rx.markdown``, which would parse them again in the browser.
+The output is sanitized the same way the client renderer treats blog content:
+raw HTML in the markdown is escaped rather than passed through, and links or
+images with a script capable URL scheme lose their URL.
+"""
+
+import re
+
+from mistletoe.block_token import Document
+from mistletoe.html_renderer import HtmlRenderer
+import reflex as rx
+
+from ..config import config
+from ..theme import Colors, FontSizes
+from .content_parser import ButtonToken
+
+# URL schemes allowed in href and src attributes; relative URLs, fragments
+# and paths have no scheme and are always allowed.
+SAFE_URL_SCHEMES = frozenset({"http", "https", "mailto", "tel"})
+_URL_SCHEME = re.compile(r"^([A-Za-z][A-Za-z0-9+.\-]*):")
+
+# Match the list spacing of rx.markdown for pre-rendered HTML.
+LIST_STYLE = {
+    "& ul, & ol": {
+        "marginTop": "1em",
+        "marginBottom": "1em",
+        "marginLeft": "1.5rem",
+    },
+    "& ul": {"listStyleType": "disc"},
+    "& ol": {"listStyleType": "decimal"},
+    "& li": {
+        "marginTop": "0.5em",
+        "marginBottom": "0.5em",
+    },
+}
+
+
+def is_safe_url(url: str) -> bool:
+    """
+    Check whether a URL may be used as a link or image target.
+
+    Parameters
+    ----------
+    url : str
+        URL as written in the markdown
+
+    Returns
+    -------
+    bool
+        True if the URL has no scheme or one of SAFE_URL_SCHEMES
+    """
+    # Browsers ignore control characters and whitespace inside the scheme
+    # ("java\tscript:"), so strip them before looking at it.
+    normalized = re.sub(r"[\x00-\x20\x7f]", "", url)
+    match = _URL_SCHEME.match(normalized)
+    return match is None or match.group(1).lower() in SAFE_URL_SCHEMES
+
+
+class BlogHtmlRenderer(HtmlRenderer):
+    """
+    Sanitizing HTML renderer for blog markdown.
+
+    Registers the blog specific span tokens like ``BlogTokenRenderer`` does
+    and escapes raw HTML instead of passing it through.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(ButtonToken, process_html_tokens=False)
+
+    def render_button_token(self, token: ButtonToken) -> str:
+        # A button inside running text degrades to a regular link.
+        target = self.escape_url(token.target)
+        return f'<a href="{target}">{self.escape_html_text(token.label)}</a>'
+
+    @staticmethod
+    def escape_url(raw: str) -> str:
+        if not is_safe_url(raw):
+            return ""
+        return HtmlRenderer.escape_url(raw)
+
+
+def render_markdown_html(markdown: str) -> str:
+    """
+    Render blog markdown to sanitized HTML.
+
+    Parameters
+    ----------
+    markdown : str
+        Markdown of a content block, such as the inline markdown of a
+        paragraph or the markdown of a list
+
+    Returns
+    -------
+    str
+        HTML of the rendered block
+    """
+    with BlogHtmlRenderer() as renderer:
+        html: str = renderer.render(Document(markdown))
+    return html.strip()
+
+
+def blog_markdown_body(markdown: str | rx.Var) -> rx.Component:
+    """
+    Render blog markdown as static HTML or with ``rx.markdown``.
+
+    Markdown known at build time is rendered to HTML when
+    ``config.blog_prerender_html`` is enabled; state bound markdown is always
+    left to ``rx.markdown``. Lists in the HTML need LIST_STYLE on a parent
+    to look like the ones rendered by ``rx.markdown``.
+
+    Parameters
+    ----------
+    markdown : str | rx.Var
+        Markdown of a content block
+
+    Returns
+    -------
+    rx.Component
+        Component rendering the markdown in the blog text color and size
+    """
+    if config.blog_prerender_html and isinstance(markdown, str):
+        return rx.html(
+            render_markdown_html(markdown),
+            color=Colors.text["content"],
+            font_size=FontSizes.regular,
+        )
+    body: rx.Component = rx.markdown(
+        markdown,
+        color=Colors.text["content"],
+        font_size=FontSizes.regular,
+    )
+    return body
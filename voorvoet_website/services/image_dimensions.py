@@ -0,0 +1,222 @@
+"""Read intrinsic image dimensions from file headers without decoding pixels."""
+
+from pathlib import Path
+from typing import BinaryIO
+import struct
+
+from .asset_index import _get_assets_dir, get_asset_mtime
+
+
+# Enough for the AVIF/PNG/WebP headers; JPEG is read segment by segment.
+HEADER_READ_SIZE = 64 * 1024
+
+# JPEG start-of-frame markers (baseline, progressive, lossless, ...).
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# JPEG markers that stand alone without a length field.
+_JPEG_STANDALONE_MARKERS = frozenset([0x01, *range(0xD0, 0xD9)])
+# EXIF orientations that rotate the image by 90 or 270 degrees.
+_EXIF_TRANSPOSED_ORIENTATIONS = frozenset([5, 6, 7, 8])
+
+# ISOBMFF container boxes walked on the way to the AVIF ``ispe`` property.
+_AVIF_CONTAINER_BOXES = {b"meta": 4, b"iprp": 0, b"ipco": 0}
+
+_dimension_cache: dict[tuple[str, int], tuple[int, int] | None] = {}
+
+
+def _exif_is_transposed(exif: bytes) -> bool:
+    """Check whether an EXIF block rotates the image by 90 or 270 degrees."""
+    if len(exif) < 14 or exif[:6] != b"Exif\0\0":
+        return False
+
+    tiff = exif[6:]
+    endian = "<" if tiff[:2] == b"II" else ">"
+    try:
+        (ifd_offset,) = struct.unpack_from(f"{endian}I", tiff, 4)
+        (entry_count,) = struct.unpack_from(f"{endian}H", tiff, ifd_offset)
+        for entry in range(entry_count):
+            offset = ifd_offset + 2 + entry * 12
+            tag, _, _, value = struct.unpack_from(f"{endian}HHIH", tiff, offset)
+            if tag == 0x0112:
+                return value in _EXIF_TRANSPOSED_ORIENTATIONS
+    except struct.error:
+        return False
+
+    return False
+
+
+def _read_jpeg_size(f: BinaryIO) -> tuple[int, int] | None:
+    """Walk the JPEG segments up to the start-of-frame header."""
+    f.seek(2)
+    transposed = False
+
+    while True:
+        byte = f.read(1)
+        if not byte:
+            return None
+        if byte != b"\xff":
+            continue
+
+        marker = f.read(1)
+        while marker == b"\xff":
+            marker = f.read(1)
+        if not marker:
+            return None
+
+        code = marker[0]
+        if code in _JPEG_STANDALONE_MARKERS:
+            continue
+        if code == 0xD9:
+            return None
+
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        (length,) = struct.unpack(">H", length_bytes)
+
+        if code in _JPEG_SOF_MARKERS:
+            frame = f.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack(">xHH", frame)
+            return (height, width) if transposed else (width, height)
+
+        if code == 0xE1:
+            transposed = _exif_is_transposed(f.read(length - 2)) or transposed
+        else:
+            f.seek(length - 2, 1)
+
+
+def _read_png_size(header: bytes) -> tuple[int, int] | None:
+    """Read the size from the PNG IHDR chunk."""
+    if len(header) < 24 or header[12:16] != b"IHDR":
+        return None
+    width, height = struct.unpack(">II", header[16:24])
+    return width, height
+
+
+def _read_webp_size(header: bytes) -> tuple[int, int] | None:
+    """Read the size from the first WebP chunk (VP8, VP8L or VP8X)."""
+    chunk = header[12:16]
+
+    if chunk == b"VP8 " and len(header) >= 30 and header[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack("<HH", header[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+
+    if chunk == b"VP8L" and len(header) >= 25 and header[20] == 0x2F:
+        (bits,) = struct.unpack("<I", header[21:25])
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+
+    if chunk == b"VP8X" and len(header) >= 30:
+        width = int.from_bytes(header[24:27], "little") + 1
+        height = int.from_bytes(header[27:30], "little") + 1
+        return width, height
+
+    return None
+
+
+def _iter_boxes(data: bytes, start: int, end: int) -> list[tuple[bytes, int, int]]:
+    """List the ISOBMFF boxes in a byte range as (type, payload start, end)."""
+    boxes = []
+    position = start
+    while position + 8 <= end:
+        size, box_type = struct.unpack_from(">I4s", data, position)
+        header_size = 8
+        if size == 1 and position + 16 <= end:
+            (size,) = struct.unpack_from(">Q", data, position + 8)
+            header_size = 16
+        elif size == 0:
+            size = end - position
+        if size < header_size:
+            break
+        boxes.append((box_type, position + header_size, min(position + size, end)))
+        position += size
+    return boxes
+
+
+def _read_avif_size(header: bytes) -> tuple[int, int] | None:
+    """Find the largest ``ispe`` (image spatial extents) property of an AVIF."""
+    sizes: list[tuple[int, int]] = []
+    rotated = False
+    pending = [(0, len(header))]
+
+    while pending:
+        start, end = pending.pop()
+        for box_type, payload_start, payload_end in _iter_boxes(header, start, end):
+            if box_type in _AVIF_CONTAINER_BOXES:
+                skip = _AVIF_CONTAINER_BOXES[box_type]
+                pending.append((payload_start + skip, payload_end))
+            elif box_type == b"ispe" and payload_end - payload_start >= 12:
+                sizes.append(struct.unpack_from(">II", header, payload_start + 4))
+            elif box_type == b"irot" and payload_end > payload_start:
+                rotated = header[payload_start] & 0x03 in (1, 3)
+
+    if not sizes:
+        return None
+    width, height = max(sizes, key=lambda size: size[0] * size[1])
+    return (height, width) if rotated else (width, height)
+
+
+def read_image_size(file_path: Path) -> tuple[int, int] | None:
+    """
+    Read the intrinsic size of a JPEG, PNG, WebP or AVIF file.
+
+    Only the headers are read; pixel data is never decoded.
+
+    Parameters
+    ----------
+    file_path : Path
+        Path to the image file
+
+    Returns
+    -------
+    tuple[int, int] | None
+        (width, height) in pixels as displayed (EXIF/irot rotation
+        applied), or None if the format is unknown or the file is broken
+    """
+    try:
+        with open(file_path, "rb") as f:
+            signature = f.read(12)
+            if signature[:2] == b"\xff\xd8":
+                return _read_jpeg_size(f)
+
+            header = signature + f.read(HEADER_READ_SIZE - len(signature))
+    except OSError:
+        return None
+
+    if header[:8] == b"\x89PNG\r\n\x1a\n":
+        return _read_png_size(header)
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return _read_webp_size(header)
+    if header[4:8] == b"ftyp":
+        return _read_avif_size(header)
+
+    return None
+
+
+def get_image_dimensions(url_path: str) -> tuple[int, int] | None:
+    """
+    Get the intrinsic size of an asset, cached by path and modification time.
+
+    The modification time comes from the asset index, so repeated lookups
+    do not touch the filesystem.
+
+    Parameters
+    ----------
+    url_path : str
+        Asset URL path, e.g., "/images/page_blog/001_post/photo.jpg"
+
+    Returns
+    -------
+    tuple[int, int] | None
+        (width, height) in pixels, or None if unknown
+    """
+    mtime = get_asset_mtime(url_path)
+    if mtime is None:
+        return None
+
+    file_path = _get_assets_dir() / url_path.lstrip("/")
+    cache_key = (str(file_path), mtime)
+    if cache_key not in _dimension_cache:
+        _dimension_cache[cache_key] = read_image_size(file_path)
+
+    return _dimension_cache[cache_key]
@@ -0,0 +1,138 @@
+"""Parser for the free text reimbursement descriptions of insurance packages.
+
+The NVvP publishes each package's reimbursement as Dutch prose, e.g.
+"Max. € 150,- per kalenderjaar (inclusief 1 paar steunzolen)" or "€ 200 per
+jaar voor podotherapie en voetbehandelingen en € 125 voor steunzolen". Many
+descriptions name a separate amount or percentage for insoles, before or
+after the podiatry amount, so amounts and percentages are read per clause.
+A clause that is about insoles alone ("Steunzolen: maximaal € 100",
+"€ 500 voor steunzolen") does not count as the podiatry reimbursement.
+"""
+
+from decimal import Decimal
+import re
+
+from ..models.reimbursement import ReimbursementPeriod, ReimbursementTerms
+from .text_analysis import fold_diacritics
+
+
+# Unicode \s also matches the (narrow) no-break spaces used in the data.
+_SPACES = re.compile(r"\s+")
+# Everything after a line starting with "*" explains a footnote.
+_FOOTNOTE = re.compile(r"\n\s*\*.*", re.DOTALL)
+
+# Amounts may use dots as thousands separators ("€ 1.000,-").
+_AMOUNT = re.compile(r"€ ?(\d{1,3}(?:\.\d{3})+|\d+)(?:,(\d{1,2}))?(?:,-)?")
+_PERCENTAGE = re.compile(r"(\d{1,3}) ?%")
+# Clauses end at punctuation, at another amount or percentage, or where a
+# new sentence starts without punctuation ("... per jaar Steunzolen* ...").
+_CLAUSE_BOUNDARY = re.compile(r"[.;,€\d]|\s(?=[A-Z])")
+
+_PERIOD = re.compile(
+    r"^[^€]*?per (2 kalenderjaren|kalenderjaar|jaar|behandeldatum|behandeling)"
+)
+_PERIODS: dict[str, ReimbursementPeriod] = {
+    "2 kalenderjaren": "two_years",
+    "kalenderjaar": "year",
+    "jaar": "year",
+    "behandeldatum": "treatment",
+    "behandeling": "treatment",
+}
+
+_PODIATRY_WORDS = ("podotherapie", "voetbehandeling", "voetzorg", "behandeling")
+_INSOLES_INCLUDED = re.compile(
+    r"inclusief[^.;]*steunzolen|samen|^podotherapie en steunzolen"
+)
+_FULLY_REIMBURSED = re.compile(r"volledig vergoed\b")
+_NO_REIMBURSEMENT = re.compile(r"^geen vergoeding|geen vergoeding voor podotherapie")
+
+
+def _normalize(text: str) -> str:
+    """Drop footnotes and collapse all kinds of whitespace to single spaces."""
+    return _SPACES.sub(" ", _FOOTNOTE.sub("", text)).strip()
+
+
+def _names_insoles_only(clause: str) -> bool:
+    """Whether a clause is about insoles and not about podiatry itself."""
+    return (
+        "steunzolen" in clause
+        and "inclusief" not in clause
+        and "samen" not in clause
+        and not any(word in clause for word in _PODIATRY_WORDS)
+    )
+
+
+def _is_insoles_only(text: str, start: int, end: int) -> bool:
+    """
+    Whether the amount or percentage at text[start:end] is for insoles only.
+
+    The words following the number name its subject when they mention one
+    ("€ 500 voor steunzolen", "€ 70,- voor voetbehandelingen"), otherwise
+    the words leading up to it do ("Steunzolen: maximaal € 100").
+    """
+    after = fold_diacritics(_CLAUSE_BOUNDARY.split(text[end:], maxsplit=1)[0])
+    if _names_insoles_only(after):
+        return True
+    if any(word in after for word in _PODIATRY_WORDS):
+        return False
+
+    before = fold_diacritics(_CLAUSE_BOUNDARY.split(text[:start])[-1])
+    return _names_insoles_only(before)
+
+
+def _parse_decimal(euros: str, cents: str | None) -> Decimal:
+    """Parse a Dutch amount, e.g., ("1.027", "50") → Decimal("1027.50")."""
+    euros = euros.replace(".", "")
+    return Decimal(f"{euros}.{cents}" if cents else euros)
+
+
+def parse_reimbursement(text: str) -> ReimbursementTerms:
+    """
+    Parse the podiatry terms from a reimbursement description.
+
+    Parameters
+    ----------
+    text : str
+        Dutch description, e.g., "€ 100,- (inclusief steunzolen) per
+        kalenderjaar"
+
+    Returns
+    -------
+    ReimbursementTerms
+        Amount, period, percentage and flags of the podiatry reimbursement.
+        Descriptions without recognisable terms (e.g., announcements of
+        insurers merging) parse to an amount and percentage of None with
+        both flags False.
+    """
+    normalized = _normalize(text)
+    folded = fold_diacritics(normalized)
+
+    amount: Decimal | None = None
+    period: ReimbursementPeriod = ""
+    for match in _AMOUNT.finditer(normalized):
+        if _is_insoles_only(normalized, match.start(), match.end()):
+            continue
+        amount = _parse_decimal(match.group(1), match.group(2))
+        period_match = _PERIOD.search(fold_diacritics(normalized[match.end() :]))
+        if period_match is not None:
+            period = _PERIODS[period_match.group(1)]
+        break
+
+    percentage: int | None = None
+    for match in _PERCENTAGE.finditer(normalized):
+        if not _is_insoles_only(normalized, match.start(), match.end()):
+            percentage = int(match.group(1))
+            break
+    if percentage is None and _FULLY_REIMBURSED.search(folded):
+        percentage = 100
+
+    covered = amount is not None or percentage is not None
+
+    return {
+        "amount": amount,
+        "period": period,
+        "percentage": percentage,
+        "insoles_included": covered and _INSOLES_INCLUDED.search(folded) is not None,
+        "no_reimbursement": not covered
+        and _NO_REIMBURSEMENT.search(folded) is not None,
+    }
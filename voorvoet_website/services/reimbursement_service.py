@@ -0,0 +1,380 @@
+"""Insurance reimbursement data loading and access service."""
+
+from pathlib import Path
+from decimal import Decimal
+import json
+from typing import Any, Optional
+
+from ..models.reimbursement import (
+    ReimbursementItem,
+    ReimbursementData,
+    ReimbursementPage,
+    ReimbursementTerms,
+)
+from ..config import config
+from .reimbursement_parser import parse_reimbursement
+from .text_analysis import fold_diacritics
+from .trigram_index import build_trigram_index, match_trigrams
+
+
+SORT_FIELDS = ("insurer", "package", "reimbursement")
+
+_reimbursement_cache: Optional[ReimbursementData] = None
+
+_FIELDS = ("verzekeraar", "pakket", "vergoeding")
+
+
+def _get_reimbursement_data_path() -> Path:
+    """Get path to reimbursements JSON file."""
+    current_file = Path(__file__)
+    project_root = current_file.parent.parent.parent
+    return (
+        project_root
+        / "voorvoet_website"
+        / "data"
+        / "reimbursements"
+        / config.reimbursements_data_file
+    )
+
+
+def _validate_row(row: Any, index: int, data_path: Path) -> tuple[str, str, str]:
+    """
+    Validate one row of the reimbursements dataset.
+
+    Parameters
+    ----------
+    row : Any
+        Decoded JSON value of the row
+    index : int
+        Position of the row in the dataset, used in error messages
+    data_path : Path
+        Path of the dataset, used in error messages
+
+    Returns
+    -------
+    tuple[str, str, str]
+        Stripped verzekeraar, pakket and vergoeding values
+
+    Raises
+    ------
+    ValueError
+        If the row is not an object with string values for all fields
+    """
+    if not isinstance(row, dict):
+        raise ValueError(f"{data_path.name}: row {index} is not an object")
+
+    values = []
+    for field in _FIELDS:
+        value = row.get(field)
+        if not isinstance(value, str):
+            raise ValueError(f"{data_path.name}: row {index} has no '{field}' text")
+        values.append(value.strip())
+
+    return values[0], values[1], values[2]
+
+
+def load_reimbursement_data(force_reload: bool = False) -> ReimbursementData:
+    """
+    Load all reimbursement data from JSON with caching.
+
+    Reads the reimbursements JSON file, validates its rows and builds a list
+    of all items plus indexes by insurer and by package, the parsed terms
+    and folded search text of each item, the sort orders of each field and
+    trigram indexes of the insurer and package names for typo tolerant
+    search. The first row of the dataset holds the column headers. Results
+    are cached for subsequent calls unless force_reload is True.
+
+    Parameters
+    ----------
+    force_reload : bool
+        If True, reload data even if cached (default: False)
+
+    Returns
+    -------
+    ReimbursementData
+        Dictionary containing:
+        - columns: column headers of the dataset
+        - items: list of all reimbursements
+        - by_insurer: dict for O(1) lookup of the packages of an insurer
+        - by_package: dict for O(1) lookup by package name
+        - search_text: folded text per item for query_reimbursements()
+        - terms: parsed amount, period and flags per item
+        - sort_orders: presorted item positions per sort key
+        - name_index: trigram index of "insurer package" per item
+        - insurer_index: trigram index of the insurer names (by_insurer keys)
+
+    Raises
+    ------
+    ValueError
+        If the file is not a list of rows with the expected fields
+    """
+    global _reimbursement_cache
+
+    if _reimbursement_cache is not None and not force_reload:
+        return _reimbursement_cache
+
+    data_path = _get_reimbursement_data_path()
+    with open(data_path, "r", encoding="utf-8") as f:
+        rows = json.load(f)
+
+    if not isinstance(rows, list) or not rows:
+        raise ValueError(f"{data_path.name}: expected a non-empty list of rows")
+
+    columns = list(_validate_row(rows[0], 0, data_path))
+    items: list[ReimbursementItem] = []
+    by_insurer: dict[str, list[ReimbursementItem]] = {}
+    by_package: dict[str, list[ReimbursementItem]] = {}
+
+    for index, row in enumerate(rows[1:], start=1):
+        insurer, package, reimbursement = _validate_row(row, index, data_path)
+
+        if not insurer or not reimbursement:
+            print(f"Warning: Skipping incomplete reimbursement row {index}: {row}")
+            continue
+
+        item: ReimbursementItem = {
+            "insurer": insurer,
+            "package": package,
+            "reimbursement": reimbursement,
+        }
+
+        items.append(item)
+        by_insurer.setdefault(insurer, []).append(item)
+        by_package.setdefault(package, []).append(item)
+
+    folded_rows = [
+        [
+            fold_diacritics(item["insurer"]),
+            fold_diacritics(item["package"]),
+            fold_diacritics(item["reimbursement"]),
+        ]
+        for item in items
+    ]
+    search_text = [" ".join(row) for row in folded_rows]
+    terms = [parse_reimbursement(item["reimbursement"]) for item in items]
+
+    sort_orders: dict[str, list[int]] = {}
+    for column, field in enumerate(SORT_FIELDS[:2]):
+        order = sorted(range(len(items)), key=lambda i: folded_rows[i][column])
+        sort_orders[field] = order
+        sort_orders[f"-{field}"] = order[::-1]
+    # Reimbursements sort by amount in both directions, with the
+    # descriptions without amount last in text order.
+    for sort, sign in (("reimbursement", 1), ("-reimbursement", -1)):
+        sort_orders[sort] = sorted(
+            range(len(items)),
+            key=lambda i: (
+                terms[i]["amount"] is None,
+                sign * (terms[i]["amount"] or 0),
+                folded_rows[i][2],
+            ),
+        )
+
+    _reimbursement_cache = {
+        "columns": columns,
+        "items": items,
+        "by_insurer": by_insurer,
+        "by_package": by_package,
+        "terms": terms,
+        "search_text": search_text,
+        "sort_orders": sort_orders,
+        "name_index": build_trigram_index(
+            [f"{item['insurer']} {item['package']}" for item in items]
+        ),
+        "insurer_index": build_trigram_index(list(by_insurer)),
+    }
+
+    return _reimbursement_cache
+
+
+def get_insurer_packages(
+    reimbursement_data: ReimbursementData, insurer: str
+) -> list[ReimbursementItem]:
+    """
+    Get the reimbursements of all packages of an insurer.
+
+    Parameters
+    ----------
+    reimbursement_data : ReimbursementData
+        The loaded reimbursement data
+    insurer : str
+        Exact insurer name from the dataset (case-sensitive)
+
+    Returns
+    -------
+    list[ReimbursementItem]
+        Reimbursements of the insurer's packages, empty if unknown
+    """
+    return reimbursement_data["by_insurer"].get(insurer, [])
+
+
+def get_reimbursement(
+    reimbursement_data: ReimbursementData, insurer: str, package: str
+) -> Optional[ReimbursementItem]:
+    """
+    Get the reimbursement of one package of an insurer.
+
+    Parameters
+    ----------
+    reimbursement_data : ReimbursementData
+        The loaded reimbursement data
+    insurer : str
+        Exact insurer name from the dataset (case-sensitive)
+    package : str
+        Exact package name from the dataset (case-sensitive)
+
+    Returns
+    -------
+    ReimbursementItem | None
+        Reimbursement if found, None otherwise
+    """
+    for item in get_insurer_packages(reimbursement_data, insurer):
+        if item["package"] == package:
+            return item
+    return None
+
+
+def _covers_amount(terms: ReimbursementTerms, min_amount: Decimal) -> bool:
+    """Whether a package reimburses at least min_amount for podiatry."""
+    if terms["amount"] is not None:
+        return terms["amount"] >= min_amount
+    return terms["percentage"] == 100
+
+
+def query_reimbursements(
+    reimbursement_data: ReimbursementData,
+    query: str = "",
+    sort: str = "",
+    min_amount: Optional[Decimal] = None,
+    page: int = 1,
+    limit: int = 12,
+) -> ReimbursementPage:
+    """
+    Search, sort and paginate the reimbursements for the table.
+
+    An item matches if every whitespace separated term of the query occurs
+    in its insurer, package or reimbursement text, or if its insurer and
+    package name are similar to the query ("zilveren krus" finds "Zilveren
+    Kruis"). Case and diacritics are ignored. Without a sort field, items
+    containing all terms come first, followed by the other items in order of
+    name similarity.
+
+    Parameters
+    ----------
+    reimbursement_data : ReimbursementData
+        The loaded reimbursement data
+    query : str
+        Search text, empty to match all items (default: "")
+    sort : str
+        One of SORT_FIELDS, prefixed with "-" for descending order, or ""
+        to order by relevance, or dataset order without a query (default: "").
+        Reimbursements are sorted by their parsed amount.
+    min_amount : Decimal | None
+        Only keep packages reimbursing at least this amount, or all costs
+        without a maximum; None to keep all (default: None)
+    page : int
+        1-based page number (default: 1)
+    limit : int
+        Maximum number of items per page (default: 12)
+
+    Returns
+    -------
+    ReimbursementPage
+        The requested page of matching items and the total number of matches
+
+    Raises
+    ------
+    ValueError
+        If sort names an unknown field
+    """
+    field = sort.removeprefix("-")
+    if field and field not in SORT_FIELDS:
+        raise ValueError(f"Unknown sort field: '{field}'")
+
+    if field:
+        matches = list(reimbursement_data["sort_orders"][sort])
+    else:
+        matches = list(range(len(reimbursement_data["items"])))
+
+    if min_amount is not None:
+        item_terms = reimbursement_data["terms"]
+        matches = [
+            position
+            for position in matches
+            if _covers_amount(item_terms[position], min_amount)
+        ]
+
+    terms = fold_diacritics(query).split()
+    if terms:
+        items = reimbursement_data["items"]
+        search_text = reimbursement_data["search_text"]
+        similarity = dict(match_trigrams(reimbursement_data["name_index"], query))
+        # Insurers whose own name is closest to the query come first, e.g.,
+        # "Zilveren Kruis" before "Aon Vitaal (Zilveren Kruis)".
+        insurers = list(reimbursement_data["by_insurer"])
+        insurer_rank = {
+            insurers[position]: rank
+            for rank, (position, _) in enumerate(
+                match_trigrams(
+                    reimbursement_data["insurer_index"], query, min_similarity=0
+                )
+            )
+        }
+        relevance = {
+            position: (
+                not all(term in search_text[position] for term in terms),
+                -similarity.get(position, 0),
+                insurer_rank.get(items[position]["insurer"], len(insurers)),
+            )
+            for position in matches
+        }
+        matches = [
+            position
+            for position in matches
+            if position in similarity or not relevance[position][0]
+        ]
+        if not field:
+            # Stable sort: equally relevant items keep the dataset order.
+            matches.sort(key=lambda position: relevance[position])
+
+    start = (page - 1) * limit
+    return {
+        "query": query,
+        "sort": sort,
+        "page": page,
+        "limit": limit,
+        "total": len(matches),
+        "results": [
+            reimbursement_data["items"][position]
+            for position in matches[start : start + limit]
+        ],
+    }
+
+
+def suggest_insurers(
+    reimbursement_data: ReimbursementData, query: str, limit: int = 5
+) -> list[str]:
+    """
+    Suggest insurer names for a partially typed or misspelled query.
+
+    Parameters
+    ----------
+    reimbursement_data : ReimbursementData
+        The loaded reimbursement data
+    query : str
+        Text as typed by the user, e.g., "menzis" or "zilveren krus"
+    limit : int
+        Maximum number of suggestions (default: 5)
+
+    Returns
+    -------
+    list[str]
+        Insurer names, most similar first
+    """
+    insurers = list(reimbursement_data["by_insurer"])
+    return [
+        insurers[position]
+        for position, _ in match_trigrams(
+            reimbursement_data["insurer_index"], query, limit=limit
+        )
+    ]
@@ -0,0 +1,291 @@
+"""Related blog post recommendations from sparse TF-IDF vectors."""
+
+from collections import Counter
+import heapq
+import math
+
+from ..config import config
+from ..models.blog_post import BlogListingDict, BlogPostDict
+from ..models.related import RelatedIndex
+from . import blog_service
+from .text_analysis import tokenize
+
+
+# The title and summary describe the topic best, so they count extra.
+TITLE_WEIGHT = 3
+SUMMARY_WEIGHT = 2
+
+_related_index_cache: dict[str, RelatedIndex] = {}
+
+
+def _term_frequencies(post: BlogPostDict, language: str) -> Counter[str]:
+    """Count the weighted tokens of a post's title, summary and body."""
+    frequencies: Counter[str] = Counter()
+    for text, weight in (
+        (post["title"], TITLE_WEIGHT),
+        (post["summary"], SUMMARY_WEIGHT),
+        (post["content"], 1),
+    ):
+        for token in tokenize(text, language):
+            frequencies[token] += weight
+    return frequencies
+
+
+def _tfidf_vector(
+    frequencies: Counter[str], document_frequency: dict[str, int], total: int
+) -> dict[str, float]:
+    """Weight term frequencies by smoothed IDF and normalise to unit length."""
+    vector = {
+        token: (1 + math.log(count))
+        * (math.log((1 + total) / (1 + document_frequency.get(token, 0))) + 1)
+        for token, count in frequencies.items()
+    }
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    if not norm:
+        return {}
+    return {token: weight / norm for token, weight in vector.items()}
+
+
+def _similarities(index: RelatedIndex, vector: dict[str, float]) -> dict[str, float]:
+    """
+    Compute the cosine similarity of a vector with every indexed post.
+
+    This is one sparse matrix-vector product: only the postings of the
+    vector's own tokens are visited, so posts without shared tokens cost
+    nothing.
+    """
+    scores: dict[str, float] = {}
+    postings = index["postings"]
+    for token, weight in vector.items():
+        for slug, other_weight in postings.get(token, {}).items():
+            scores[slug] = scores.get(slug, 0.0) + weight * other_weight
+    return scores
+
+
+def _top_related(
+    index: RelatedIndex, scores: dict[str, float]
+) -> list[tuple[float, str]]:
+    """Select the best scoring posts, most similar first."""
+    return heapq.nlargest(
+        index["top_n"], ((score, slug) for slug, score in scores.items() if score > 0)
+    )
+
+
+def _offer(index: RelatedIndex, slug: str, candidate: str, score: float) -> None:
+    """Insert a candidate into a post's related list if it scores high enough."""
+    related = index["related"][slug]
+    if len(related) >= index["top_n"] and (not related or score <= related[-1][0]):
+        return
+    related.append((score, candidate))
+    related.sort(reverse=True)
+    del related[index["top_n"] :]
+
+
+def _insert_vector(index: RelatedIndex, slug: str, vector: dict[str, float]) -> None:
+    """Add a vector to the index and update the related lists it affects."""
+    scores = _similarities(index, vector)
+
+    index["vectors"][slug] = vector
+    for token, weight in vector.items():
+        index["postings"].setdefault(token, {})[slug] = weight
+
+    index["related"][slug] = _top_related(index, scores)
+    for other_slug, score in scores.items():
+        if score > 0:
+            _offer(index, other_slug, slug, score)
+
+
+def _empty_index(language: str, top_n: int) -> RelatedIndex:
+    """Create an index without posts."""
+    return {
+        "language": language,
+        "top_n": top_n,
+        "vectors": {},
+        "postings": {},
+        "document_frequency": {},
+        "related": {},
+    }
+
+
+def build_related_index(
+    posts: list[BlogPostDict], language: str, top_n: int = 3
+) -> RelatedIndex:
+    """
+    Build TF-IDF vectors and the top-N related posts for one language.
+
+    Posts are inserted one at a time; each insertion scores the new post
+    against the existing ones with a single sparse product, so every pair
+    is compared exactly once.
+
+    Parameters
+    ----------
+    posts : list[BlogPostDict]
+        Parsed posts of the language
+    language : str
+        Language code ("nl", "de", or "en") used for tokenization
+    top_n : int
+        Number of related posts to keep per post (default: 3)
+
+    Returns
+    -------
+    RelatedIndex
+        Index with vectors, postings and related posts
+    """
+    index = _empty_index(language, top_n)
+    frequencies = {post["slug"]: _term_frequencies(post, language) for post in posts}
+
+    document_frequency = index["document_frequency"]
+    for post_frequencies in frequencies.values():
+        for token in post_frequencies:
+            document_frequency[token] = document_frequency.get(token, 0) + 1
+
+    for slug, post_frequencies in frequencies.items():
+        vector = _tfidf_vector(post_frequencies, document_frequency, len(frequencies))
+        _insert_vector(index, slug, vector)
+
+    return index
+
+
+def remove_post(index: RelatedIndex, slug: str) -> None:
+    """
+    Remove a post from the index.
+
+    Only the posts that listed the removed post as related are rescored.
+
+    Parameters
+    ----------
+    index : RelatedIndex
+        Index to update in place
+    slug : str
+        Slug of the post to remove
+    """
+    vector = index["vectors"].pop(slug, None)
+    if vector is None:
+        return
+
+    for token in vector:
+        token_postings = index["postings"][token]
+        del token_postings[slug]
+        if not token_postings:
+            del index["postings"][token]
+        index["document_frequency"][token] -= 1
+        if not index["document_frequency"][token]:
+            del index["document_frequency"][token]
+
+    del index["related"][slug]
+    for other_slug, related in index["related"].items():
+        if any(related_slug == slug for _, related_slug in related):
+            scores = _similarities(index, index["vectors"][other_slug])
+            scores.pop(other_slug, None)
+            index["related"][other_slug] = _top_related(index, scores)
+
+
+def add_post(index: RelatedIndex, post: BlogPostDict) -> None:
+    """
+    Add or replace a single post without recomputing the whole index.
+
+    The new post is weighted with the updated document frequencies. Vectors
+    of existing posts keep their weights until the next full build, which
+    only shifts their IDF slightly as the corpus grows.
+
+    Parameters
+    ----------
+    index : RelatedIndex
+        Index to update in place
+    post : BlogPostDict
+        Parsed post of the index's language
+    """
+    slug = post["slug"]
+    remove_post(index, slug)
+
+    frequencies = _term_frequencies(post, index["language"])
+    document_frequency = index["document_frequency"]
+    for token in frequencies:
+        document_frequency[token] = document_frequency.get(token, 0) + 1
+
+    vector = _tfidf_vector(frequencies, document_frequency, len(index["vectors"]) + 1)
+    _insert_vector(index, slug, vector)
+
+
+def get_related_slugs(index: RelatedIndex, slug: str) -> list[str]:
+    """
+    Get the slugs of the posts most similar to a post.
+
+    Parameters
+    ----------
+    index : RelatedIndex
+        Index of the post's language
+    slug : str
+        Slug of the post
+
+    Returns
+    -------
+    list[str]
+        Related slugs, most similar first
+    """
+    return [related_slug for _, related_slug in index["related"].get(slug, [])]
+
+
+def _invalidate_related_index(language: str) -> None:
+    """Drop the index of a language after its posts were reloaded."""
+    _related_index_cache.pop(language, None)
+
+
+def _update_related_index(
+    language: str, old_post: BlogPostDict | None, new_post: BlogPostDict | None
+) -> None:
+    """Apply a single post change to the cached index of its language."""
+    index = _related_index_cache.get(language)
+    if index is None:
+        return
+
+    if old_post:
+        remove_post(index, old_post["slug"])
+    if new_post:
+        add_post(index, new_post)
+
+
+blog_service.register_reload_hook(_invalidate_related_index, _update_related_index)
+
+
+def get_related_index(language: str) -> RelatedIndex:
+    """Get the cached related posts index of a language, building it on first use."""
+    if language not in _related_index_cache:
+        posts = blog_service.load_all_posts(force_reload=False, language=language)
+        _related_index_cache[language] = build_related_index(
+            posts, language, config.blog_related_posts
+        )
+
+    return _related_index_cache[language]
+
+
+def load_related_listings(language: str) -> dict[str, list[BlogListingDict]]:
+    """
+    Map every post of a language to the listing records of its related posts.
+
+    Parameters
+    ----------
+    language : str
+        Language code ("nl", "de", or "en")
+
+    Returns
+    -------
+    dict[str, list[BlogListingDict]]
+        Post slug → listings of the related posts, most similar first.
+        Empty if related posts are disabled.
+    """
+    if not config.blog_related_posts:
+        return {}
+
+    index = get_related_index(language)
+    listings_by_slug = {
+        listing["slug"]: listing for listing in blog_service.load_all_listings(language)
+    }
+    return {
+        slug: [
+            listings_by_slug[related_slug]
+            for related_slug in get_related_slugs(index, slug)
+            if related_slug in listings_by_slug
+        ]
+        for slug in index["related"]
+    }
@@ -0,0 +1,217 @@
+"""Full-text search over blog posts using an in-memory BM25 inverted index."""
+
+from collections import Counter
+import heapq
+import math
+import re
+
+from ..models.blog_content import HeadingBlock, ImageBlock, ListBlock, ParagraphBlock
+from ..models.blog_post import BlogPostDict
+from ..models.search import SearchDocument, SearchIndex, SearchResult
+from . import blog_service
+from .text_analysis import fold_diacritics, strip_markdown, tokenize
+
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Tokens in these fields count multiple times towards the term frequency.
+TITLE_WEIGHT = 3
+SUMMARY_WEIGHT = 2
+HEADING_WEIGHT = 2
+
+SNIPPET_CONTEXT_BEFORE = 60
+SNIPPET_LENGTH = 180
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+_search_index_cache: dict[str, SearchIndex] = {}
+
+
+def _extract_blocks(post: BlogPostDict) -> list[tuple[str, int]]:
+    """Collect the searchable plain text of a post with the weight per block."""
+    blocks = [(post["title"], TITLE_WEIGHT), (post["summary"], SUMMARY_WEIGHT)]
+
+    for block in post["content_objects"]:
+        if isinstance(block, HeadingBlock):
+            blocks.append((strip_markdown(block.content), HEADING_WEIGHT))
+        elif isinstance(block, ParagraphBlock):
+            blocks.append((strip_markdown(block.content), 1))
+        elif isinstance(block, ListBlock):
+            blocks.extend((strip_markdown(item), 1) for item in block.items)
+        elif isinstance(block, ImageBlock) and block.alt:
+            blocks.append((strip_markdown(block.alt), 1))
+
+    return blocks
+
+
+def build_search_index(posts: list[BlogPostDict], language: str) -> SearchIndex:
+    """
+    Build an inverted index over the posts of one language.
+
+    Parameters
+    ----------
+    posts : list[BlogPostDict]
+        Parsed posts of the language
+    language : str
+        Language code ("nl", "de", or "en") used for tokenization
+
+    Returns
+    -------
+    SearchIndex
+        Index with postings per token and document statistics for BM25
+    """
+    documents: list[SearchDocument] = []
+    postings: dict[str, list[tuple[int, int]]] = {}
+
+    for doc_id, post in enumerate(posts):
+        blocks = _extract_blocks(post)
+        term_frequencies: Counter[str] = Counter()
+        for text, weight in blocks:
+            for token in tokenize(text, language):
+                term_frequencies[token] += weight
+
+        for token, frequency in term_frequencies.items():
+            postings.setdefault(token, []).append((doc_id, frequency))
+
+        documents.append(
+            {
+                "slug": post["slug"],
+                "title": post["title"],
+                "url": f"/{language}/blog/{post['slug']}/",
+                "blocks": [text for text, _ in blocks[1:] if text],
+                "length": sum(term_frequencies.values()),
+            }
+        )
+
+    total_length = sum(document["length"] for document in documents)
+
+    return {
+        "language": language,
+        "documents": documents,
+        "postings": postings,
+        "average_length": total_length / len(documents) if documents else 0.0,
+    }
+
+
+def _build_snippet(document: SearchDocument, query_tokens: set[str]) -> str:
+    """Cut an excerpt around the first word matching one of the query tokens."""
+    for block in document["blocks"]:
+        for match in _WORD_PATTERN.finditer(block):
+            if fold_diacritics(match.group()) not in query_tokens:
+                continue
+
+            start = max(0, match.start() - SNIPPET_CONTEXT_BEFORE)
+            if start > 0:
+                start = block.find(" ", start) + 1 or start
+            end = min(len(block), start + SNIPPET_LENGTH)
+            if end < len(block):
+                last_space = block.rfind(" ", start, end)
+                if last_space > start:
+                    end = last_space
+
+            prefix = "…" if start > 0 else ""
+            suffix = "…" if end < len(block) else ""
+            return f"{prefix}{block[start:end].strip()}{suffix}"
+
+    first_block = document["blocks"][0] if document["blocks"] else ""
+    if len(first_block) <= SNIPPET_LENGTH:
+        return first_block
+    return f"{first_block[:SNIPPET_LENGTH].rsplit(' ', 1)[0]}…"
+
+
+def search(index: SearchIndex, query: str, limit: int = 10) -> list[SearchResult]:
+    """
+    Rank the indexed posts for a query with BM25.
+
+    Parameters
+    ----------
+    index : SearchIndex
+        Index of one language, see build_search_index()
+    query : str
+        Free text query, e.g., "hielspoor steunzolen"
+    limit : int
+        Maximum number of results (default: 10)
+
+    Returns
+    -------
+    list[SearchResult]
+        Best matching posts, highest score first
+    """
+    query_tokens = set(tokenize(query, index["language"]))
+    documents = index["documents"]
+    if not query_tokens or not documents:
+        return []
+
+    total_documents = len(documents)
+    average_length = index["average_length"] or 1.0
+    scores: dict[int, float] = {}
+
+    for token in query_tokens:
+        token_postings = index["postings"].get(token)
+        if not token_postings:
+            continue
+
+        document_frequency = len(token_postings)
+        idf = math.log(
+            1
+            + (total_documents - document_frequency + 0.5) / (document_frequency + 0.5)
+        )
+        for doc_id, frequency in token_postings:
+            length_norm = (
+                1 - BM25_B + BM25_B * documents[doc_id]["length"] / average_length
+            )
+            scores[doc_id] = scores.get(doc_id, 0.0) + idf * (
+                frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * length_norm)
+            )
+
+    best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    return [
+        {
+            "slug": documents[doc_id]["slug"],
+            "title": documents[doc_id]["title"],
+            "url": documents[doc_id]["url"],
+            "score": round(score, 4),
+            "snippet": _build_snippet(documents[doc_id], query_tokens),
+        }
+        for doc_id, score in best
+    ]
+
+
+def _invalidate_search_index(language: str) -> None:
+    """Drop the index of a language after its posts were reloaded."""
+    _search_index_cache.pop(language, None)
+
+
+blog_service.register_reload_hook(_invalidate_search_index)
+
+
+def get_search_index(language: str) -> SearchIndex:
+    """Get the cached search index of a language, building it on first use."""
+    if language not in _search_index_cache:
+        posts = blog_service.load_all_posts(force_reload=False, language=language)
+        _search_index_cache[language] = build_search_index(posts, language)
+
+    return _search_index_cache[language]
+
+
+def search_posts(query: str, language: str, limit: int = 10) -> list[SearchResult]:
+    """
+    Search the blog posts of a language.
+
+    Parameters
+    ----------
+    query : str
+        Free text query
+    language : str
+        Language code ("nl", "de", or "en")
+    limit : int
+        Maximum number of results (default: 10)
+
+    Returns
+    -------
+    list[SearchResult]
+        Best matching posts, highest score first
+    """
+    return search(get_search_index(language), query, limit)
@@ -0,0 +1,118 @@
+"""Language-aware text normalisation and tokenization for blog content."""
+
+import re
+import unicodedata
+
+
+STOPWORDS: dict[str, frozenset[str]] = {
+    "nl": frozenset(
+        (
+            "aan al alle als alles ben bij dan dat de der deze die dit doch doen "
+            "door dus een eens en er ga gaan geen had heb hebben heeft hem het hier "
+            "hij hoe hun ik in is ja je jij jou jouw kan kon kunnen maar me meer men "
+            "met mij mijn moet na naar niet niets nog nu of om omdat ons onze ook op "
+            "over te tegen tot u uit uw van veel voor want waren was wat we wel werd "
+            "wie wij wil worden wordt zal ze zei zelf zich zij zijn zo zonder zou"
+        ).split()
+    ),
+    "en": frozenset(
+        (
+            "a about after all also am an and any are as at be because been before "
+            "being but by can could did do does doing for from had has have having "
+            "he her here him his how i if in into is it its just me more most my no "
+            "nor not of on once only or other our out over own same she should so "
+            "some such than that the their them then there these they this those "
+            "through to too under until up very was we were what when where which "
+            "while who whom why will with would you your"
+        ).split()
+    ),
+    "de": frozenset(
+        (
+            "aber alle allem als also am an auch auf aus bei bin bis bist da damit "
+            "dann das dass dein deine dem den der des dich die dies diese dieser "
+            "dir doch dort du durch ein eine einem einen einer eines er es euch "
+            "euer für hab habe haben hat hatte ich ihr ihre im in ist ja jede kann "
+            "kein keine man mein meine mich mir mit muss nach nicht noch nur ob "
+            "oder ohne sehr sein seine sich sie sind so über um und uns unser "
+            "unter vom von vor war waren was weil wenn wer wie wir wird wo zu zum "
+            "zur"
+        ).split()
+    ),
+}
+
+_MARKDOWN_LINK_PATTERN = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_MARKDOWN_SYMBOL_PATTERN = re.compile(r"[*_`#>~]+")
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Letters that NFKD does not decompose into a base letter plus diacritic.
+_SPECIAL_FOLDS = str.maketrans({"ß": "ss", "ø": "o", "æ": "ae", "œ": "oe", "ł": "l"})
+
+
+def fold_diacritics(text: str) -> str:
+    """
+    Lowercase text and strip diacritics (é → e, ü → u, ß → ss).
+
+    Parameters
+    ----------
+    text : str
+        Text to normalise
+
+    Returns
+    -------
+    str
+        Lowercase ASCII-folded text
+    """
+    lowered = text.lower().translate(_SPECIAL_FOLDS)
+    decomposed = unicodedata.normalize("NFKD", lowered)
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+_FOLDED_STOPWORDS = {
+    language: frozenset(fold_diacritics(word) for word in words)
+    for language, words in STOPWORDS.items()
+}
+
+
+def strip_markdown(text: str) -> str:
+    """
+    Reduce inline markdown to its visible text.
+
+    Links and images keep their label, emphasis and heading markers are
+    removed.
+
+    Parameters
+    ----------
+    text : str
+        Markdown text as stored in the content objects
+
+    Returns
+    -------
+    str
+        Plain text
+    """
+    text = _MARKDOWN_LINK_PATTERN.sub(r"\1", text)
+    return _MARKDOWN_SYMBOL_PATTERN.sub("", text)
+
+
+def tokenize(text: str, language: str) -> list[str]:
+    """
+    Split text into folded tokens, dropping the stopwords of the language.
+
+    Parameters
+    ----------
+    text : str
+        Plain text or inline markdown
+    language : str
+        Language code ("nl", "de", or "en") selecting the stopword list
+
+    Returns
+    -------
+    list[str]
+        Tokens in document order; duplicates are kept
+    """
+    stopwords = _FOLDED_STOPWORDS.get(language, frozenset())
+    return [
+        token
+        for token in _TOKEN_PATTERN.findall(fold_diacritics(strip_markdown(text)))
+        if token not in stopwords and len(token) > 1
+    ]
@@ -0,0 +1,119 @@
+"""Typo tolerant lookup of short names using a character trigram index."""
+
+from collections import Counter
+import re
+
+from ..models.trigram import TrigramIndex
+from .text_analysis import fold_diacritics
+
+
+# Share of the query's trigrams a text needs to contain to match. "zilveren
+# krus" shares 10 of its 12 trigrams with "zilveren kruis", the swapped
+# letters of "menzsi" still leave 3 of 6 trigrams of "menzis".
+MIN_SIMILARITY = 0.5
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def trigrams(text: str) -> set[str]:
+    """
+    Get the distinct trigrams of the words of a text.
+
+    Words are lowercased, stripped of diacritics and padded with a space on
+    both sides, so that word starts and ends form trigrams of their own
+    ("menzis" → " me", "men", ..., "is ").
+
+    Parameters
+    ----------
+    text : str
+        Text to split, e.g., an insurer name
+
+    Returns
+    -------
+    set[str]
+        Trigrams of all words in the text
+    """
+    grams: set[str] = set()
+    for word in _WORD_PATTERN.findall(fold_diacritics(text)):
+        padded = f" {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def build_trigram_index(texts: list[str]) -> TrigramIndex:
+    """
+    Build a trigram index over a list of texts.
+
+    Parameters
+    ----------
+    texts : list[str]
+        Texts to index; their positions identify them in match results
+
+    Returns
+    -------
+    TrigramIndex
+        Postings per trigram and the trigram count of each text
+    """
+    postings: dict[str, list[int]] = {}
+    sizes: list[int] = []
+
+    for position, text in enumerate(texts):
+        grams = trigrams(text)
+        sizes.append(len(grams))
+        for gram in grams:
+            postings.setdefault(gram, []).append(position)
+
+    return {"postings": postings, "sizes": sizes}
+
+
+def match_trigrams(
+    index: TrigramIndex,
+    query: str,
+    min_similarity: float = MIN_SIMILARITY,
+    limit: int | None = None,
+) -> list[tuple[int, float]]:
+    """
+    Find the indexed texts that contain most trigrams of a query.
+
+    The similarity is the share of the query's trigrams found in a text, so
+    a query matches texts that contain it with a few typos. Texts with equal
+    similarity are ranked by their number of trigrams, shortest first, so
+    that "zilveren kruis" prefers "Zilveren Kruis" over "Aon Vitaal
+    (Zilveren Kruis)".
+
+    Parameters
+    ----------
+    index : TrigramIndex
+        Index built by build_trigram_index()
+    query : str
+        Text as typed by the user
+    min_similarity : float
+        Minimum similarity between 0 and 1 (default: MIN_SIMILARITY)
+    limit : int | None
+        Maximum number of matches, None for all (default: None)
+
+    Returns
+    -------
+    list[tuple[int, float]]
+        (position, similarity) of the matching texts, best match first
+    """
+    query_grams = trigrams(query)
+    if not query_grams:
+        return []
+
+    shared: Counter[int] = Counter()
+    for gram in query_grams:
+        shared.update(index["postings"].get(gram, ()))
+
+    required = min_similarity * len(query_grams)
+    sizes = index["sizes"]
+    matches = sorted(
+        (
+            (position, count / len(query_grams))
+            for position, count in shared.items()
+            if count >= required
+        ),
+        key=lambda match: (-match[1], sizes[match[0]], match[0]),
+    )
+
+    return matches if limit is None else matches[:limit]
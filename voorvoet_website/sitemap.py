@@ -0,0 +1,65 @@
+"""Sitemap plugin that also lists pages served by dynamic routes.
+
+Reflex adds one sitemap entry per registered page and skips dynamic routes
+such as ``/nl/blog/[slug]``. With ``config.blog_dynamic_routes`` enabled the
+blog posts have no page of their own, so the app registers their URLs here
+and the plugin appends them to the generated sitemap.
+"""
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from reflex.config import get_config
+from reflex.plugins.sitemap import (
+    Constants,
+    SitemapLink,
+    SitemapLinkConfiguration,
+    SitemapPlugin,
+    configuration_with_loc,
+    generate_links_for_sitemap,
+    generate_xml,
+)
+
+if TYPE_CHECKING:
+    from reflex.app import UnevaluatedPage
+
+_extra_links: list[tuple[str, SitemapLinkConfiguration]] = []
+
+
+def add_sitemap_link(loc: str, sitemap_config: SitemapLinkConfiguration) -> None:
+    """
+    Register a URL that has no page of its own for the sitemap.
+
+    Parameters
+    ----------
+    loc : str
+        Route of the URL (e.g., "/nl/blog/hielspoor")
+    sitemap_config : SitemapLinkConfiguration
+        Sitemap options such as changefreq and priority
+    """
+    _extra_links.append((loc, sitemap_config))
+
+
+def _sitemap_task(
+    unevaluated_pages: Sequence["UnevaluatedPage"],
+    extra_links: list[tuple[str, SitemapLinkConfiguration]],
+) -> tuple[str, str]:
+    """Generate the sitemap of the pages plus the registered extra URLs."""
+    deploy_url = get_config().deploy_url
+
+    links: list[SitemapLink] = generate_links_for_sitemap(unevaluated_pages)
+    links.extend(
+        configuration_with_loc(config=sitemap_config, deploy_url=deploy_url, loc=loc)
+        for loc, sitemap_config in extra_links
+    )
+
+    return str(Constants.FILE_PATH), generate_xml(links)
+
+
+class DynamicRouteSitemapPlugin(SitemapPlugin):
+    """Sitemap plugin including the URLs registered with add_sitemap_link()."""
+
+    def pre_compile(self, **context: Any) -> None:
+        """Generate the sitemap XML file before compilation."""
+        unevaluated_pages = context.get("unevaluated_pages", [])
+        context["add_save_task"](_sitemap_task, unevaluated_pages, list(_extra_links))
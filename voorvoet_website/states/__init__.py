@@ -1,8 +1,9 @@
 """States module."""
 
 from .website_state import WebsiteState
+from .blog_post_state import BlogPostState
 from .contact_state import ContactState
 from .order_insoles_state import OrderInsolesState
 
 
-__all__ = ["WebsiteState", "ContactState", "OrderInsolesState"]
+__all__ = ["WebsiteState", "BlogPostState", "ContactState", "OrderInsolesState"]
@@ -0,0 +1,107 @@
+"""Blog post state for the shared dynamic blog post page.
+
+When ``config.blog_dynamic_routes`` is enabled, every post of a language is
+served by one compiled page. This state looks the requested post up in the
+in-memory blog store on page load; the typed content blocks are converted to
+plain dicts only here, at the state boundary.
+"""
+
+import reflex as rx
+from reflex.event import EventSpec
+from typing import Any
+
+from ..components.structured_data import article_json_ld, breadcrumb_json_ld
+from ..config import config
+from ..models import BlogListingDict
+from ..services.blog_service import get_post_by_slug, get_story_index
+from ..services.related_posts_service import load_related_listings
+from ..translations import get_blog_post_breadcrumbs, get_blog_post_hreflang_links
+
+
+class BlogPostState(rx.State):
+    """
+    State holding the blog post shown on the dynamic blog post page.
+
+    Attributes
+    ----------
+    title : str
+        Title of the post
+    summary : str
+        Summary of the post, used for the meta description
+    author : str
+        Author name
+    formatted_date : str
+        Publication date formatted for the post language
+    route : str
+        Route of the post (e.g., "/nl/blog/hielspoor")
+    image_url : str
+        Full URL of the post thumbnail, empty if the post has none
+    content : list[dict[str, Any]]
+        Content blocks of the article as dicts (see ``ContentBlock.to_dict``)
+    related : list[BlogListingDict]
+        Listing records of related posts
+    hreflang_links : list[dict[str, str]]
+        Language alternates with 'hreflang' and 'href' keys
+    article_json_ld : str
+        Article structured data
+    breadcrumb_json_ld : str
+        BreadcrumbList structured data
+    """
+
+    title: str = ""
+    summary: str = ""
+    author: str = ""
+    formatted_date: str = ""
+    route: str = ""
+    image_url: str = ""
+    content: list[dict[str, Any]] = []
+    related: list[BlogListingDict] = []
+    hreflang_links: list[dict[str, str]] = []
+    article_json_ld: str = ""
+    breadcrumb_json_ld: str = ""
+
+    @rx.var
+    def has_related(self) -> bool:
+        """Whether the post has related posts to show."""
+        return len(self.related) > 0
+
+    @rx.event
+    def load_post(self, language: str) -> EventSpec | None:
+        """
+        Load the post whose slug is the last segment of the current URL.
+
+        Parameters
+        ----------
+        language : str
+            Language of the blog the route belongs to
+
+        Returns
+        -------
+        EventSpec | None
+            A redirect to the 404 page if the language has no such post
+        """
+        slug = self.router.url.path.strip("/").rsplit("/", 1)[-1]
+        post = get_post_by_slug(language, slug)
+        if post is None:
+            return rx.redirect("/404")
+
+        self.title = post["title"]
+        self.summary = post["summary"]
+        self.author = post["author"]
+        self.formatted_date = post["formatted_date"]
+        self.route = f"/{language}/blog/{slug}"
+        self.image_url = (
+            f"{config.site_url}{post['thumbnail_fallback']}"
+            if post["thumbnail_fallback"]
+            else ""
+        )
+        self.content = [block.to_dict() for block in post["content_objects"]]
+        self.related = load_related_listings(language).get(slug, [])
+        self.hreflang_links = get_blog_post_hreflang_links(
+            post["story_number"], get_story_index()
+        )
+        self.article_json_ld = article_json_ld(post, language)
+        self.breadcrumb_json_ld = breadcrumb_json_ld(
+            get_blog_post_breadcrumbs(language, post["title"], slug)
+        )
+        return None
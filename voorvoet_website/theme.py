@@ -8,6 +8,8 @@ The theme uses a teal/green color palette aligned with the VoorVoet brand,
 with responsive font sizes and spacing patterns for mobile-first design.
 """
 
+from typing import Any
+
 
 class Colors:
     """Color palette for the VoorVoet brand and UI elements.
@@ -317,3 +319,14 @@ class ImageDimensions:
 
     footer_logo_nvvp = {"width": "224", "height": "100"}
     footer_logo_krp = {"width": "365", "height": "100"}
+
+
+# Stylesheets and root style shared by every app serving the site pages.
+STYLESHEETS = [
+    "https://cdnjs.cloudflare.com/ajax/libs/lato-font/3.0.0/css/lato-font.min.css",
+    "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/4.7.0/css/font-awesome.min.css",
+    "/styles.css",
+]
+APP_STYLE: dict[Any, Any] = {
+    "font-family": "Lato, ui-sans-serif, system-ui, sans-serif",
+}
@@ -3,7 +3,6 @@
 import reflex as rx
 
 from .config import config
-from .models import BlogPostDict
 
 
 PAGE_TITLES = {
@@ -145,6 +144,9 @@ ROUTE_MAPPINGS = {
     },
 }
 
+BLOG_PAGE_SEGMENTS = {"nl": "pagina", "de": "seite", "en": "page"}
+BLOG_CATEGORY_SEGMENTS = {"nl": "categorie", "de": "kategorie", "en": "category"}
+
 PAGE_ROUTES = {
     "home": {"nl": "/nl", "de": "/de", "en": "/en"},
     "blog": {"nl": "/nl/blog", "de": "/de/blog", "en": "/en/blog"},
@@ -168,6 +170,74 @@ PAGE_ROUTES = {
 }
 
 
+def get_blog_page_route(language: str, page: int) -> str:
+    """
+    Get the route of a blog overview page.
+
+    Parameters
+    ----------
+    language : str
+        The language code ("nl", "de", "en")
+    page : int
+        1-based page number
+
+    Returns
+    -------
+    str
+        The blog route for page 1 (e.g., "/nl/blog"), otherwise the paginated
+        route (e.g., "/nl/blog/pagina/2")
+    """
+    blog_route = ROUTE_MAPPINGS[language]["blog"]
+    if page <= 1:
+        return blog_route
+    return f"{blog_route}/{BLOG_PAGE_SEGMENTS[language]}/{page}"
+
+
+def get_blog_category_route(language: str, category_slug: str, page: int = 1) -> str:
+    """
+    Get the route of a blog category overview page.
+
+    Parameters
+    ----------
+    language : str
+        The language code ("nl", "de", "en")
+    category_slug : str
+        URL slug of the category
+    page : int, optional
+        1-based page number, defaults to 1
+
+    Returns
+    -------
+    str
+        The category route (e.g., "/nl/blog/categorie/behandelingen"), for
+        further pages followed by the page segment (e.g., ".../pagina/2")
+    """
+    blog_route = ROUTE_MAPPINGS[language]["blog"]
+    route = f"{blog_route}/{BLOG_CATEGORY_SEGMENTS[language]}/{category_slug}"
+    if page <= 1:
+        return route
+    return f"{route}/{BLOG_PAGE_SEGMENTS[language]}/{page}"
+
+
+def get_blog_feed_route(language: str, feed_format: str) -> str:
+    """
+    Get the URL path of a blog feed served by the backend.
+
+    Parameters
+    ----------
+    language : str
+        The language code ("nl", "de", "en")
+    feed_format : str
+        "rss" or "atom"
+
+    Returns
+    -------
+    str
+        The feed route (e.g., "/api/blog/nl/rss.xml")
+    """
+    return f"/api/blog/{language}/{feed_format}.xml"
+
+
 def get_favicon_links() -> list[rx.Component]:
     return [
         rx.el.link(
@@ -246,39 +316,187 @@ def get_hreflang_tags(page_key: str) -> list:
     return hreflang_tags
 
 
+def get_blog_post_breadcrumbs(
+    language: str, post_title: str, slug: str
+) -> list[dict[str, str]]:
+    """
+    Get the breadcrumb trail (home, blog, post) of a blog post.
+
+    Parameters
+    ----------
+    language : str
+        The language code ("nl", "de", "en")
+    post_title : str
+        Title of the post, used as name of the last crumb
+    slug : str
+        URL slug of the post
+
+    Returns
+    -------
+    list[dict[str, str]]
+        Breadcrumb items with 'name' and 'url' keys, from root to post
+    """
+    names = BREADCRUMB_NAMES.get(language, {})
+    return [
+        {"name": names.get("home", "Home"), "url": f"{config.site_url}/{language}"},
+        {
+            "name": names.get("blog", "Blog"),
+            "url": f"{config.site_url}/{language}/blog/",
+        },
+        {"name": post_title, "url": f"{config.site_url}/{language}/blog/{slug}/"},
+    ]
+
+
+def get_blog_category_breadcrumbs(
+    language: str, category_name: str, category_slug: str
+) -> list[dict[str, str]]:
+    """
+    Get the breadcrumb trail (home, blog, category) of a blog category page.
+
+    Parameters
+    ----------
+    language : str
+        The language code ("nl", "de", "en")
+    category_name : str
+        Name of the category, used as name of the last crumb
+    category_slug : str
+        URL slug of the category
+
+    Returns
+    -------
+    list[dict[str, str]]
+        Breadcrumb items with 'name' and 'url' keys, from root to category
+    """
+    names = BREADCRUMB_NAMES.get(language, {})
+    return [
+        {"name": names.get("home", "Home"), "url": f"{config.site_url}/{language}"},
+        {
+            "name": names.get("blog", "Blog"),
+            "url": f"{config.site_url}/{language}/blog/",
+        },
+        {
+            "name": category_name,
+            "url": f"{config.site_url}{get_blog_category_route(language, category_slug)}",
+        },
+    ]
+
+
+def get_blog_category_hreflang_links(
+    alternates: dict[str, str],
+) -> list[dict[str, str]]:
+    """
+    Get the hreflang alternates of a blog category page as plain data.
+
+    Parameters
+    ----------
+    alternates : dict[str, str]
+        Category slug per language, see blog_service.build_category_index()
+
+    Returns
+    -------
+    list[dict[str, str]]
+        One item with 'hreflang' and 'href' keys per language variant, plus
+        an "x-default" item pointing to the Dutch variant if there is one
+    """
+    links = [
+        {
+            "hreflang": lang,
+            "href": f"{config.site_url}{get_blog_category_route(lang, slug)}",
+        }
+        for lang, slug in alternates.items()
+    ]
+
+    if "nl" in alternates:
+        links.append(
+            {
+                "hreflang": "x-default",
+                "href": f"{config.site_url}{get_blog_category_route('nl', alternates['nl'])}",
+            }
+        )
+
+    return links
+
+
+_blog_hreflang_cache: dict[tuple[tuple[str, str], ...], list] = {}
+
+
+def get_blog_post_hreflang_links(
+    story_number: str, story_index: dict[str, dict[str, str]]
+) -> list[dict[str, str]]:
+    """
+    Get the hreflang alternates of a blog post as plain data.
+
+    Parameters
+    ----------
+    story_number : str
+        Story number shared by all language variants of the post
+    story_index : dict[str, dict[str, str]]
+        Index of the form {story_number: {language: slug}}, see
+        blog_service.build_story_index()
+
+    Returns
+    -------
+    list[dict[str, str]]
+        One item with 'hreflang' and 'href' keys per language variant, plus
+        an "x-default" item pointing to the Dutch variant if there is one
+    """
+    slugs = story_index.get(story_number, {})
+
+    links = [
+        {"hreflang": lang, "href": f"{config.site_url}/{lang}/blog/{slug}"}
+        for lang, slug in slugs.items()
+    ]
+
+    if "nl" in slugs:
+        links.append(
+            {
+                "hreflang": "x-default",
+                "href": f"{config.site_url}/nl/blog/{slugs['nl']}",
+            }
+        )
+
+    return links
+
+
 def get_blog_post_hreflang_tags(
-    story_number: str, all_blog_posts: dict[str, list[BlogPostDict]]
+    story_number: str, story_index: dict[str, dict[str, str]]
 ) -> list:
-    """Generate hreflang tags for blog posts based on story number."""
-    hreflang_tags = []
-    nl_slug = None
-
-    for lang, posts in all_blog_posts.items():
-        for post in posts:
-            if post.get("story_number") == story_number:
-                slug = post["slug"]
-                full_url = f"{config.site_url}/{lang}/blog/{slug}"
-                hreflang_tags.append(
-                    rx.el.link(
-                        rel="alternate",
-                        href=full_url,
-                        custom_attrs={"hreflang": lang},
-                    )
-                )
-                if lang == "nl":
-                    nl_slug = slug
-                break
-
-    if nl_slug:
-        default_url = f"{config.site_url}/nl/blog/{nl_slug}"
-        hreflang_tags.append(
-            rx.el.link(
-                rel="alternate",
-                href=default_url,
-                custom_attrs={"hreflang": "x-default"},
-            )
+    """
+    Generate hreflang tags for blog posts based on story number.
+
+    The tags are looked up in the precomputed story index and memoized per
+    set of language slugs, so all language variants of a story share one
+    list of link components.
+
+    Parameters
+    ----------
+    story_number : str
+        Story number shared by all language variants of the post
+    story_index : dict[str, dict[str, str]]
+        Index of the form {story_number: {language: slug}}, see
+        blog_service.build_story_index()
+
+    Returns
+    -------
+    list
+        List of rx.el.link components with hreflang attributes
+    """
+    slugs = story_index.get(story_number, {})
+    cache_key = tuple(slugs.items())
+
+    if cache_key in _blog_hreflang_cache:
+        return _blog_hreflang_cache[cache_key]
+
+    hreflang_tags = [
+        rx.el.link(
+            rel="alternate",
+            href=link["href"],
+            custom_attrs={"hreflang": link["hreflang"]},
         )
+        for link in get_blog_post_hreflang_links(story_number, story_index)
+    ]
 
+    _blog_hreflang_cache[cache_key] = hreflang_tags
     return hreflang_tags
 
 
@@ -288,6 +506,7 @@ def get_page_meta_tags(
     route: str,
     page_type: str = "website",
     image_url: str | None = None,
+    include_hreflang: bool = True,
 ) -> list:
     """
     Generate complete meta tags for SEO including Open Graph and Twitter Cards.
@@ -304,6 +523,9 @@ def get_page_meta_tags(
         Open Graph type ("website" or "article"), defaults to "website"
     image_url : str, optional
         Full URL to the page image for Twitter Cards
+    include_hreflang : bool, optional
+        Add hreflang links to the language variants of the page, defaults
+        to True. Disable for pages without a counterpart in other languages.
 
     Returns
     -------
@@ -340,8 +562,9 @@ def get_page_meta_tags(
         )
     )
 
-    hreflang_tags = get_hreflang_tags(page_key)
-    meta_tags.extend(hreflang_tags)
+    if include_hreflang:
+        hreflang_tags = get_hreflang_tags(page_key)
+        meta_tags.extend(hreflang_tags)
 
     favicon_links = get_favicon_links()
     meta_tags.extend(favicon_links)
@@ -349,22 +572,197 @@ def get_page_meta_tags(
     return meta_tags
 
 
-def get_blog_post_meta_tags(
-    post_title: str,
-    post_summary: str,
+def get_blog_overview_meta_tags(
     language: str,
-    route: str,
-    story_number: str = "",
-    all_blog_posts: dict[str, list[BlogPostDict]] = {},
+    page: int,
+    total_pages: int,
     image_url: str | None = None,
 ) -> list:
-    """Generate post-specific meta tags for individual blog posts."""
-    full_title = f"{post_title} - VoorVoet Blog"
+    """
+    Generate meta tags for a (paginated) blog overview page.
 
-    page_url = f"{config.site_url}{route}"
+    Parameters
+    ----------
+    language : str
+        The language code ("nl", "de", "en")
+    page : int
+        1-based page number
+    total_pages : int
+        Total number of overview pages for the language
+    image_url : str, optional
+        Full URL to the page image for Twitter Cards
+
+    Returns
+    -------
+    list
+        Page meta tags, RSS/Atom feed links, and rel="prev"/rel="next"
+        links to the neighbouring overview pages. Only the first page carries
+        hreflang links, as the other pages have no equivalent in other
+        languages.
+    """
+    meta_tags = get_page_meta_tags(
+        "blog",
+        language,
+        get_blog_page_route(language, page),
+        image_url=image_url,
+        include_hreflang=page == 1,
+    )
+
+    meta_tags.append(
+        rx.el.link(
+            rel="alternate",
+            href=f"{config.site_url}{get_blog_feed_route(language, 'rss')}",
+            custom_attrs={"type": "application/rss+xml"},
+            title=PAGE_TITLES[language]["blog"],
+        )
+    )
+    meta_tags.append(
+        rx.el.link(
+            rel="alternate",
+            href=f"{config.site_url}{get_blog_feed_route(language, 'atom')}",
+            custom_attrs={"type": "application/atom+xml"},
+            title=PAGE_TITLES[language]["blog"],
+        )
+    )
+
+    if page > 1:
+        meta_tags.append(
+            rx.el.link(
+                rel="prev",
+                href=f"{config.site_url}{get_blog_page_route(language, page - 1)}",
+            )
+        )
+    if page < total_pages:
+        meta_tags.append(
+            rx.el.link(
+                rel="next",
+                href=f"{config.site_url}{get_blog_page_route(language, page + 1)}",
+            )
+        )
+
+    return meta_tags
+
+
+def get_blog_category_meta_tags(
+    language: str,
+    category_name: str,
+    category_slug: str,
+    alternates: dict[str, str],
+    page: int,
+    total_pages: int,
+    image_url: str | None = None,
+) -> list:
+    """
+    Generate meta tags for a (paginated) blog category overview page.
+
+    Parameters
+    ----------
+    language : str
+        The language code ("nl", "de", "en")
+    category_name : str
+        Name of the category
+    category_slug : str
+        URL slug of the category
+    alternates : dict[str, str]
+        Category slug per language, see blog_service.build_category_index()
+    page : int
+        1-based page number
+    total_pages : int
+        Total number of overview pages of the category
+    image_url : str, optional
+        Full URL to the page image for Twitter Cards
+
+    Returns
+    -------
+    list
+        Page meta tags and rel="prev"/rel="next" links to the neighbouring
+        pages of the category. Only the first page carries hreflang links.
+    """
+    title = f"{category_name} - VoorVoet Blog"
+    description = PAGE_DESCRIPTIONS.get(language, {}).get("blog", "")
+    page_url = (
+        f"{config.site_url}{get_blog_category_route(language, category_slug, page)}"
+    )
     locale = LOCALE_MAP.get(language, "nl_NL")
 
     meta_tags: list = [
+        {"name": "description", "content": description},
+        {"property": "og:title", "content": title},
+        {"property": "og:description", "content": description},
+        {"property": "og:url", "content": page_url},
+        {"property": "og:type", "content": "website"},
+        {"property": "og:locale", "content": locale},
+        {"property": "og:site_name", "content": "VoorVoet"},
+        {"name": "twitter:card", "content": "summary_large_image"},
+        {"name": "twitter:title", "content": title},
+        {"name": "twitter:description", "content": description},
+    ]
+
+    if image_url:
+        meta_tags.append({"name": "twitter:image", "content": image_url})
+
+    meta_tags.append({"name": "apple-mobile-web-app-title", "content": "VoorVoet"})
+    meta_tags.append(rx.el.link(rel="canonical", href=page_url))
+
+    if page == 1:
+        meta_tags.extend(
+            rx.el.link(
+                rel="alternate",
+                href=link["href"],
+                custom_attrs={"hreflang": link["hreflang"]},
+            )
+            for link in get_blog_category_hreflang_links(alternates)
+        )
+
+    if page > 1:
+        previous_route = get_blog_category_route(language, category_slug, page - 1)
+        meta_tags.append(
+            rx.el.link(rel="prev", href=f"{config.site_url}{previous_route}")
+        )
+    if page < total_pages:
+        next_route = get_blog_category_route(language, category_slug, page + 1)
+        meta_tags.append(rx.el.link(rel="next", href=f"{config.site_url}{next_route}"))
+
+    meta_tags.extend(get_favicon_links())
+
+    return meta_tags
+
+
+def get_blog_post_meta(
+    language: str,
+    post_title: str | rx.Var,
+    post_summary: str | rx.Var,
+    page_url: str | rx.Var,
+    image_url: str | rx.Var | None = None,
+) -> list[dict]:
+    """
+    Get the title, description, Open Graph and Twitter meta of a blog post.
+
+    Shared by the compiled post pages, the dynamic post page (with state
+    vars as values) and the server rendered head of dynamic post routes.
+
+    Parameters
+    ----------
+    language : str
+        The language code ("nl", "de", "en")
+    post_title : str | rx.Var
+        Title of the post
+    post_summary : str | rx.Var
+        Summary of the post
+    page_url : str | rx.Var
+        Full URL of the post
+    image_url : str | rx.Var | None
+        Full URL of the post thumbnail, None to leave out twitter:image
+
+    Returns
+    -------
+    list[dict]
+        Meta tag dictionaries with a 'name' or 'property' and a 'content' key
+    """
+    full_title = f"{post_title} - VoorVoet Blog"
+    locale = LOCALE_MAP.get(language, "nl_NL")
+
+    meta: list[dict] = [
         {"name": "description", "content": post_summary},
         {"property": "og:title", "content": full_title},
         {"property": "og:description", "content": post_summary},
@@ -377,10 +775,29 @@ def get_blog_post_meta_tags(
         {"name": "twitter:description", "content": post_summary},
     ]
 
-    if image_url:
-        meta_tags.append({"name": "twitter:image", "content": image_url})
+    if image_url is not None:
+        meta.append({"name": "twitter:image", "content": image_url})
 
-    meta_tags.append({"name": "apple-mobile-web-app-title", "content": "VoorVoet"})
+    meta.append({"name": "apple-mobile-web-app-title", "content": "VoorVoet"})
+
+    return meta
+
+
+def get_blog_post_meta_tags(
+    post_title: str,
+    post_summary: str,
+    language: str,
+    route: str,
+    story_number: str = "",
+    story_index: dict[str, dict[str, str]] | None = None,
+    image_url: str | None = None,
+) -> list:
+    """Generate post-specific meta tags for individual blog posts."""
+    page_url = f"{config.site_url}{route}"
+
+    meta_tags: list = get_blog_post_meta(
+        language, post_title, post_summary, page_url, image_url
+    )
 
     meta_tags.append(
         rx.el.link(
@@ -389,11 +806,71 @@ def get_blog_post_meta_tags(
         )
     )
 
-    if story_number:
-        hreflang_tags = get_blog_post_hreflang_tags(story_number, all_blog_posts)
+    if story_number and story_index is not None:
+        hreflang_tags = get_blog_post_hreflang_tags(story_number, story_index)
         meta_tags.extend(hreflang_tags)
 
     favicon_links = get_favicon_links()
     meta_tags.extend(favicon_links)
 
     return meta_tags
+
+
+def get_dynamic_blog_post_meta_tags(
+    language: str,
+    post_title: str | rx.Var,
+    post_summary: str | rx.Var,
+    route: str | rx.Var,
+    image_url: str | rx.Var,
+    hreflang_links: list[dict[str, str]] | rx.Var,
+) -> list:
+    """
+    Generate the meta tags of the shared dynamic blog post page.
+
+    Mirrors get_blog_post_meta_tags(), but the post fields are state vars
+    that are filled in when a post is loaded, so one compiled page serves
+    every post of a language. Crawlers that do not run JavaScript get the
+    tags of the post from the backend instead, see
+    services.head_renderer.render_blog_post_head().
+
+    Parameters
+    ----------
+    language : str
+        The language code ("nl", "de", "en")
+    post_title : str | rx.Var
+        Title of the post
+    post_summary : str | rx.Var
+        Summary of the post
+    route : str | rx.Var
+        Route of the post (e.g., "/nl/blog/hielspoor")
+    image_url : str | rx.Var
+        Full URL of the post thumbnail
+    hreflang_links : list[dict[str, str]] | rx.Var
+        Items with 'hreflang' and 'href' keys, see
+        get_blog_post_hreflang_links()
+
+    Returns
+    -------
+    list
+        Meta tag dictionaries and link components for app.add_page()
+    """
+    page_url = f"{config.site_url}{route}"
+
+    meta_tags: list = get_blog_post_meta(
+        language, post_title, post_summary, page_url, image_url
+    )
+    meta_tags += [
+        rx.el.link(rel="canonical", href=page_url),
+        rx.foreach(
+            hreflang_links,
+            lambda link: rx.el.link(
+                rel="alternate",
+                href=link["href"],
+                custom_attrs={"hreflang": link["hreflang"]},
+            ),
+        ),
+    ]
+
+    meta_tags.extend(get_favicon_links())
+
+    return meta_tags
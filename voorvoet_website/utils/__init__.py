@@ -1,5 +1,6 @@
 """Utility functions for the VoorVoet website."""
 
 from .get_translation import get_translation
+from .wrap_with_lang_script import wrap_with_lang_script
 
-__all__ = ["get_translation"]
+__all__ = ["get_translation", "wrap_with_lang_script"]
@@ -0,0 +1,25 @@
+"""Page wrapper that sets the document language on the client."""
+
+import reflex as rx
+
+
+def wrap_with_lang_script(language: str, content: rx.Component) -> rx.Component:
+    """
+    Wrap page content with a script setting the ``lang`` attribute of the page.
+
+    Parameters
+    ----------
+    language : str
+        Language code of the page (e.g., "nl", "de", "en")
+    content : rx.Component
+        The page content
+
+    Returns
+    -------
+    rx.Component
+        Fragment holding the script followed by the content
+    """
+    return rx.fragment(
+        rx.html(f"<script>document.documentElement.lang = '{language}';</script>"),
+        content,
+    )
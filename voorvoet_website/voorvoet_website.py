@@ -3,11 +3,13 @@
 import reflex as rx
 from typing import Any, Callable
 
-from .models import BlogPostDict
+from .api import api
+from .models import BlogCategoryDict, BlogPostDict, BlogListingDict
 from .pages import (
     page_home,
     page_blog,
     page_blog_post,
+    page_blog_post_dynamic,
     page_information,
     page_reimbursements,
     page_contact,
@@ -15,17 +17,35 @@ from .pages import (
     page_credits,
     page_not_found,
 )
-from .utils import get_translation
+from .utils import get_translation, wrap_with_lang_script
 from .translations import (
     PAGE_TITLES,
     PAGE_IMAGES,
     ROUTE_MAPPINGS,
     get_page_meta_tags,
+    get_blog_category_meta_tags,
+    get_blog_category_route,
+    get_blog_overview_meta_tags,
+    get_blog_page_route,
     get_blog_post_meta_tags,
+    get_dynamic_blog_post_meta_tags,
 )
-from .services.blog_service import load_all_blog_posts_dict
+from .services.blog_service import (
+    load_all_blog_posts_dict,
+    load_all_blog_listings_dict,
+    get_category_index,
+    get_story_index,
+    paginate_listings,
+)
+from .services.blog_watcher import blog_watcher_lifespan
+from .services.feed_service import get_feed
 from .services.pricing_service import load_pricing_data
+from .services.related_posts_service import load_related_listings
+from .services.search_service import get_search_index
+from .sitemap import add_sitemap_link
+from .states import BlogPostState
 from .config import config
+from .theme import APP_STYLE, STYLESHEETS
 
 
 def get_analytics_components() -> list[rx.Component]:
@@ -44,27 +64,16 @@ def get_analytics_components() -> list[rx.Component]:
 
 app = rx.App(
     html_lang="nl",
-    stylesheets=[
-        "https://cdnjs.cloudflare.com/ajax/libs/lato-font/3.0.0/css/lato-font.min.css",
-        "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/4.7.0/css/font-awesome.min.css",
-        "/styles.css",
-    ],
-    style={
-        "font-family": "Lato, ui-sans-serif, system-ui, sans-serif",
-    },
+    stylesheets=STYLESHEETS,
+    style=APP_STYLE,
     head_components=get_analytics_components(),
+    api_transformer=api,
 )
+app.register_lifespan_task(blog_watcher_lifespan)
 
 pricing_data = load_pricing_data()
 
 
-def _wrap_with_lang_script(language: str, content: rx.Component) -> rx.Component:
-    return rx.fragment(
-        rx.html(f"<script>document.documentElement.lang = '{language}';</script>"),
-        content,
-    )
-
-
 PAGE_COMPONENTS: dict[str, Callable] = {
     "home": page_home,
     "information": page_information,
@@ -103,7 +112,7 @@ for language, page_key, page_route, page in main_pages:
             page_func: Callable[..., rx.Component], lang: str, pricing: Any
         ) -> Callable[[], rx.Component]:
             def _component() -> rx.Component:
-                return _wrap_with_lang_script(
+                return wrap_with_lang_script(
                     lang, page_func(language=lang, pricing=pricing)
                 )
 
@@ -116,7 +125,7 @@ for language, page_key, page_route, page in main_pages:
             page_func: Callable[..., rx.Component], lang: str
         ) -> Callable[[], rx.Component]:
             def _component() -> rx.Component:
-                return _wrap_with_lang_script(lang, page_func(language=lang))
+                return wrap_with_lang_script(lang, page_func(language=lang))
 
             return _component
 
@@ -143,46 +152,121 @@ for language, page_key, page_route, page in main_pages:
     app.add_page(**page_config)
 
 blog_posts = load_all_blog_posts_dict()
+blog_listings = load_all_blog_listings_dict()
+story_index = get_story_index()
+
+related_listings: dict[str, dict[str, list[BlogListingDict]]] = {}
+for language in blog_posts:
+    get_search_index(language)
+    get_feed(language, "rss")
+    get_feed(language, "atom")
+    related_listings[language] = load_related_listings(language)
+
+blog_image = PAGE_IMAGES.get("blog")
+full_blog_image_url = f"{config.site_url}{blog_image}" if blog_image else None
+
+
+def make_blog_page(
+    lang: str,
+    posts_list: list[BlogListingDict],
+    page: int,
+    total_pages: int,
+    category: BlogCategoryDict | None = None,
+) -> Callable[[], rx.Component]:
+    def _page() -> rx.Component:
+        return wrap_with_lang_script(
+            lang,
+            page_blog(
+                language=lang,
+                posts=posts_list,
+                page=page,
+                total_pages=total_pages,
+                categories=list(get_category_index(lang).values()),
+                category=category,
+            ),
+        )
+
+    return _page
+
 
 for language in ["nl", "en", "de"]:
-    posts_for_lang = blog_posts.get(language, [])
+    listing_pages = paginate_listings(
+        blog_listings.get(language, []), config.blog_page_size
+    )
+    total_pages = len(listing_pages)
 
-    def make_blog_page(lang: str, posts_list: list[Any]) -> Callable[[], rx.Component]:
-        def _page() -> rx.Component:
-            return _wrap_with_lang_script(
-                lang, page_blog(language=lang, posts=posts_list)
-            )
+    for page_number, listings_on_page in enumerate(listing_pages, start=1):
+        blog_route = get_blog_page_route(language, page_number)
+        blog_title = get_translation(PAGE_TITLES, "blog", language)
+        if page_number > 1:
+            blog_title = f"{blog_title} ({page_number}/{total_pages})"
 
-        return _page
+        blog_config: dict[str, Any] = {
+            "component": make_blog_page(
+                language, listings_on_page, page_number, total_pages
+            ),
+            "route": blog_route,
+            "title": blog_title,
+            "meta": get_blog_overview_meta_tags(
+                language, page_number, total_pages, image_url=full_blog_image_url
+            ),
+            "context": {
+                "sitemap": {
+                    "changefreq": "weekly",
+                    "priority": 0.8 if page_number == 1 else 0.5,
+                }
+            },
+        }
 
-    blog_image = PAGE_IMAGES.get("blog")
-    full_blog_image_url = f"{config.site_url}{blog_image}" if blog_image else None
-    blog_route = ROUTE_MAPPINGS[language]["blog"]
+        if full_blog_image_url:
+            blog_config["image"] = full_blog_image_url
 
-    blog_config: dict[str, Any] = {
-        "component": make_blog_page(language, posts_for_lang),
-        "route": blog_route,
-        "title": get_translation(PAGE_TITLES, "blog", language),
-        "meta": get_page_meta_tags(
-            "blog", language, blog_route, image_url=full_blog_image_url
-        ),
-        "context": {
-            "sitemap": {
-                "changefreq": "weekly",
-                "priority": 0.8,
+        app.add_page(**blog_config)
+
+for language in ["nl", "en", "de"]:
+    for category in get_category_index(language).values():
+        category_pages = paginate_listings(category["listings"], config.blog_page_size)
+        total_pages = len(category_pages)
+
+        for page_number, listings_on_page in enumerate(category_pages, start=1):
+            category_title = f"{category['name']} - VoorVoet Blog"
+            if page_number > 1:
+                category_title = f"{category_title} ({page_number}/{total_pages})"
+
+            category_config: dict[str, Any] = {
+                "component": make_blog_page(
+                    language, listings_on_page, page_number, total_pages, category
+                ),
+                "route": get_blog_category_route(
+                    language, category["slug"], page_number
+                ),
+                "title": category_title,
+                "meta": get_blog_category_meta_tags(
+                    language,
+                    category["name"],
+                    category["slug"],
+                    category["alternates"],
+                    page_number,
+                    total_pages,
+                    image_url=full_blog_image_url,
+                ),
+                "context": {
+                    "sitemap": {
+                        "changefreq": "weekly",
+                        "priority": 0.6 if page_number == 1 else 0.4,
+                    }
+                },
             }
-        },
-    }
 
-    if full_blog_image_url:
-        blog_config["image"] = full_blog_image_url
+            if full_blog_image_url:
+                category_config["image"] = full_blog_image_url
 
-    app.add_page(**blog_config)
+            app.add_page(**category_config)
+
+nl_listing_pages = paginate_listings(blog_listings.get("nl", []), config.blog_page_size)
 
 app.add_page(
-    component=lambda: _wrap_with_lang_script(
-        "nl", page_blog(language="nl", posts=blog_posts.get("nl", []))
-    ),
+    component=make_blog_page("nl", nl_listing_pages[0], 1, len(nl_listing_pages)),
     route="/blog",
     title=get_translation(PAGE_TITLES, "blog", "nl"),
     meta=get_page_meta_tags("blog", "nl", "/blog", image_url=full_blog_image_url),
@@ -194,55 +278,90 @@ app.add_page(
     },
 )
 
-for language, posts in blog_posts.items():
-    for post in posts:
-        slug = post["slug"]
-        title = post["title"]
 
-        blog_base = ROUTE_MAPPINGS[language]["blog"]
-        route = f"{blog_base}/{slug}"
+def make_blog_post_page(
+    lang: str, post_data: BlogPostDict, related: list[BlogListingDict]
+) -> Callable[[], rx.Component]:
+    def _page() -> rx.Component:
+        return wrap_with_lang_script(
+            lang,
+            page_blog_post(language=lang, post=post_data, related=related),
+        )
 
-        def make_blog_post_page(
-            lang: str, post_data: BlogPostDict
-        ) -> Callable[[], rx.Component]:
-            def _page() -> rx.Component:
-                return _wrap_with_lang_script(
-                    lang, page_blog_post(language=lang, post=post_data)
-                )
+    return _page
 
-            return _page
 
-        post_image = (
-            f"{config.site_url}{post['thumbnail_fallback']}"
-            if post.get("thumbnail_fallback")
-            else None
-        )
+def make_dynamic_blog_post_page(lang: str) -> Callable[[], rx.Component]:
+    def _page() -> rx.Component:
+        return wrap_with_lang_script(lang, page_blog_post_dynamic(language=lang))
+
+    return _page
+
 
-        post_config: dict[str, Any] = {
-            "component": make_blog_post_page(language, post),
-            "route": route,
-            "title": title,
-            "meta": get_blog_post_meta_tags(
-                post_title=post["title"],
-                post_summary=post["summary"],
-                language=language,
-                route=route,
-                story_number=post["story_number"],
-                all_blog_posts=blog_posts,
-                image_url=post_image,
+if config.blog_dynamic_routes:
+    for language, posts in blog_posts.items():
+        app.add_page(
+            component=make_dynamic_blog_post_page(language),
+            route=f"{ROUTE_MAPPINGS[language]['blog']}/[slug]",
+            title=f"{BlogPostState.title} - VoorVoet Blog",
+            meta=get_dynamic_blog_post_meta_tags(
+                language,
+                post_title=BlogPostState.title,
+                post_summary=BlogPostState.summary,
+                route=BlogPostState.route,
+                image_url=BlogPostState.image_url,
+                hreflang_links=BlogPostState.hreflang_links,
             ),
-            "context": {
-                "sitemap": {
-                    "changefreq": "monthly",
-                    "priority": 0.7,
-                }
-            },
-        }
+            on_load=BlogPostState.load_post(language),  # type: ignore[operator]
+        )
+
+        for post in posts:
+            add_sitemap_link(
+                f"{ROUTE_MAPPINGS[language]['blog']}/{post['slug']}",
+                {"changefreq": "monthly", "priority": 0.7},
+            )
+else:
+    for language, posts in blog_posts.items():
+        for post in posts:
+            slug = post["slug"]
+            title = post["title"]
+
+            blog_base = ROUTE_MAPPINGS[language]["blog"]
+            route = f"{blog_base}/{slug}"
+
+            post_image = (
+                f"{config.site_url}{post['thumbnail_fallback']}"
+                if post.get("thumbnail_fallback")
+                else None
+            )
+
+            post_config: dict[str, Any] = {
+                "component": make_blog_post_page(
+                    language, post, related_listings[language].get(slug, [])
+                ),
+                "route": route,
+                "title": title,
+                "meta": get_blog_post_meta_tags(
+                    post_title=post["title"],
+                    post_summary=post["summary"],
+                    language=language,
+                    route=route,
+                    story_number=post["story_number"],
+                    story_index=story_index,
+                    image_url=post_image,
+                ),
+                "context": {
+                    "sitemap": {
+                        "changefreq": "monthly",
+                        "priority": 0.7,
+                    }
+                },
+            }
 
-        if post_image:
-            post_config["image"] = post_image
+            if post_image:
+                post_config["image"] = post_image
 
-        app.add_page(**post_config)
+            app.add_page(**post_config)
 
 not_found_image = PAGE_IMAGES.get("not_found")
 full_not_found_image_url = (